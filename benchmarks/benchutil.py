@@ -0,0 +1,252 @@
+# benchutil.py
+
+"""
+Shared helpers for the benchmark scripts: statistics, memory sampling,
+environment metadata, and saving and comparing results.
+
+A results file is a JSON object with the keys:
+    benchmark   a str for the name of the benchmark script
+    environment a dict describing the machine and the versions (see environment())
+    summary     a dict of stage (or case) name to the statistics of its samples
+                (see summarize())
+    ...         any benchmark-specific raw data
+"""
+
+import os
+import sys
+import json
+import time
+import platform
+import subprocess
+import contextlib
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(REPO_DIR, "benchmarks", "results")
+BASELINES_DIR = os.path.join(REPO_DIR, "benchmarks", "baselines")
+PERCENTILES = (50, 90, 95, 99)
+
+if REPO_DIR not in sys.path:
+    sys.path.insert(0, REPO_DIR)  # The application modules are at the top level of the repo
+
+
+def percentile(values, q):
+    """
+    :param values: a sequence of numbers.
+    :param q: a number between 0 and 100.
+    :return: a float for the q-th percentile, interpolated linearly
+        between the closest ranks.
+    """
+    ordered = sorted(values)
+    if not ordered:
+        return float("nan")
+    pos = (len(ordered) - 1) * q / 100
+    lower = int(pos)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (pos - lower)
+
+
+def summarize(values):
+    """
+    :param values: a sequence of numbers (e.g., durations in ms).
+    :return: a dict with the keys n, mean, min, max and p50, p90, p95, p99.
+    """
+    summary = {"n": len(values),
+               "mean": sum(values) / len(values) if values else float("nan"),
+               "min": min(values) if values else float("nan"),
+               "max": max(values) if values else float("nan")}
+    for q in PERCENTILES:
+        summary["p{}".format(q)] = percentile(values, q)
+    return summary
+
+
+def residentMemory():
+    """
+    :return: a float for the resident set size of this process in MB: the
+        current size on Linux, the peak size on other platforms.
+    """
+    try:
+        with open("/proc/self/statm", "r") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except (OSError, ValueError, AttributeError):
+        return peakMemory()
+
+
+def peakMemory():
+    """Returns a float for the peak resident set size of this process in MB."""
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kB elsewhere
+    return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10
+
+
+def gitCommit():
+    """Returns a str for the current git commit of the repo, or None."""
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_DIR,
+                             capture_output=True, text=True, timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def environment():
+    """Returns a dict describing the machine, the versions and the time of the run."""
+    env = {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": gitCommit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+    try:
+        from PyQt6 import QtCore
+        env["qt"] = QtCore.QT_VERSION_STR
+        env["pyqt"] = QtCore.PYQT_VERSION_STR
+    except ImportError:
+        pass
+    return env
+
+
+def saveResults(results, path=None):
+    """
+    Writes results to a JSON file.
+
+    :param results: a dict of results (see the module docstring).
+    :param path: a str for the file path; if None, the file is written to
+        benchmarks/results/ and named after the benchmark and the time.
+    :return: a str for the path of the file.
+    """
+    if path is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        path = os.path.join(RESULTS_DIR, "{}-{}.json".format(
+            results["benchmark"], time.strftime("%Y%m%d-%H%M%S")))
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return path
+
+
+def loadResults(path):
+    """Returns the dict of results in a JSON file written by saveResults()."""
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def baselinePath(benchmark):
+    """Returns a str for the path of the stored baseline of a benchmark."""
+    return os.path.join(BASELINES_DIR, "{}.json".format(benchmark))
+
+
+def addComparisonArguments(parser, threshold=0.2):
+    """
+    Adds the options for saving and comparing results to an argument parser.
+
+    :param parser: an argparse.ArgumentParser object.
+    :param threshold: a float for the default allowed slowdown.
+    """
+    parser.add_argument("-o", "--output", default=None,
+                        help="results file (default: benchmarks/results/<benchmark>-<time>.json)")
+    parser.add_argument("-b", "--baseline", default=None,
+                        help="results file to compare with (default: the stored baseline, if any)")
+    parser.add_argument("-t", "--threshold", type=float, default=threshold,
+                        help="allowed slowdown against the baseline (default: {:.2f})".format(threshold))
+    parser.add_argument("--stat", default="p50", help="statistic to compare (default: p50)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="store the results as the baseline in benchmarks/baselines/")
+
+
+def finish(results, args, unit="ms"):
+    """
+    Prints and saves results, and compares them with the baseline.
+
+    :param results: a dict of results (see the module docstring).
+    :param args: an argparse.Namespace with the options of addComparisonArguments().
+    :param unit: a str for the unit of the statistics.
+    :return: an int for the exit status: 1 if a statistic regressed by more
+        than the threshold, 0 otherwise.
+    """
+    printSummary(results["summary"], unit=unit)
+    path = saveResults(results, args.output)
+    print("Saved results to {}".format(path))
+    if args.update_baseline:
+        os.makedirs(BASELINES_DIR, exist_ok=True)
+        print("Stored baseline {}".format(saveResults(results, baselinePath(results["benchmark"]))))
+        return 0
+    baseline = args.baseline
+    if baseline is None and os.path.exists(baselinePath(results["benchmark"])):
+        baseline = baselinePath(results["benchmark"])
+    if baseline is None:
+        print("No baseline to compare with: run with --update-baseline to store one")
+        return 0
+    print("Compared with {} ({}):".format(baseline, args.stat))
+    rows, regressions = compare(results["summary"], loadResults(baseline)["summary"],
+                                args.threshold, args.stat)
+    printComparison(rows, regressions, args.threshold)
+    return 1 if regressions else 0
+
+
+def createWindow():
+    """
+    Creates the application and its main window under the offscreen Qt
+    platform (unless QT_QPA_PLATFORM is set). The startup messages of the
+    window go to stderr.
+
+    :return: a tuple (QApplication, MainWindow).
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from PyQt6 import QtWidgets
+    import pcsetcalc_app
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(["pcsetcalc"])
+    with contextlib.redirect_stdout(sys.stderr):
+        window = pcsetcalc_app.MainWindow()
+    return app, window
+
+
+def compare(summary, baseline, threshold, stat="p50"):
+    """
+    Compares the statistics of a run with those of a baseline.
+
+    :param summary: a dict of name to statistics for the run.
+    :param baseline: a dict of name to statistics for the baseline.
+    :param threshold: a float for the allowed relative slowdown (e.g., 0.2
+        for 20%).
+    :param stat: a str for the statistic to compare (e.g., "p50").
+    :return: a list of tuples (name, baseline value, value, ratio), one per
+        name in both summaries, and a list of the names that regressed by
+        more than the threshold.
+    """
+    rows = []
+    regressions = []
+    for name, stats in summary.items():
+        if name not in baseline:
+            continue
+        base, value = baseline[name][stat], stats[stat]
+        ratio = value / base if base > 0 else float("inf") if value > 0 else 1.0
+        rows.append((name, base, value, ratio))
+        if ratio > 1 + threshold:
+            regressions.append(name)
+    return rows, regressions
+
+
+def printSummary(summary, unit="ms", file=sys.stdout):
+    """Prints a table of the statistics of each name in a summary."""
+    width = max([len(name) for name in summary] + [5])
+    header = "{:{w}}  {:>6}  {:>9}  {:>9}  {:>9}  {:>9}  {:>9}".format(
+        "stage", "n", "p50", "p90", "p99", "min", "max", w=width)
+    print(header + "  ({})".format(unit), file=file)
+    for name, s in summary.items():
+        print("{:{w}}  {:>6}  {:>9.3f}  {:>9.3f}  {:>9.3f}  {:>9.3f}  {:>9.3f}".format(
+            name, s["n"], s["p50"], s["p90"], s["p99"], s["min"], s["max"], w=width), file=file)
+
+
+def printComparison(rows, regressions, threshold, file=sys.stdout):
+    """Prints the result of compare()."""
+    for name, base, value, ratio in rows:
+        flag = "  REGRESSION" if name in regressions else ""
+        print("{}: {:.3f} -> {:.3f} ({:+.1f}%){}".format(
+            name, base, value, (ratio - 1) * 100, flag), file=file)
+    if regressions:
+        print("{} regression(s) over {:.0f}%: {}".format(
+            len(regressions), threshold * 100, ", ".join(regressions)), file=file)
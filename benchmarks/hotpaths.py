@@ -0,0 +1,177 @@
+# hotpaths.py
+
+"""
+Benchmark of the profile, query and display hot paths of the main window,
+run under the offscreen Qt platform. Every call is timed on its own, and
+the cases are:
+
+    updateProfile           the profile of each of the 4096 pcsets
+    createTargetSCMembers   the target SC members of a source set of each
+                            cardinality (1-11) for each target SC, with an
+                            empty cache (.cold) and a filled cache (.cached)
+    showTargetSCMenu        the target SC menu for a set of each set class
+    showMSCTables           the MSC tables for each nexus set
+    showCollectionPCs       the collection pc labels for a set of each set class
+    inputPC                 end-to-end pc input, including the repaint: the
+                            pcs are toggled in Gray code order, which walks
+                            through a different pcset at each step (all the
+                            4096 pcsets with --steps 4095)
+
+The durations are in microseconds. The results are saved as JSON (see
+benchutil.py) and compared with the stored baseline, if any; the exit
+status is 1 if a case is slower than the baseline by more than the
+threshold.
+
+Usage:
+    python benchmarks/hotpaths.py --update-baseline
+    python benchmarks/hotpaths.py --rounds 5 --threshold 0.3
+    python benchmarks/hotpaths.py --cases updateProfile inputPC
+"""
+
+import sys
+import time
+import argparse
+import benchutil
+
+CASES = ["updateProfile", "createTargetSCMembers", "showTargetSCMenu", "showMSCTables",
+         "showCollectionPCs", "inputPC"]
+GRAY_CODE_STEPS = 4095  # Steps to walk through all the pcsets
+
+
+def timeCall(func, *args):
+    """Returns a float for the duration of func(*args) in microseconds."""
+    start = time.perf_counter()
+    func(*args)
+    return (time.perf_counter() - start) * 1e6
+
+
+def setClassSets(window):
+    """Returns a list of lists of pcs for the prime forms of all the set classes (cardinalities 1-11)."""
+    return [window.profiles[mask]["pf"] for mask in range(1, 4095)
+            if window.profiles[mask]["nf"] == window.profiles[mask]["pf"]
+            and window.profiles[mask]["nf"][0] == 0]
+
+
+def setProfile(window, pcs):
+    """Sets the current set and its profile, without updating the display."""
+    from pcsetcalc_engine import PcMask
+    window.pcset = PcMask(pcs)
+    window.updateProfile()
+
+
+def benchUpdateProfile(app, window, rounds):
+    from pcsetcalc_engine import PcMask
+    samples = []
+    for _ in range(rounds):
+        for mask in range(4096):
+            window.pcset = PcMask.fromMask(mask)
+            samples.append(timeCall(window.updateProfile))
+    return {"updateProfile": samples}
+
+
+def benchCreateTargetSCMembers(app, window, rounds):
+    from pcsetcalc_engine import InclusionIndex
+    from PyQt6 import QtCore
+    menu = window.ui.comboBoxTargetSCs
+    model = menu.model()
+    cold, cached = [], []
+    for _ in range(rounds):
+        window.inclusionIndex = InclusionIndex(window.profiles)
+        for samples in [cold, cached]:
+            for card in range(1, 12):
+                window.updatePCSet(list(range(card)), archive=False)
+                for i in range(menu.count()):
+                    if model.flags(model.index(i, 0)) & QtCore.Qt.ItemFlag.ItemIsEnabled:
+                        menu.setCurrentIndex(i)
+                        samples.append(timeCall(window.createTargetSCMembers))
+    return {"createTargetSCMembers.cold": cold, "createTargetSCMembers.cached": cached}
+
+
+def benchShowTargetSCMenu(app, window, rounds):
+    samples = []
+    for _ in range(rounds):
+        for pcs in setClassSets(window):
+            # Update the profile only, so the menu changes from the previous set class
+            setProfile(window, pcs)
+            samples.append(timeCall(window.showTargetSCMenu))
+    return {"showTargetSCMenu": samples}
+
+
+def benchShowMSCTables(app, window, rounds):
+    menu = window.ui.comboBoxNexus
+    samples = []
+    for _ in range(rounds * 10):
+        for i in range(menu.count()):
+            menu.setCurrentIndex(i)
+            samples.append(timeCall(window.showMSCTables))
+    return {"showMSCTables": samples}
+
+
+def benchShowCollectionPCs(app, window, rounds):
+    samples = []
+    for _ in range(rounds):
+        for pcs in setClassSets(window):
+            setProfile(window, pcs)
+            samples.append(timeCall(window.showCollectionPCs))
+    return {"showCollectionPCs": samples}
+
+
+def benchInputPC(app, window, rounds, steps):
+    window.show()
+    app.processEvents()
+    samples = []
+    for _ in range(rounds):
+        window.resetPCSet()
+        app.processEvents()
+        mask = 0
+        for i in range(1, steps + 1):
+            pc = (i & -i).bit_length() - 1  # The bit that changes in the Gray code
+            mask ^= 1 << pc
+            start = time.perf_counter()
+            window.midiInput(pc, bool(mask >> pc & 1))
+            app.processEvents()
+            samples.append((time.perf_counter() - start) * 1e6)
+    window.hide()
+    return {"inputPC": samples}
+
+
+BENCHMARKS = {
+    "updateProfile": benchUpdateProfile,
+    "createTargetSCMembers": benchCreateTargetSCMembers,
+    "showTargetSCMenu": benchShowTargetSCMenu,
+    "showMSCTables": benchShowMSCTables,
+    "showCollectionPCs": benchShowCollectionPCs,
+}
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the profile, query and display hot paths.")
+    parser.add_argument("-n", "--rounds", type=int, default=3, help="number of rounds per case (default: 3)")
+    parser.add_argument("-s", "--steps", type=int, default=1023,
+                        help="number of pc inputs per round of inputPC, up to 4095 (default: 1023)")
+    parser.add_argument("-c", "--cases", nargs="+", choices=CASES, default=CASES,
+                        help="cases to run (default: all)")
+    benchutil.addComparisonArguments(parser, threshold=0.3)
+    args = parser.parse_args(argv)
+    args.steps = max(1, min(args.steps, GRAY_CODE_STEPS))
+    app, window = benchutil.createWindow()
+    samples = {}
+    try:
+        for case in args.cases:
+            start = time.perf_counter()
+            if case == "inputPC":
+                samples.update(benchInputPC(app, window, args.rounds, args.steps))
+            else:
+                samples.update(BENCHMARKS[case](app, window, args.rounds))
+            print("{}: {:.1f} s".format(case, time.perf_counter() - start), file=sys.stderr)
+    finally:
+        window.closeServerSocket()
+    results = {"benchmark": "hotpaths", "environment": benchutil.environment(),
+               "rounds": args.rounds, "steps": args.steps,
+               "summary": {name: benchutil.summarize(values) for name, values in samples.items()}}
+    return benchutil.finish(results, args, unit="us")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
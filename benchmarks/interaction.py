@@ -0,0 +1,211 @@
+# interaction.py
+
+"""
+Benchmark of scripted user interaction with the main window under the
+offscreen Qt platform. A seeded random script drives the slots that the
+widgets are connected to, and each action is timed until the event loop
+is idle again, i.e., including the coalesced pc updates and the repaint.
+The actions are:
+
+    togglePC        togglePCBtn() on a random pc
+    applyTn         a random Tn level in the Tn menu, transpose() and applyTn()
+    applyTnI        a random TnI level in the TnI menu, invert() and applyTnI()
+    browseTargetSC  a random enabled target SC in the menu, and
+                    createTargetSCMembers()
+    changeNexus     a random nexus set in the MSC menu, and showMSCTables()
+    undoBurst       undo() 5 times in a row
+    redoBurst       redo() 5 times in a row, only right after an undoBurst
+                    (any other action clears the redo stack)
+
+The results are the event-loop time per action (ms), the paint events
+(of any widget) and frames (repaints of the window) per action, and the
+resident memory: at the start and the end of the script, the highest after
+an action of each kind, and the peak of the process.
+
+Usage:
+    python benchmarks/interaction.py --update-baseline
+    python benchmarks/interaction.py --steps 2000 --seed 7
+    python benchmarks/interaction.py --actions togglePC undoBurst redoBurst
+"""
+
+import sys
+import time
+import random
+import argparse
+import benchutil
+
+ACTIONS = {  # key=action, val=relative frequency in the script
+    "togglePC": 8,
+    "applyTn": 1,
+    "applyTnI": 1,
+    "browseTargetSC": 2,
+    "changeNexus": 1,
+    "undoBurst": 1,
+    "redoBurst": 8,  # Among the actions after an undoBurst
+}
+FOLLOWS = {"redoBurst": "undoBurst"}  # key=action, val=action it is only chosen after
+UNDO_BURST = 5  # Calls per undo/redo burst
+
+
+def togglePC(window, rnd):
+    window.togglePCBtn(rnd.randrange(12))
+
+
+def applyTn(window, rnd):
+    window.ui.comboBoxTn.setCurrentIndex(rnd.randrange(1, 12))
+    window.transpose()
+    window.applyTn()
+
+
+def applyTnI(window, rnd):
+    window.ui.comboBoxTnI.setCurrentIndex(rnd.randrange(1, 13))
+    window.invert()
+    window.applyTnI()
+
+
+def browseTargetSC(window, rnd):
+    from PyQt6 import QtCore
+    menu = window.ui.comboBoxTargetSCs
+    model = menu.model()
+    rows = [i for i in range(menu.count())
+            if model.flags(model.index(i, 0)) & QtCore.Qt.ItemFlag.ItemIsEnabled]
+    menu.setCurrentIndex(rnd.choice(rows))
+    window.createTargetSCMembers()
+
+
+def changeNexus(window, rnd):
+    menu = window.ui.comboBoxNexus
+    menu.setCurrentIndex(rnd.randrange(menu.count()))
+    window.showMSCTables()
+
+
+def undoBurst(window, rnd):
+    for _ in range(UNDO_BURST):
+        window.undo()
+
+
+def redoBurst(window, rnd):
+    for _ in range(UNDO_BURST):
+        window.redo()
+
+
+SCRIPT_ACTIONS = {
+    "togglePC": togglePC,
+    "applyTn": applyTn,
+    "applyTnI": applyTnI,
+    "browseTargetSC": browseTargetSC,
+    "changeNexus": changeNexus,
+    "undoBurst": undoBurst,
+    "redoBurst": redoBurst,
+}
+
+
+def makeEventCounter(window):
+    """
+    Returns an event filter object counting the events of the application
+    (events), the paint events of any widget (paints) and the repaints of
+    the window (frames). It is installed on the application.
+    """
+    from PyQt6 import QtCore, QtWidgets
+
+    class EventCounter(QtCore.QObject):
+        def __init__(self):
+            QtCore.QObject.__init__(self)
+            self.events = self.paints = self.frames = 0
+
+        def eventFilter(self, obj, event):
+            self.events += 1
+            kind = event.type()
+            if kind == QtCore.QEvent.Type.Paint:
+                self.paints += 1
+            elif kind == QtCore.QEvent.Type.UpdateRequest and obj is window:
+                self.frames += 1
+            return False
+
+    counter = EventCounter()
+    QtWidgets.QApplication.instance().installEventFilter(counter)
+    return counter
+
+
+def settle(app, counter):
+    """Processes events until a pass of the event loop delivers no event."""
+    while True:
+        events = counter.events
+        app.processEvents()
+        if counter.events == events:
+            return
+
+
+def runScript(app, window, actions, steps, warmup, seed):
+    """
+    Runs the script of random actions.
+
+    :return: a tuple of dicts of action to a list of the samples: the
+        times (ms), the paint events and the frames; and a dict of the
+        resident memory (MB).
+    """
+    rnd = random.Random(seed)
+    counter = makeEventCounter(window)
+    window.show()
+    settle(app, counter)
+    names = list(actions)
+    times = {name: [] for name in names}
+    paints = {name: [] for name in names}
+    frames = {name: [] for name in names}
+    memory = {"start": benchutil.residentMemory(), "byAction": {}}
+    name = None
+    for step in range(warmup + steps):
+        candidates = [n for n in names if FOLLOWS.get(n, name) == name]
+        name = rnd.choices(candidates, [ACTIONS[n] for n in candidates])[0]
+        paintCount, frameCount = counter.paints, counter.frames
+        start = time.perf_counter()
+        SCRIPT_ACTIONS[name](window, rnd)
+        settle(app, counter)
+        elapsed = (time.perf_counter() - start) * 1000
+        if step < warmup:
+            continue
+        times[name].append(elapsed)
+        paints[name].append(counter.paints - paintCount)
+        frames[name].append(counter.frames - frameCount)
+        rss = benchutil.residentMemory()
+        memory["byAction"][name] = max(rss, memory["byAction"].get(name, 0.0))
+    memory["end"] = benchutil.residentMemory()
+    memory["peak"] = max([benchutil.peakMemory(), memory["end"]] + list(memory["byAction"].values()))
+    window.hide()
+    return times, paints, frames, memory
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark scripted interaction with the main window.")
+    parser.add_argument("-n", "--steps", type=int, default=600, help="number of measured actions (default: 600)")
+    parser.add_argument("--warmup", type=int, default=50, help="number of discarded actions (default: 50)")
+    parser.add_argument("--seed", type=int, default=1, help="seed of the random script (default: 1)")
+    parser.add_argument("-a", "--actions", nargs="+", choices=list(ACTIONS), default=list(ACTIONS),
+                        help="actions in the script (default: all)")
+    benchutil.addComparisonArguments(parser, threshold=0.3)
+    args = parser.parse_args(argv)
+    for name in args.actions:
+        if FOLLOWS.get(name, name) not in args.actions:
+            parser.error("{} needs {} in the actions".format(name, FOLLOWS[name]))
+    app, window = benchutil.createWindow()
+    try:
+        times, paints, frames, memory = runScript(app, window, args.actions, args.steps,
+                                                  args.warmup, args.seed)
+    finally:
+        window.closeServerSocket()
+    summary = {name: benchutil.summarize(values) for name, values in times.items() if values}
+    paintSummary = {name: benchutil.summarize(values) for name, values in paints.items() if values}
+    frameSummary = {name: benchutil.summarize(values) for name, values in frames.items() if values}
+    results = {"benchmark": "interaction", "environment": benchutil.environment(),
+               "steps": args.steps, "warmup": args.warmup, "seed": args.seed,
+               "summary": summary, "paints": paintSummary, "frames": frameSummary,
+               "memory": memory}
+    benchutil.printSummary(paintSummary, unit="paint events")
+    print("RSS: {:.1f} MB at the start, {:.1f} MB at the end, {:.1f} MB peak".format(
+        memory["start"], memory["end"], memory["peak"]))
+    return benchutil.finish(results, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
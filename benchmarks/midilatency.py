@@ -0,0 +1,79 @@
+# midilatency.py
+
+"""
+MIDI-to-display latency benchmark, without MIDI hardware: the MIDI input
+of the main window is replaced by a synthetic source (see
+pcsetcalc_midi.SyntheticMIDIIn), and the note messages are traced from
+the input buffer to the repaint of the window under the offscreen Qt
+platform (see pcsetcalc_trace.LatencyTracer).
+
+The stages are latency.buffer (the time in the input buffer until the
+poll, which is 0 in the callback mode), latency.dispatch (from the poll or
+the callback to MainWindow across the threads),
+latency.update (the profile and display update), latency.paint (to the
+end of the repaint) and latency.total, in ms. The results include the
+histogram of latency.total.
+
+Usage:
+    python benchmarks/midilatency.py --seconds 30 --rate 40
+    python benchmarks/midilatency.py --update-baseline
+    python benchmarks/midilatency.py --mode poll
+"""
+
+import os
+import sys
+import argparse
+import benchutil
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the MIDI-to-display latency.")
+    parser.add_argument("-s", "--seconds", type=float, default=10.0,
+                        help="duration of the measurement (default: 10)")
+    parser.add_argument("-r", "--rate", type=float, default=20.0,
+                        help="note messages per second of the synthetic source (default: 20)")
+    parser.add_argument("-m", "--mode", choices=["callback", "poll"], default="callback",
+                        help="MIDI input mode (default: callback)")
+    benchutil.addComparisonArguments(parser, threshold=0.3)
+    args = parser.parse_args(argv)
+    from PyQt6 import QtCore
+    from pcsetcalc_trace import LATENCY_STAGES
+    app, window = benchutil.createWindow()
+    # Replace MIDI input with the synthetic source
+    worker = window.threadMIDI
+    worker.syntheticRate = args.rate
+    worker.mode = args.mode
+    worker.openInput()
+    window.latencyTracer.setEnabled(True)
+    window.show()
+    worker.start()
+    QtCore.QTimer.singleShot(int(args.seconds * 1000), app.quit)
+    app.exec()
+    report = window.latencyTracer.report()
+    scheduler = window.updateScheduler
+    window.closeServerSocket()
+    worker.stop()
+    if not report["count"]:
+        print("No message was traced", file=sys.stderr)
+        return 1
+    summary = {stage: benchutil.summarize([d / 1e6 for d in window.stageTimer.durations[stage]])
+               for stage in LATENCY_STAGES}
+    results = {"benchmark": "midilatency", "environment": benchutil.environment(),
+               "seconds": args.seconds, "rate": args.rate, "mode": args.mode, "summary": summary,
+               "histogram": report["histogram"],
+               "updates": {"inputs": scheduler.inputs, "updates": scheduler.updates,
+                           "coalesced": scheduler.coalesced()}}
+    print("{} messages traced, {} pc inputs in {} updates".format(
+        report["count"], scheduler.inputs, scheduler.updates))
+    for bucket in report["histogram"]:
+        label = "<= {} ms".format(bucket["le"]) if bucket["le"] is not None else "> {} ms".format(
+            report["histogram"][-2]["le"])
+        print("{:>10}  {:6}".format(label, bucket["count"]))
+    return benchutil.finish(results, args)
+
+
+if __name__ == "__main__":
+    code = main()
+    sys.stdout.flush()
+    os._exit(code)  # The MIDI worker thread would keep the process alive
@@ -0,0 +1,208 @@
+# startup.py
+
+"""
+Startup benchmark: wall time, resident memory and import time of each
+startup stage of the application, over repeated runs.
+
+Every run is a fresh Python process under the offscreen Qt platform, so
+imports and resource registration are measured cold (apart from the OS
+file cache; the first run is discarded as a warm-up by default). The
+stages are:
+
+    import.*    imports of PyQt6, pcpy, rtmidi, oscpy, the Qt resources
+                (pcsetcalc_resources_rc registers them on import) and the
+                application modules
+    qapplication            QApplication construction
+    ui.*                    Ui_MainWindow.setupUi() and each setup*() call
+    catalog.load            loading the catalog and the profile table
+    workers.*               worker and dialog construction, and opening
+                            MIDI input and the OSC server
+    ui.resetTargetSCMenu    filling the target SC menu
+    window.init             MainWindow() as a whole
+    firstPaint              show() to the first paint event
+    total                   process start to the first paint event
+
+The results are saved as JSON (see benchutil.py), and can be compared
+with the results of a previous release.
+
+Usage:
+    python benchmarks/startup.py --runs 20
+    python benchmarks/startup.py --update-baseline
+    python benchmarks/startup.py --baseline benchmarks/results/startup-old.json --threshold 0.25
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+from contextlib import contextmanager
+
+START_TIME = time.perf_counter()
+
+import benchutil  # noqa: E402 (imported after START_TIME to include it in total)
+
+FIRST_PAINT_TIMEOUT = 10.0  # Seconds to wait for the first paint event
+
+
+def runChild():
+    """
+    Measures the startup stages once in this process, and writes them to
+    stdout as JSON. Output of the application goes to stderr.
+    """
+    out = sys.stdout
+    sys.stdout = sys.stderr
+    stages = {}  # key=stage, val=time (ms)
+    memory = {}  # key=stage, val=RSS after the stage (MB)
+    errors = {}  # key=stage, val=error message
+
+    def record(stage, start):
+        stages[stage] = stages.get(stage, 0.0) + (time.perf_counter() - start) * 1000
+        memory[stage] = benchutil.residentMemory()
+
+    @contextmanager
+    def timed(stage):
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            errors[stage] = "{}: {}".format(type(e).__name__, e)
+        finally:
+            record(stage, start)
+
+    def timeCalls(owner, name, stage):
+        """Replaces owner.name with a wrapper that records the time of each call."""
+        original = getattr(owner, name)
+
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return original(*args, **kwargs)
+            finally:
+                record(stage, start)
+
+        setattr(owner, name, wrapper)
+
+    memory["start"] = benchutil.residentMemory()
+    with timed("import.PyQt6"):
+        from PyQt6 import QtCore, QtGui, QtWidgets  # noqa: F401
+    with timed("import.pcpy"):
+        import pcpy.constants  # noqa: F401
+        import pcpy.pcset  # noqa: F401
+    with timed("import.rtmidi"):
+        import rtmidi  # noqa: F401
+    with timed("import.oscpy"):
+        import oscpy.server  # noqa: F401
+    with timed("import.resources"):
+        import pcsetcalc_resources_rc  # noqa: F401
+    with timed("import.app"):
+        import pcsetcalc_app
+    if errors:
+        json.dump({"stages": stages, "memory": memory, "errors": errors}, out)
+        return 1
+    with timed("qapplication"):
+        app = QtWidgets.QApplication(["pcsetcalc"])
+    # Time the startup stages inside MainWindow()
+    timeCalls(pcsetcalc_app.Ui_MainWindow, "setupUi", "ui.setupUi")
+    for name in ["setupIndexVectorTable", "setupModalComplementTable",
+                 "setupTargetSCMemberTable", "setupTargetSCMenu", "setupModalSetComplexTables",
+                 "resetTargetSCMenu"]:
+        timeCalls(pcsetcalc_app.MainWindow, name, "ui." + name)
+    timeCalls(pcsetcalc_app, "defaultCatalog", "catalog.load")
+    timeCalls(pcsetcalc_app, "defaultProfileTable", "catalog.load")
+    for name in ["WorkerMIDI", "WorkerOSC", "ConnectionDialog"]:
+        timeCalls(getattr(pcsetcalc_app, name), "__init__", "workers." + name)
+    timeCalls(pcsetcalc_app.MainWindow, "openInputs", "workers.openInputs")
+    window = None
+    with timed("window.init"):
+        window = pcsetcalc_app.MainWindow()
+    if window is None:
+        json.dump({"stages": stages, "memory": memory, "errors": errors}, out)
+        return 1
+    # First paint of any widget of the window
+    painted = []
+
+    class PaintProbe(QtCore.QObject):
+        def eventFilter(self, obj, event):
+            if not painted and event.type() == QtCore.QEvent.Type.Paint:
+                painted.append(time.perf_counter())
+            return False
+
+    probe = PaintProbe()
+    app.installEventFilter(probe)
+    start = time.perf_counter()
+    window.show()
+    while not painted and time.perf_counter() - start < FIRST_PAINT_TIMEOUT:
+        app.processEvents()
+    if painted:
+        stages["firstPaint"] = (painted[0] - start) * 1000
+        stages["total"] = (painted[0] - START_TIME) * 1000
+        memory["firstPaint"] = memory["total"] = benchutil.residentMemory()
+    else:
+        errors["firstPaint"] = "No paint event in {} s".format(FIRST_PAINT_TIMEOUT)
+    window.closeServerSocket()
+    json.dump({"stages": stages, "memory": memory, "errors": errors,
+               "appStartupTimes": {name: t * 1000 for name, t in window.startupTimes.items()}}, out)
+    return 1 if errors else 0
+
+
+def runOnce(verbose=False):
+    """
+    Runs the startup stages in a child process.
+
+    :return: a dict with the keys stages, memory, errors (and
+        appStartupTimes), or None if the child process failed without output.
+    """
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), "--child"],
+                          env=env, cwd=benchutil.REPO_DIR, capture_output=True, text=True)
+    if verbose:
+        sys.stderr.write(proc.stderr)
+    try:
+        return json.loads(proc.stdout)
+    except json.JSONDecodeError:
+        sys.stderr.write(proc.stderr[-2000:])
+        return None
+
+
+def main(argv=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark the startup stages of the application.")
+    parser.add_argument("-n", "--runs", type=int, default=10, help="number of measured runs (default: 10)")
+    parser.add_argument("--warmup", type=int, default=1, help="number of discarded runs (default: 1)")
+    benchutil.addComparisonArguments(parser)
+    parser.add_argument("-v", "--verbose", action="store_true", help="show the output of the runs")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.runs < 1:
+        parser.error("--runs must be at least 1")
+    if args.warmup < 0:
+        parser.error("--warmup must not be negative")
+    if args.child:
+        code = runChild()
+        sys.stdout.flush()
+        sys.__stdout__.flush()
+        os._exit(code)  # The MIDI worker thread would keep the process alive
+    runs = []
+    for i in range(args.warmup + args.runs):
+        run = runOnce(args.verbose)
+        if run is None or run["errors"]:
+            print("Run {} failed: {}".format(i + 1, run["errors"] if run else "no output"), file=sys.stderr)
+            return 1
+        if i >= args.warmup:
+            runs.append(run)
+    stageNames = list(runs[0]["stages"])
+    summary = {name: benchutil.summarize([run["stages"][name] for run in runs])
+               for name in stageNames}
+    memory = {name: benchutil.summarize([run["memory"][name] for run in runs])
+              for name in stageNames}
+    results = {"benchmark": "startup", "environment": benchutil.environment(),
+               "summary": summary, "memory": memory, "runs": runs}
+    print("RSS after the first paint: {:.1f} MB (p50)".format(memory["total"]["p50"]))
+    return benchutil.finish(results, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,277 @@
+# pcsetcalc_analyze.py
+
+"""
+Offline analysis of a corpus of Standard MIDI Files.
+
+Each file is segmented into the pcsets sounding between its MIDI events
+with the same note-on/off and sustain rules as the live MIDI input, each
+channel tracked on its own (see pcsetcalc_midi.MIDIMerger): a segment is recorded whenever the sounding
+set changes after the events at a tick. The segments are aggregated into
+histograms of set classes, modal attributes and Z-related set classes
+across the corpus, with the files spread over a process pool.
+
+With --state, the result of every analyzed file is appended to a JSONL
+file, and a rerun with the same state file skips the files already in it,
+so an interrupted run can be resumed. The first line of the state file
+records the analysis parameters (the channels), and a run with different
+parameters refuses to resume from it.
+
+Usage:
+    python pcsetcalc_analyze.py corpus/ -o histograms.json --state run.jsonl
+    python pcsetcalc_analyze.py a.mid b.mid --channels 1
+    python pcsetcalc_app.py analyze corpus/ --state run.jsonl
+"""
+
+import sys
+import os
+import json
+import time
+import argparse
+import itertools
+import multiprocessing
+from collections import Counter
+from pcsetcalc_catalog import toPFStr
+from pcsetcalc_engine import defaultProfileTable
+from pcsetcalc_midi import MIDIMerger, SMFError, readSMF
+
+MIDI_FILE_EXTENSIONS = (".mid", ".midi", ".smf")
+HISTOGRAMS = ["sc", "matts", "z"]
+
+
+def segmentSMF(path, channels=None):
+    """
+    Segments a Standard MIDI File into sounding pcsets.
+
+    The file is processed as a single input port: the notes and the
+    sustain pedal of each channel are tracked on their own, and a pc
+    sounds as long as any of the selected channels holds it.
+
+    :param path: a str for the file path.
+    :param channels: a set of ints (1-16) for the channels to analyze, or
+        None for all the channels.
+    :return: a list of ints for the bitmasks of the non-empty sounding
+        sets, one per change of the sounding set.
+    :raise SMFError: if the file is not a valid Standard MIDI File.
+    """
+    merger = MIDIMerger()
+    if channels is not None:
+        merger.setChannels(0, channels)
+    segments = []
+    last = 0
+    for tick, events in itertools.groupby(readSMF(path), key=lambda event: event[0]):
+        merger.processMessages((0, msg) for _, msg in events)
+        mask = merger.mask
+        if mask != last:
+            if mask:
+                segments.append(mask)
+            last = mask
+    return segments
+
+
+def analyzeFile(path, channels=None):
+    """
+    Computes the histograms of a Standard MIDI File.
+
+    :param path: a str for the file path.
+    :param channels: a set of ints (1-16) for the channels to analyze, or
+        None for all the channels.
+    :return: a dict with the keys "file", "segments" (the number of
+        segments), "sc", "matts" and "z" (dicts of counts by set class
+        name, modal attribute and Z-related set class name), or the keys
+        "file" and "error" if the file cannot be read.
+    """
+    try:
+        segments = segmentSMF(path, channels)
+    except (SMFError, OSError) as e:
+        return {"file": path, "error": str(e)}
+    profiles = defaultProfileTable().profiles
+    sc, matts, z = Counter(), Counter(), Counter()
+    for mask in segments:
+        profile = profiles[mask]
+        # Set classes without a Forte name (cardinalities 1, 2, 10-12) are named by prime form
+        name = profile["sn"] or toPFStr(profile["pf"])
+        sc[name] += 1
+        matts.update(profile["matts"])
+        if profile["zcorr"]:
+            z[name] += 1
+    return {"file": path, "segments": len(segments),
+            "sc": dict(sc), "matts": dict(matts), "z": dict(z)}
+
+
+def _analyzeTask(task):
+    """Worker process task for analyzeFile()."""
+    return analyzeFile(*task)
+
+
+def findMIDIFiles(paths):
+    """
+    :param paths: a list of strs for file and directory paths.
+    :return: a sorted list of strs for the files and the MIDI files in the
+        directories (recursively).
+    """
+    files = set()
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                files.update(os.path.join(root, name) for name in names
+                             if name.lower().endswith(MIDI_FILE_EXTENSIONS))
+        else:
+            files.add(path)
+    return sorted(files)
+
+
+def stateParams(channels=None):
+    """
+    :param channels: a set of ints (1-16) for the channels to analyze, or
+        None for all the channels.
+    :return: a dict of the analysis parameters recorded in a state file.
+    """
+    return {"channels": sorted(channels) if channels is not None else None}
+
+
+def loadState(path):
+    """
+    :param path: a str for the state file path.
+    :return: a tuple of the dict of the analysis parameters in the state
+        file (None if not recorded) and a dict of the file results in the
+        state file by file path (both empty if the file does not exist).
+    """
+    params, results = None, {}
+    if not os.path.exists(path):
+        return params, results
+    with open(path, "r") as f:
+        for line in f:
+            try:
+                result = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # Line cut off by an interrupted run
+            if "params" in result:
+                params = result["params"]
+            else:
+                results[result["file"]] = result
+    return params, results
+
+
+def aggregate(results):
+    """
+    :param results: an iterable of dicts returned by analyzeFile().
+    :return: a dict of the corpus histograms, with the counts in descending order.
+    """
+    totals = {name: Counter() for name in HISTOGRAMS}
+    files, errors, segments = 0, 0, 0
+    for result in results:
+        files += 1
+        if "error" in result:
+            errors += 1
+            continue
+        segments += result["segments"]
+        for name in HISTOGRAMS:
+            totals[name].update(result[name])
+    summary = {"files": files, "errors": errors, "segments": segments}
+    for name in HISTOGRAMS:
+        summary[name] = dict(totals[name].most_common())
+    return summary
+
+
+def run(paths, channels=None, workers=None, statePath=None, report=sys.stderr):
+    """
+    Analyzes a corpus of Standard MIDI Files.
+
+    :param paths: a list of strs for file and directory paths.
+    :param channels: a set of ints (1-16) for the channels to analyze, or
+        None for all the channels.
+    :param workers: an int for the number of worker processes: the number
+        of CPUs if None, and no process pool if 1.
+    :param statePath: a str for the state file path to record and resume
+        the run, or None.
+    :param report: a text file object for progress reports, or None.
+    :return: a dict of the corpus histograms (see aggregate()).
+    :raise ValueError: if the state file was recorded with other analysis
+        parameters.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    files = findMIDIFiles(paths)
+    params = stateParams(channels)
+    savedParams, results = loadState(statePath) if statePath else (None, {})
+    if (savedParams is not None and savedParams != params) or (savedParams is None and results):
+        raise ValueError("state file {} was recorded with other analysis parameters ({}); "
+                         "use another state file to analyze with {}".format(statePath, savedParams, params))
+    todo = [path for path in files if path not in results]
+    if report is not None and results:
+        print("Resuming: {} of {} files already analyzed".format(len(files) - len(todo), len(files)),
+              file=report)
+    # Load the profile table before forking so that the workers share it
+    defaultProfileTable()
+    state = open(statePath, "a") if statePath else None
+    if state is not None and state.tell() > 0:
+        with open(statePath, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                state.write("\n")  # End a line cut off by an interrupted run
+    if state is not None and savedParams is None:
+        state.write(json.dumps({"params": params}, separators=(",", ":")) + "\n")
+        state.flush()
+    start = time.perf_counter()
+    pool = None
+    try:
+        tasks = [(path, channels) for path in todo]
+        if workers == 1:
+            done = map(_analyzeTask, tasks)
+        else:
+            pool = multiprocessing.Pool(workers)
+            done = pool.imap_unordered(_analyzeTask, tasks, chunksize=4)
+        for i, result in enumerate(done, 1):
+            results[result["file"]] = result
+            if state is not None:
+                state.write(json.dumps(result, separators=(",", ":")) + "\n")
+                state.flush()
+            if report is not None:
+                if "error" in result:
+                    print("{}: {}".format(result["file"], result["error"]), file=report)
+                if i % 100 == 0 or i == len(todo):
+                    elapsed = time.perf_counter() - start
+                    print("{}/{} files ({:.1f} files/s)".format(i, len(todo), i / elapsed),
+                          file=report)
+        if pool is not None:
+            pool.close()
+            pool.join()
+    finally:
+        if pool is not None:
+            pool.terminate()  # Stops the workers if the run is interrupted
+        if state is not None:
+            state.close()
+    return aggregate(results[path] for path in files if path in results)
+
+
+def main(argv=None, prog=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(prog=prog,
+                                     description="Histograms of the pcsets of Standard MIDI Files.")
+    parser.add_argument("paths", nargs="+", help="MIDI files or directories")
+    parser.add_argument("-o", "--output", default="-", help="output JSON file, or - for stdout (default)")
+    parser.add_argument("-c", "--channels", type=int, nargs="+", default=None,
+                        help="MIDI channels (1-16) to analyze (default: all)")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="number of worker processes (default: number of CPUs)")
+    parser.add_argument("-s", "--state", default=None,
+                        help="JSONL file to record the file results in and resume from")
+    parser.add_argument("-q", "--quiet", action="store_true", help="do not report progress")
+    args = parser.parse_args(argv)
+    try:
+        summary = run(args.paths, channels=set(args.channels) if args.channels else None,
+                      workers=args.workers, statePath=args.state,
+                      report=None if args.quiet else sys.stderr)
+    except ValueError as e:
+        parser.error(str(e))
+    text = json.dumps(summary, indent=2)
+    if args.output == "-":
+        print(text)
+    else:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
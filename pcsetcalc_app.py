@@ -4,36 +4,69 @@ import sys
 import os
 import json
 import time
-from typing import List, Dict
-from PyQt6 import QtCore, QtWidgets
-import rtmidi
-from oscpy.server import OSCThreadServer
-from pcpy.pcset import Pcset
-from pcpy.query import toPFStr, fromPFStr, catalog
-import pcpy.constants as c
-from pcsetcalc_main_ui import Ui_MainWindow
-from pcsetcalc_connection_ui import Ui_ConnectionDialog
+import threading
+# Reference time for the startup phase timings: taken before the imports
+# below so that the "imports" phase includes them (hence the noqa: E402)
+START_TIME = time.perf_counter()
+from typing import Dict  # noqa: E402
+from PyQt6 import QtCore, QtGui, QtWidgets  # noqa: E402
+import pcpy.constants as c  # noqa: E402
+from pcsetcalc_catalog import toPFStr, defaultCatalog  # noqa: E402
+from pcsetcalc_engine import (PcMask, ProfileState, InclusionIndex, toMask,  # noqa: E402
+                              defaultProfileTable)
+from pcsetcalc_models import (TargetSCMemberModel, TargetSCMenuModel, IndexVectorModel,  # noqa: E402
+                               ModalComplementModel, MSCMemberModel)
+from pcsetcalc_midi import MIDIMerger, SyntheticMIDIIn  # noqa: E402
+from pcsetcalc_trace import StageTimer, LatencyTracer  # noqa: E402
+from pcsetcalc_main_ui import Ui_MainWindow  # noqa: E402
+from pcsetcalc_connection_ui import Ui_ConnectionDialog  # noqa: E402
+from pcsetcalc_stagetimings_ui import Ui_StageTimingsDialog  # noqa: E402
 
 # TODO: constancts here
-STATUS_BYTE_NOTE_ON = 144  # MIDI channel 1
-STATUS_BYTE_CONTROL_CHANGE = 176  # MIDI channel 1
-CC_SUSTAIN = 11  # MIDI CC to use for sustain pedal (11 = expression controller)
-SUSTAIN_THRESH = 110  # Threshold for sustain pedal (ON if less than thresh)
-
 SERVER_ADDRESS = "127.0.0.1"
 OSC_ADDRESS = b"/noteData"
 MIDI_MESSAGE_POLL_INTERVAL = 10  # Polling interval for MIDI messages (ms)
+MIDI_INPUT_MODES = ["callback", "poll"]  # MIDI input modes of WorkerMIDI
+STAGE_TIMINGS_REFRESH_INTERVAL = 500  # Refresh interval of the stage timings panel (ms)
 
 
 class MainWindow(QtWidgets.QMainWindow):
     """Main application window"""
     def __init__(self, parent=None):
         QtWidgets.QMainWindow.__init__(self, parent)
+        self.startupTimes = {}  # key=startup phase, val=time spent (s)
+        self.recordStartupPhase("imports", time.perf_counter() - START_TIME)
+        start = time.perf_counter()
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
         self.setGeometry(0, 0, 1440, 830)
+        # Recall preferences
+        if getattr(sys, 'frozen', False):
+            # If the application is run as a bundle
+            # noinspection PyProtectedMember
+            baseDir = sys._MEIPASS  # _MEIPASS is added by PyInstaller at runtime
+        else:
+            baseDir = os.path.dirname(__file__)
+        self.prefFile = os.path.join(baseDir, "preferences.json")
+        with open(self.prefFile, "r") as f:
+            self.pref = json.load(f)
+        # MIDI input ports: the first one is set in the connection dialog
+        ports = self.pref["MIDIIn"]
+        self.midiInPorts = (ports if isinstance(ports, list) else [ports]) or [0]
+        self.udpPort = self.pref["OSC"]
+        # Deferred startup shows the window first, and then loads the catalog
+        # and opens MIDI and OSC in the background
+        self.deferredStartup = self.pref.get("DeferredStartup", False)
+        # Durations of the compute and render stages (recorded when enabled)
+        self.stageTimer = StageTimer(self.pref.get("StageTimings", False))
+        # MIDI-to-display latency of note messages (traced when enabled)
+        self.latencyTracer = LatencyTracer(self.stageTimer, self.pref.get("MIDILatency", False))
+        self.catalog = None         # Set-class catalog (compiled on the first run)
+        self.profiles = None        # Profiles of all the pcsets indexed by bitmask (built on the first run)
+        self.inclusionIndex = None  # Target SC members cached by (source SC, target SC)
         # Initialize profile data
-        self.pcset = Pcset({})  # Pcset object for operations with currently "active" pcs
+        self.pcset = PcMask()  # PcMask object for operations with currently "active" pcs
+        self.profileState = ProfileState()  # Incrementally updated profile of self.pcset
         self.card = 0
         self.nf = []         # Normal form
         self.pf = []         # Prime form
@@ -49,15 +82,17 @@ class MainWindow(QtWidgets.QMainWindow):
         self.tn = []         # Tn transformation
         self.tni = []        # TnI transformation
         self.summary = ""    # Set info summary
+        self.rendered = {}   # key=display field, val=value last shown in the widgets
         # Initialize widgets
         self.pcBtns = [self.ui.btnPC0, self.ui.btnPC1, self.ui.btnPC2,
                        self.ui.btnPC3, self.ui.btnPC4, self.ui.btnPC5,
                        self.ui.btnPC6, self.ui.btnPC7, self.ui.btnPC8,
                        self.ui.btnPC9, self.ui.btnPC10, self.ui.btnPC11]  # Stores the toggle states
-        self.ivTable = self.setupIndexVectorTable()  # Index vector table (1d list)
-        self.mcompTable = self.setupModalComplementTable()  # Modal complements table (2d list)
-        self.targetSCMemberTable = self.setupTargetSCMemberTable()  # Target SC member table (2d list)
-        self.mscTables = self.setupModalSetComplexTables()  # Modal set complex tables (dict)
+        self.ivModel = self.setupIndexVectorTable()  # Index vector table (model)
+        self.mcompModel = self.setupModalComplementTable()  # Modal complements table (model)
+        self.targetSCMemberModel = self.setupTargetSCMemberTable()  # Target SC member table (model)
+        self.targetSCMenuModel = self.setupTargetSCMenu()  # Target SC menu (model)
+        self.mscModels = self.setupModalSetComplexTables()  # Modal set complex tables (dict of models)
         octLabels = self.ui.frameOCT.findChildren(QtWidgets.QLabel)
         wtLabels = self.ui.frameWT.findChildren(QtWidgets.QLabel)
         hexLabels = self.ui.frameHEX.findChildren(QtWidgets.QLabel)
@@ -65,108 +100,120 @@ class MainWindow(QtWidgets.QMainWindow):
         hexLabelsOuter = list(set(self.ui.frameHEX_outer.findChildren(QtWidgets.QLabel)) - set(hexLabels))
         self.colLabelsInner = octLabels + wtLabels + hexLabels  # PC labels inside collection frames
         self.colLabelsOuter = octLabelsOuter + hexLabelsOuter   # PC labels outside collection frames
+        self.colLabelsByPC = [[] for _ in range(12)]  # Collection pc labels of each pc
+        for label in self.colLabelsInner + self.colLabelsOuter:
+            self.colLabelsByPC[int(label.text())].append(label)
+        self.colLabelMask = 0  # Bitmask of the pcs shown as active in the collection pc labels
+        # Display update stages: (stage name, method) in the order of update
+        self.displayStages = [("render." + show.__name__, show) for show in [
+            self.showNormalForm, self.showPrimeForm, self.showSetName, self.showICV,
+            self.showTransformationLevel, self.showModalAttributes, self.showIndexVector,
+            self.showLiteralComplement, self.showAbstractComplement, self.showZCorrespondent,
+            self.showModalComplements, self.showSetSummary, self.showTargetSCMenu,
+            self.showCollectionPCs]]
         # Undo/redo stacks
         self.undoStack = []  # Undo stack
         self.redoStack = []  # Redo stack
-        # Recall preferences
-        if getattr(sys, 'frozen', False):
-            # If the application is run as a bundle
-            # noinspection PyProtectedMember
-            baseDir = sys._MEIPASS  # _MEIPASS is added by PyInstaller at runtime
-        else:
-            baseDir = os.path.dirname(__file__)
-        self.prefFile = os.path.join(baseDir, "preferences.json")
-        with open(self.prefFile, "r") as f:
-            pref = json.load(f)
-        self.midiInPort = pref["MIDIIn"]
-        self.udpPort = pref["OSC"]
+        # Bursts of pc input (e.g., the notes of a MIDI chord) are coalesced
+        # into a single profile and display update
+        self.updateScheduler = UpdateScheduler(self.pref.get("UpdateInterval", 0), self.applyPendingInput, self)
+        self.pendingSet = False  # Whether the pending input includes a whole pcset (OSC input)
+        self.pendingTraces = []  # Timestamps of the pending MIDI input for the latency tracer
         # Worker thread for MIDI input
-        self.threadMIDI = WorkerMIDI()
-        self.threadMIDI.setInputPort(self.midiInPort)
+        midiChannels = {int(port): channels for port, channels in self.pref.get("MIDIChannels", {}).items()}
+        self.threadMIDI = WorkerMIDI(self.midiInPorts, self.pref.get("SyntheticMIDI", 0),
+                                     self.pref.get("MIDIInputMode", "callback"), midiChannels)
+        self.threadMIDI.tracer = self.latencyTracer
         # Worker thread for OSC input
         self.threadOSC = WorkerOSC(self.udpPort)
-        # Initialize display widgets
-        self.resetTargetSCMenu()  # Target set-class menu
         # Set up dialog objects
         self.connectionDialog = ConnectionDialog(self.threadMIDI.getInputPorts())
-        self.connectionDialog.setMIDIInPortMenu(self.midiInPort)
         self.connectionDialog.setUDPPortMenu(self.udpPort)
+        self.stageTimingsDialog = StageTimingsDialog(self.stageTimer, self.latencyTracer,
+                                                     self.updateScheduler, self.threadMIDI)
         # Signal-slot connections
         self.makeConnections()
-
-    @staticmethod
-    def makeTableItems(table, rows, cols):
-        """
-        Create TableWidgetItems in a table widget.
-
-        :param table: a table widget object to write items to.
-        :param rows: an int for the number of rows in the table.
-        :param cols: an int for the number of columns in the table.
-        :return: a list for the table items (1d if single row; 2d if multiple rows).
-        """
-        tableItems = []
-        for row in range(rows):
-            rowItems = []
-            for col in range(cols):
-                item = QtWidgets.QTableWidgetItem()
-                item.setFlags(QtCore.Qt.ItemFlag.ItemIsEnabled)
-                item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignHCenter |
-                                      QtCore.Qt.AlignmentFlag.AlignVCenter)
-                rowItems.append(item)
-                table.setItem(row, col, item)
-            tableItems.append(rowItems)
-        if len(tableItems) == 1:
-            # Return a 1d list if there is a single row
-            return tableItems[0]
+        # Repaints of the window are reported to the latency tracer
+        self.installEventFilter(self)
+        self.recordStartupPhase("ui", time.perf_counter() - start)
+        if self.deferredStartup:
+            # Input is enabled when the catalog is loaded
+            self.setInputEnabled(False)
         else:
-            return tableItems
-
-    def setupIndexVectorTable(self):
-        """
-        Returns a list of TableWidgetItems for the index vector:
-        each of them is configured for the specific default.
+            catalogStart = time.perf_counter()
+            self.setCatalog(defaultCatalog(), defaultProfileTable())
+            self.recordStartupPhase("catalog", time.perf_counter() - catalogStart)
+            # Connect before opening, so that no input is emitted unconnected
+            self.connectWorkers()
+            self.openInputs()
+            menuStart = time.perf_counter()
+            self.resetTargetSCMenu()  # Target set-class menu
+            self.recordStartupPhase("targetSCMenu", time.perf_counter() - menuStart)
+        # Runs when the event loop has started, i.e., the window is shown
+        QtCore.QTimer.singleShot(0, self.startupWindowShown)
+
+    def setupIndexVectorTable(self) -> IndexVectorModel:
+        """Returns the model for the index vector, set to the table view."""
+        model = IndexVectorModel(self)
+        self.ui.tableIndexVector.setModel(model)
+        return model
+
+    def setupModalComplementTable(self) -> ModalComplementModel:
         """
-        return MainWindow.makeTableItems(self.ui.tableIndexVector, 1, 12)
-
-    def setupModalComplementTable(self) -> List[List[QtWidgets.QTableWidgetItem]]:
-        """
-        Returns a list of TableWidgetItems for the modal complements.
-        The list is structured for 3x3 table as:
+        Returns the model for the modal complements, set to the table view.
+        The model is structured for 3x3 table as:
             [[refCol, mcomp, SN],
              [refCol, mcomp, SN],
              [refCol, mcomp, SN]]
         """
+        model = ModalComplementModel(self.profiles, self)
         table = self.ui.tableMComps
+        table.setModel(model)
         table.setColumnWidth(0, 55)
         table.setColumnWidth(1, 100)
         table.setColumnWidth(2, 55)
-        return MainWindow.makeTableItems(table, 3, 3)
+        return model
 
-    def setupTargetSCMemberTable(self) -> List[List[QtWidgets.QTableWidgetItem]]:
+    def setupTargetSCMemberTable(self) -> TargetSCMemberModel:
         """
-        Returns a list of TableWidgetItems for the target SC members.
-        The list is structured for 15x5 table as:
+        Returns the model for the target SC members, set to the table view.
+        The model holds any number of members structured as:
             [[incl/comp, Tn/TnI, MA, diff, diffInfo],
              [incl/comp, Tn/TnI, MA, diff, diffInfo],
              ...,
              [incl/comp, Tn/TnI, MA, diff, diffInfo]]
+        Clicking a column header sorts the members by the column.
         """
+        model = TargetSCMemberModel(self.profiles, self)
         table = self.ui.tableTargetSCMembers
+        table.setModel(model)
         table.setColumnWidth(0, 140)
         table.setColumnWidth(1, 60)
         table.setColumnWidth(2, 80)
         table.setColumnWidth(3, 140)
         table.horizontalHeader().setSectionResizeMode(4,
                                                       QtWidgets.QHeaderView.ResizeMode.Stretch)
-        return MainWindow.makeTableItems(table, 20, 5)
+        # Keep the original order of the members until a column header is clicked
+        table.horizontalHeader().setSortIndicator(-1, QtCore.Qt.SortOrder.AscendingOrder)
+        table.setSortingEnabled(True)
+        return model
+
+    def setupTargetSCMenu(self) -> TargetSCMenuModel:
+        """
+        Returns the model for the target SC menu, set to the combo box. The
+        rows for the set classes of cardinalities 3 to 9 are created once.
+        """
+        model = TargetSCMenuModel({card: c.SN_VECS[card][1:] for card in range(3, 10)}, self)
+        self.ui.comboBoxTargetSCs.setModel(model)
+        return model
 
-    def setupModalSetComplexTables(self) -> Dict[str, List[List[QtWidgets.QTableWidgetItem]]]:
+    def setupModalSetComplexTables(self) -> Dict[str, MSCMemberModel]:
         """
         Returns a dict of 3 key/val pairs where key is the cardinality of
-        MSC members of the table, and val is a list of TableWidgetItems
-        structured for the table showing MSC members. The structure of each
-        list is the same except for the last column--there is no Z-corr.
-        column for the table of trichordal MSC members.
+        MSC members of the table, and val is the model set to the table
+        view showing MSC members. The structure of each model is the same
+        except for the last column--there is no Z-corr. column for the
+        table of trichordal MSC members.
             [[SN, MA, sym, count, (Z-corr)],
              [SN, MA, sym, count, (Z-corr)],
              ...
@@ -175,19 +222,18 @@ class MainWindow(QtWidgets.QMainWindow):
         tables = [self.ui.tableMSCTrichords,
                   self.ui.tableMSCTetrachords,
                   self.ui.tableMSCHexachords]
-        i = 0
-        for table in range(3):
-            tables[i].setColumnWidth(0, 50)
-            tables[i].setColumnWidth(1, 70)
-            tables[i].setColumnWidth(2, 50)
-            tables[i].setColumnWidth(3, 30)
-            if i >= 1:
-                tables[i].setColumnWidth(4, 50)
-            i += 1
-        tableDict = dict([("3", MainWindow.makeTableItems(tables[0], 7, 4)),
-                          ("4", MainWindow.makeTableItems(tables[1], 7, 5)),
-                          ("6", MainWindow.makeTableItems(tables[2], 7, 5))])
-        return tableDict
+        modelDict = {}
+        for card, table in zip(["3", "4", "6"], tables):
+            model = MSCMemberModel(self.catalog, int(card), self)
+            table.setModel(model)
+            table.setColumnWidth(0, 50)
+            table.setColumnWidth(1, 70)
+            table.setColumnWidth(2, 50)
+            table.setColumnWidth(3, 30)
+            if card != "3":
+                table.setColumnWidth(4, 50)
+            modelDict[card] = model
+        return modelDict
 
     def makeConnections(self):
         """Make signal-slot connections"""
@@ -233,38 +279,178 @@ class MainWindow(QtWidgets.QMainWindow):
         # Show MSC members in the tables
         self.ui.comboBoxNexus.activated.connect(self.showMSCTables)
         # Create SC members of a MSC member in the table
-        self.ui.tableMSCTrichords.cellDoubleClicked.connect(
-            lambda row, col: self.findMSCSCMembers(self.ui.tableMSCTrichords, row, col))
-        self.ui.tableMSCTetrachords.cellDoubleClicked.connect(
-            lambda row, col: self.findMSCSCMembers(self.ui.tableMSCTetrachords, row, col))
-        self.ui.tableMSCHexachords.cellDoubleClicked.connect(
-            lambda row, col: self.findMSCSCMembers(self.ui.tableMSCHexachords, row, col))
+        self.ui.tableMSCTrichords.doubleClicked.connect(
+            lambda index: self.findMSCSCMembers(self.ui.tableMSCTrichords, index.row(), index.column()))
+        self.ui.tableMSCTetrachords.doubleClicked.connect(
+            lambda index: self.findMSCSCMembers(self.ui.tableMSCTetrachords, index.row(), index.column()))
+        self.ui.tableMSCHexachords.doubleClicked.connect(
+            lambda index: self.findMSCSCMembers(self.ui.tableMSCHexachords, index.row(), index.column()))
         # Custom signals
+        self.threadMIDI.opened.connect(self.midiOpened)
+        self.threadOSC.opened.connect(self.oscOpened)
+        self.connectionDialog.message.connect(self.setPorts)
+        # Show dialog boxes
+        self.ui.actionMIDI_OSC.triggered.connect(self.showConnectionDialog)
+        self.ui.actionStageTimings.triggered.connect(self.showStageTimingsDialog)
+
+    def connectWorkers(self):
+        """Connects the input signals of the worker threads"""
         # noinspection PyArgumentList
         self.threadMIDI.message.connect(self.midiInput,
                                         QtCore.Qt.ConnectionType.QueuedConnection)
         # noinspection PyArgumentList
-        self.threadOSC.message.connect(self.updatePCSet,
+        self.threadOSC.message.connect(self.scheduleSet,
                                        QtCore.Qt.ConnectionType.QueuedConnection)
-        self.connectionDialog.message.connect(self.setPorts)
-        # Show dialog boxes
-        self.ui.actionMIDI_OSC.triggered.connect(self.showConnectionDialog)
+        # Discard the traces of the pc changes emitted before the connection
+        self.latencyTracer.setEnabled(self.latencyTracer.enabled)
+
+    # Startup methods ---------------------------------------------------------
+
+    def recordStartupPhase(self, name, seconds):
+        """
+        Records and reports the time spent in a startup phase.
+
+        :param name: a str for the phase.
+        :param seconds: a float for the time spent in the phase.
+        """
+        self.startupTimes[name] = seconds
+        print("Startup {}: {:.1f} ms".format(name, seconds * 1000))
+
+    def setCatalog(self, catalog, profiles):
+        """
+        Sets the set-class catalog and the profile table, which the profile
+        queries and the target SC member table use.
+
+        :param catalog: a BinaryCatalog object.
+        :param profiles: a ProfileTable object.
+        """
+        self.catalog = catalog
+        self.profiles = profiles
+        self.inclusionIndex = InclusionIndex(profiles)
+        self.targetSCMemberModel.profiles = profiles
+        self.mcompModel.profiles = profiles
+        for model in self.mscModels.values():
+            model.setCatalog(catalog)
+
+    def setInputEnabled(self, state):
+        """Enables/disables the widgets and the menu actions"""
+        self.ui.centralwidget.setEnabled(state)
+        for action in self.findChildren(QtGui.QAction):
+            action.setEnabled(state)
+
+    def openInputs(self):
+        """Opens MIDI input and the OSC server in the main thread"""
+        self.threadMIDI.openInput()
+        self.recordStartupPhase("midi", self.threadMIDI.openTime)
+        self.connectionDialog.setMIDIInPorts(self.threadMIDI.getInputPorts())
+        self.connectionDialog.setMIDIInPortMenu(self.midiInPorts[0])
+        self.threadOSC.openServer()
+        self.recordStartupPhase("osc", self.threadOSC.openTime)
+
+    def startupWindowShown(self):
+        """
+        Records the time to the first window, and with deferred startup,
+        fills the target SC menu and starts loading the catalog and opening
+        MIDI and OSC in the background.
+        """
+        self.recordStartupPhase("firstWindow", time.perf_counter() - START_TIME)
+        if not self.deferredStartup:
+            return
+        self.threadCatalog = WorkerCatalog()
+        self.threadCatalog.loaded.connect(self.catalogLoaded)
+        self.threadCatalog.start()
+        self.startWorkerMIDI()
+        self.startWorkerOSC()
+        menuStart = time.perf_counter()
+        self.resetTargetSCMenu()  # Target set-class menu
+        self.recordStartupPhase("targetSCMenu", time.perf_counter() - menuStart)
+
+    def catalogLoaded(self, catalog, profiles, seconds):
+        """Enables input when the catalog has been loaded in the background"""
+        self.setCatalog(catalog, profiles)
+        self.recordStartupPhase("catalog", seconds)
+        self.connectWorkers()
+        self.syncMIDIInput()
+        self.setInputEnabled(True)
+        self.recordStartupPhase("ready", time.perf_counter() - START_TIME)
+
+    def syncMIDIInput(self):
+        """
+        Sets the pcs to the ones sounding in MIDI input, e.g., the notes
+        received before the signals of the MIDI worker were connected with
+        deferred startup.
+        """
+        mask = self.threadMIDI.soundingMask()
+        for pc in range(12):
+            state = bool(mask >> pc & 1)
+            if self.pcBtns[pc].isChecked() != state:
+                self.pcBtns[pc].setChecked(state)
+                self.scheduleInput(pc, state)
+
+    def midiOpened(self):
+        """Populates the MIDI input menu when MIDI input has been opened in the background"""
+        self.recordStartupPhase("midi", self.threadMIDI.openTime)
+        self.connectionDialog.setMIDIInPorts(self.threadMIDI.getInputPorts())
+        self.connectionDialog.setMIDIInPortMenu(self.midiInPorts[0])
+
+    def oscOpened(self):
+        """Reports the OSC server opened in the background"""
+        self.recordStartupPhase("osc", self.threadOSC.openTime)
 
     # PC input and peripheral methods -----------------------------------------
 
     def inputPC(self, pc, state):
         """
-        Add/remove a single pc to/from the current set
+        Add/remove a single pc to/from the current set, and update the
+        display now (together with any pending input).
+
+        :param pc: int for pc
+        :param state: bool for set membership
+        """
+        self.scheduleInput(pc, state)
+        self.updateScheduler.flush()
+
+    def scheduleInput(self, pc, state):
+        """
+        Add/remove a single pc to/from the pending input. The profile state
+        is updated incrementally now, and the display at the next update
+        of the scheduler.
 
         :param pc: int for pc
         :param state: bool for set membership
         """
-        if state:
-            self.pcset.union({pc})
+        self.stageTimer.call("profile.toggle", "compute", self.profileState.toggle, pc, state)
+        self.updateScheduler.schedule()
+
+    def scheduleSet(self, pcs):
+        """
+        Replace the pending input with a whole set (OSC input). Only the
+        set shown before the pending input is archived.
+
+        :param pcs: an iterable with pcs.
+        """
+        self.profileState = ProfileState(PcMask(pcs))
+        self.pendingSet = True
+        self.updateScheduler.schedule()
+
+    def applyPendingInput(self):
+        """Update the profile and the display for the pending input (called by the scheduler)"""
+        timer = self.stageTimer
+        start = time.perf_counter_ns()
+        if self.pendingSet:
+            self.pendingSet = False
+            self.updatePCSet(PcMask.fromMask(self.profileState.mask))
         else:
-            self.pcset.difference({pc})
-        self.updateProfile()
-        self.updateDisplay()
+            self.pcset = PcMask.fromMask(self.profileState.mask)
+            profile = timer.call("profile.lookup", "compute", self.profileState.profile, self.profiles)
+            timer.call("profile.set", "compute", self.setProfile, profile)
+            self.updateDisplay()
+        if timer.enabled:
+            timer.record("update", "input", start, time.perf_counter_ns())
+        if self.pendingTraces:
+            for times in self.pendingTraces:
+                self.latencyTracer.inputDone(times)
+            self.pendingTraces = []
 
     def midiInput(self, pc, state):
         """
@@ -273,8 +459,22 @@ class MainWindow(QtWidgets.QMainWindow):
         :param pc: int for pc
         :param state: bool for set membership
         """
+        tracer = self.latencyTracer
+        if tracer.enabled:
+            times = tracer.received(pc, state)
+            if times is not None:
+                self.pendingTraces.append(times)
         self.pcBtns[pc].setChecked(state)
-        self.inputPC(pc, state)
+        self.scheduleInput(pc, state)
+
+    def eventFilter(self, obj, event):
+        """Reports the repaints of the window to the latency tracer"""
+        if obj is self and event.type() == QtCore.QEvent.Type.UpdateRequest and self.latencyTracer.updated:
+            # The widgets are repainted while the update request is handled
+            QtWidgets.QMainWindow.event(self, event)
+            self.latencyTracer.painted()
+            return True
+        return False
 
     def togglePCBtn(self, pc):
         """Toggle the state of a pc button"""
@@ -295,9 +495,10 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def updatePCSet(self, pcs, archive=True):
         """Mutate the current set to the input set"""
+        self.updateScheduler.flush()
         if archive:
             self.archive()
-        self.pcset = Pcset(pcs)
+        self.pcset = PcMask(pcs)
         self.updateProfile()
         self.updateDisplay()
         self.resetOperations()
@@ -306,24 +507,37 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def updateProfile(self):
         """Update the instance variables for set profile"""
-        self.card = len(self.pcset)
-        self.nf = self.pcset.normalForm()
-        self.pf = self.pcset.primeForm()
-        self.sn = MainWindow.setName(self.pcset)
-        self.lvl = MainWindow.transformationLevel(self.pcset)
-        self.matts = self.modalAttributes(self.pcset)
-        self.icv = MainWindow.intervalClassVector(self.pcset)
-        self.iv = MainWindow.indexVector(self.pcset)
-        self.lcomp = MainWindow.literalComplement(self.pcset)
-        self.acomp = MainWindow.abstractComplement(self.pcset)
-        self.zcorr = MainWindow.zCorrespondent(self.pcset)
-        self.mcomps = MainWindow.modalComplements(self.pcset)
-        self.summary = self.setSummary(self.pcset)
+        timer = self.stageTimer
+        self.profileState = timer.call("profile.state", "compute", ProfileState, self.pcset)
+        profile = timer.call("profile.lookup", "compute", self.profiles.__getitem__, self.pcset.mask)
+        timer.call("profile.set", "compute", self.setProfile, profile)
+
+    def setProfile(self, profile):
+        """
+        Set the instance variables for set profile.
+
+        :param profile: a dict for the profile of the current set.
+        """
+        self.card = profile["card"]
+        self.nf = profile["nf"]
+        self.pf = profile["pf"]
+        self.sn = profile["sn"]
+        self.lvl = profile["lvl"]
+        self.matts = profile["matts"]
+        self.icv = profile["icv"]
+        self.iv = profile["iv"]
+        self.lcomp = profile["lcomp"]
+        self.acomp = profile["acomp"]
+        self.zcorr = profile["zcorr"]
+        self.mcomps = profile["mcomps"]
+        self.summary = profile["summary"]
 
     def resetPCSet(self):
         """Clears the pcset and reset the display"""
+        self.updateScheduler.flush()
         self.archive()
-        self.pcset = Pcset({})
+        self.pcset = PcMask()
+        self.profileState = ProfileState()
         self.resetProfile()
         self.resetDisplay()
 
@@ -356,6 +570,10 @@ class MainWindow(QtWidgets.QMainWindow):
         """Shows Connection dialog box in modeless mode"""
         self.connectionDialog.show()
 
+    def showStageTimingsDialog(self):
+        """Shows Stage Timings dialog box in modeless mode"""
+        self.stageTimingsDialog.show()
+
     def setUDPPort(self, port):
         """Sets the UDP port to the one selected in the connection window"""
         self.threadOSC.changePort(port)
@@ -364,14 +582,14 @@ class MainWindow(QtWidgets.QMainWindow):
         """
         Effects the port changes and saves the settings in the preference file.
 
-        :param midiInPort: an int for MIDI input port number.
+        :param midiInPort: an int for the first MIDI input port number.
         :param udpPort: an int for UDP port number.
         """
         count = 0
         # If MIDI input port is changed, update the instance variable and effect the change.
-        if self.midiInPort != midiInPort:
-            self.midiInPort = midiInPort
-            self.threadMIDI.setInputPort(self.midiInPort)
+        if self.midiInPorts[0] != midiInPort:
+            self.midiInPorts = [midiInPort] + [port for port in self.midiInPorts[1:] if port != midiInPort]
+            self.threadMIDI.setInputPorts(self.midiInPorts)
             count += 1
         # If UDP port is changed, update the instance variable and effect the change.
         if self.udpPort != udpPort:
@@ -380,197 +598,39 @@ class MainWindow(QtWidgets.QMainWindow):
             count += 1
         # If either of the ports are changed, write the current settings to the pref file.
         if count > 0:
-            pref = {"MIDIIn": self.midiInPort, "OSC": self.udpPort}
+            self.pref["MIDIIn"] = self.midiInPorts if len(self.midiInPorts) > 1 else self.midiInPorts[0]
+            self.pref["OSC"] = self.udpPort
             with open(self.prefFile, "w") as outfile:
-                json.dump(pref, fp=outfile, indent=4, sort_keys=True)
-
-    # Set profile query and calculation methods -------------------------------
-
-    @staticmethod
-    def setName(pcsetObj):
-        """
-        :param pcsetObj: a Pcset object for the input set.
-        :return: a str for the set name of pf.
-        """
-        if not (3 <= len(pcsetObj) <= 9):
-            return ""
-        else:
-            pf = toPFStr(pcsetObj.primeForm())
-            return catalog["PFToSN"][pf]
-
-    @staticmethod
-    def transformationLevel(pcsetObj):
-        """
-        :param pcsetObj: a Pcset object for the input set.
-        :return: a str for the most basic transformation level of the input set:
-            if it is a symmetrical set, the Tn level with the smallest transposition
-            number represents the transformation level.
-        """
-        if not (3 <= len(pcsetObj) <= 9):
-            return ""
-        dct = pcsetObj.transformationLevels()
-        lvls = []
-        for i in dct["Tn"]:
-            lvls.append("T" + str(i))
-        for j in dct["TnI"]:
-            lvls.append("T" + str(j) + "I")
-        return lvls[0]
-
-    @staticmethod
-    def modalAttributes(pcsetObj):
-        """
-        :param pcsetObj: a Pcset object for the input set.
-        :return: a list of the modal attributes of the input set:
-            each attribute is represented by a str.
-        """
-        card = len(pcsetObj)
-        if not (3 <= card <= 9):
-            return []
-        else:
-            matts = []
-            ref = pcsetObj.referentialCollections()
-            for col in c.REF_COLS:
-                if ref[col] == 2:
-                    matts.append(col)
-                elif card == 6 and ref[col] == 1:
-                    matts.append(col + "'")
-            if ref["D"]:
-                matts.append("D")
-            return matts
-
-    @staticmethod
-    def intervalClassVector(pcsetObj):
-        """
-        :param pcsetObj: a Pcset object for the input set.
-        :return: a list for the ICV of the input set.
-        """
-        if not (2 <= len(pcsetObj) <= 9):
-            return []
-        else:
-            return pcsetObj.icv()
-
-    @staticmethod
-    def indexVector(pcsetObj):
-        """
-        :param pcsetObj: a Pcset object for the input set.
-        :return: a list for the index vector of the input set.
-        """
-        if not (2 <= len(pcsetObj) <= 9):
-            return [""] * 12
-        else:
-            return pcsetObj.indexVector()
-
-    @staticmethod
-    def literalComplement(pcsetObj):
-        """
-        :param pcsetObj: a Pcset object for the input set.
-        :return: a list for the literal complement of the input set:
-            the returned set is in normal form.
-        """
-        if len(pcsetObj) == 0:
-            return []
-        else:
-            return Pcset(pcsetObj.complement()).normalForm()
-
-    @staticmethod
-    def abstractComplement(pcsetObj):
-        """
-        :param pcsetObj: a Pcset object for the input set.
-        :return: a list for the abstract complement of the input set:
-        the returned set is in prime form.
-        """
-        if len(pcsetObj) == 0:
-            return []
-        else:
-            return Pcset(pcsetObj.complement()).primeForm()
-
-    @staticmethod
-    def zCorrespondent(pcsetObj):
-        """
-        :param pcsetObj: a Pcset object for the input set.
-        :return: a str of the set name of Z-correspondent of the input set:
-            an empty str is returned when it's not Z-related.
-        """
-        sn = MainWindow.setName(pcsetObj)
-        # Z-related sets are only card between 4 and 8
-        if not (4 <= len(pcsetObj) <= 8):
-            return ""
-        else:
-            zcorr = catalog["SC"][sn]["Z-corr"]
-            if zcorr is not None:
-                return zcorr
-            else:
-                return ""
-
-    @staticmethod
-    def modalComplements(pcsetObj):
-        """
-        :param pcsetObj: a Pcset object for the input set.
-        :return: a dict (key=colName(str), val=mcomp(set)) for modal complements
-            of the input set. Sets that return their modal complements are those
-            with no foreign pcs or in case of a hexachord, prime M.A.
-            (i.e,. hexachords with one foreign pc).
-        """
-        card = len(pcsetObj)
-        dct = {}
-        if not (3 <= card <= 9):
-            return dct
-        mcomps = pcsetObj.modalComplements()
-        for name in c.REF_COLS:
-            col = c.COL_DICT[name]
-            mcomp = mcomps[name]
-            union = pcsetObj.getSet() | mcomp
-            # (set with no foreign pc but not col) or (hexachord with one foreign pc)
-            if ((union == col) and (len(mcomp) != 0)) \
-                    or ((card == 6) and (len(union) == len(col) + 1)):
-                dct[name] = mcomp
-        return dct
-
-    def setSummary(self, pcsetObj):
-        """
-        :param pcsetObj: a Pcset object for the input set.
-        :return: a str of the summary of the input set as: "SN (Tn/TnI, M.A.)".
-        """
-        card = len(pcsetObj)
-        if card == 0:
-            return ""
-        elif card == 1:
-            nf = pcsetObj.normalForm()
-            return str(nf[0])
-        elif card == 2 or (10 <= card <= 12):
-            nf = ",".join(str(pc) for pc in self.nf)
-            return nf
-        else:
-            sn = MainWindow.setName(pcsetObj)
-            lvl = MainWindow.transformationLevel(pcsetObj)
-            matts = " ".join(self.modalAttributes(pcsetObj))
-            if matts == "":
-                summary = "{0} ({1})".format(sn, lvl)
-            else:
-                summary = "{0} ({1}, {2})".format(sn, lvl, matts)
-            return summary
+                json.dump(self.pref, fp=outfile, indent=4, sort_keys=True)
 
     # Display methods ---------------------------------------------------------
 
     def updateDisplay(self):
         """Updates the display widgets"""
-        self.showNormalForm()
-        self.showPrimeForm()
-        self.showSetName()
-        self.showICV()
-        self.showTransformationLevel()
-        self.showModalAttributes()
-        self.showIndexVector()
-        self.showLiteralComplement()
-        self.showAbstractComplement()
-        self.showZCorrespondent()
-        self.showModalComplements()
-        self.showSetSummary()
-        self.showTargetSCMenu()
-        self.showCollectionPCs()
+        timer = self.stageTimer
+        start = time.perf_counter_ns()
+        for stage, show in self.displayStages:
+            timer.call(stage, "render", show)
+        if timer.enabled:
+            timer.record("updateDisplay", "render", start, time.perf_counter_ns())
+
+    def isDirty(self, field, value):
+        """
+        Compares a value with the one last shown for a display field, and
+        records it if it changed.
+
+        :param field: a str for the display field.
+        :param value: the value to show.
+        :return: a bool, True if the widgets of the field need an update.
+        """
+        if field in self.rendered and self.rendered[field] == value:
+            return False
+        self.rendered[field] = value
+        return True
 
     def resetDisplay(self):
         """Resets the display widgets"""
+        self.rendered.clear()
         self.resetPCBtns()
         self.ui.lineEditNF.clear()
         self.ui.lineEditPF.clear()
@@ -601,46 +661,58 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def showNormalForm(self):
         """Show the normal form of the updated pcset"""
+        if not self.isDirty("nf", self.nf):
+            return
         s = ",".join(str(pc) for pc in self.nf)
         self.ui.lineEditNF.setText(s)
 
     def showPrimeForm(self):
         """Show the prime form of the updated pcset"""
+        if not self.isDirty("pf", self.pf):
+            return
         pf = toPFStr(self.pf)
         self.ui.lineEditPF.setText(pf)
 
     def showSetName(self):
         """Show the set name of the updated pcset"""
-        self.ui.lineEditSN.setText(self.sn)
+        if self.isDirty("sn", self.sn):
+            self.ui.lineEditSN.setText(self.sn)
 
     def showTransformationLevel(self):
         """Show the Tn/TnI transformation level of the updated pcset"""
-        self.ui.lineEditLevel.setText(self.lvl)
+        if self.isDirty("lvl", self.lvl):
+            self.ui.lineEditLevel.setText(self.lvl)
 
     def showModalAttributes(self):
         """Show the modal attributes of the updated pcset"""
+        if not self.isDirty("matts", self.matts):
+            return
         s = " ".join(self.matts)
         self.ui.lineEditMA.setText(s)
 
     def showICV(self):
         """Show the ICV of the updated pcset"""
+        if not self.isDirty("icv", self.icv):
+            return
         s = "".join(str(ic) for ic in self.icv)
         self.ui.lineEditICV.setText(s)
 
     def showIndexVector(self):
         """Show the index vector of the updated pcset"""
-        col = 0
-        for item in self.ivTable:
-            item.setText(str(self.iv[col]))
-            col += 1
+        if self.isDirty("iv", self.iv):
+            self.ivModel.setVector(self.iv)
 
     def showLiteralComplement(self):
         """Show the literal complement of the updated pcset"""
+        if not self.isDirty("lcomp", self.lcomp):
+            return
         s = ",".join(str(pc) for pc in self.lcomp)
         self.ui.lineEditLComp.setText(s)
 
     def showAbstractComplement(self):
         """Show the abstract complement of the updated pcset"""
+        if not self.isDirty("acomp", self.acomp):
+            return
         # Show the prime form
         pf = toPFStr(self.acomp)
         self.ui.lineEditAComp.setText(pf)
@@ -648,77 +720,54 @@ class MainWindow(QtWidgets.QMainWindow):
         if not (3 <= len(pf) <= 9):
             self.ui.lineEditACompSN.clear()
         else:
-            sn = catalog["PFToSN"][pf]
+            sn = self.catalog.name(self.catalog.setClassOf(toMask(self.acomp)))
             self.ui.lineEditACompSN.setText(sn)
 
     def showZCorrespondent(self):
         """Show the Z-correspondent of the updated pcset"""
+        if not self.isDirty("zcorr", self.zcorr):
+            return
         # Show the set name
         self.ui.lineEditZCorrSN.setText(self.zcorr)
         # Show the prime form
         if self.zcorr == "":
             self.ui.lineEditZCorrPF.clear()
         else:
-            pf = catalog["SC"][self.zcorr]["PF"]
+            pf = toPFStr(self.catalog.primeForm(self.catalog.index(self.zcorr)))
             self.ui.lineEditZCorrPF.setText(pf)
 
     def showModalComplements(self):
         """
-        Show the modal complements of the updated pcset.
-        Display by setting str to the TableWidgetItems in self.mcompTable
-        which is structured as a 3x3 table as:
+        Show the modal complements of the updated pcset in the referential
+        collections, as the rows of self.mcompModel (only the changed rows
+        are updated):
             [[refCol, mcomp, SN],
              [refCol, mcomp, SN],
              [refCol, mcomp, SN]]
         """
-        # Clear table before writing
-        for i in range(3):
-            for j in range(3):
-                self.mcompTable[i][j].setText("")
-        # Write to the table
-        row = 0
-        for name in c.REF_COLS:
-            mcomp = self.mcomps.get(name)
-            if mcomp is not None:
-                nf = Pcset(mcomp).normalForm()
-                nfStr = ",".join(str(pc) for pc in nf)
-                pf = Pcset(mcomp).primeForm()
-                self.mcompTable[row][0].setText(name)
-                self.mcompTable[row][1].setText(nfStr)
-                if len(nf) >= 3:
-                    sn = catalog["PFToSN"][toPFStr(pf)]
-                    self.mcompTable[row][2].setText(sn)
-                row += 1
+        if not self.isDirty("mcomps", self.mcomps):
+            return
+        keys = [(name, toMask(self.mcomps[name])) for name in c.REF_COLS
+                if self.mcomps.get(name) is not None]
+        self.mcompModel.setRowKeys(keys)
 
     def showSetSummary(self):
         """Show the summary of the updated set as SN (Tn/TnI, M.A.)"""
-        self.ui.lineEditSetSummary.setText(self.summary)
+        if self.isDirty("summary", self.summary):
+            self.ui.lineEditSetSummary.setText(self.summary)
 
     def showTargetSCMenu(self):
-        """Update items in the combo box for target set classes"""
-        menu = self.ui.comboBoxTargetSCs
-        prev = menu.currentIndex()
-        menu.clear()
-        n = 0  # Menu index
-        for card in range(3, 10):
-            for ord_ in range(1, len(c.SN_VECS[card])):
-                # Set name of this set class
-                sn = c.SN_VECS[card][ord_]
-                if not (3 <= self.card <= 9) or (self.card == card):
-                    target = sn
-                else:
-                    # Inclusion count for this target set class
-                    count = catalog["inclusionTable"][self.sn][str(card)][ord_-1]
-                    target = "{0:5} ({1})".format(sn, count)
-                menu.addItem(target)
-                if self.card == card:
-                    menu.model().item(n).setEnabled(False)
-                n += 1
-            menu.addItem("-"*15)
-            menu.model().item(n).setEnabled(False)
-            n += 1
-        menu.removeItem(n-1)
-        menu.setCurrentIndex(prev)
+        """Update the inclusion counts and enabled states in the target SC menu"""
+        if not self.isDirty("targetSCMenu", (self.card, self.sn)):
+            return
+        if 3 <= self.card <= 9:
+            source = self.catalog.index(self.sn)
+            # Inclusion vectors of the current set class for the target cardinalities
+            vectors = {card: self.catalog.inclusionVector(source, card)
+                       for card in range(3, 10) if card != self.card}
+        else:
+            vectors = None
+        self.targetSCMenuModel.setCounts(self.card, vectors)
 
     def showMSCTables(self):
         """
@@ -728,83 +777,43 @@ class MainWindow(QtWidgets.QMainWindow):
              [SN, MA, sym, count, (Z-corr)],
              ...
              [SN, MA, sym, count, (Z-corr)]]
+        The rows of each nexus set are formatted once, and only the rows
+        whose members change are updated.
         """
-        self.resetMSCTables()
         nexus = str(self.ui.comboBoxNexus.itemText(
             self.ui.comboBoxNexus.currentIndex()))
-        for card in ["3", "4", "6"]:
-            table = self.mscTables[card]
-            # A list of dicts, each dict = a member
-            members = catalog["MSC"][nexus][card]
-            row = 0
-            for member in members:
-                table[row][0].setText(member["SN"])
-                table[row][1].setText(" ".join(member["MA"]))
-                table[row][2].setText(
-                    ", ".join(str(i) for i in member["symmetry"]))
-                table[row][3].setText(str(member["inclusion"]))
-                if card != "3":
-                    zcorr = member["Z-corr"]
-                    if zcorr is None:
-                        table[row][4].setText("")
-                    else:
-                        table[row][4].setText(zcorr)
-                row += 1
+        index = self.catalog.index(nexus)
+        for model in self.mscModels.values():
+            model.setNexus(index)
 
     def setStyleSheetColLabels(self, label, state):
-        """Sets stylesheet to the collection pc labels"""
-        name = label.objectName()  # Object name
-        # Set RGB for the background color
-        mode = name[5]
-        if mode == "O":
-            rgb = [8, 25, 43]   # Blue
-        elif mode == "W":
-            rgb = [100, 92, 23]  # Yellow
-        else:
-            rgb = [81, 37, 37]  # Red
-        # Set the foreground color and alpha channel for the background color
-        if state == 1:
-            if mode == "W":
-                fgColor = "rgb(0, 0, 0)"
-            else:
-                fgColor = "rgb(243, 243, 243)"
-            if label in self.colLabelsOuter:
-                alpha = 25
-            else:
-                if mode == "O":
-                    alpha = 60
-                elif mode == "W":
-                    alpha = 65
-                else:
-                    alpha = 70
-        else:
-            alpha = 0
-            if label in self.colLabelsOuter:
-                fgColor = "rgb(170, 170, 170)"
-            else:
-                fgColor = "rgb(0, 0, 0)"
-        # Background color comprises rgb + a
-        rgba = rgb + [alpha]
-        bgColor = "rgba({0}%, {1}%, {2}%, {3}%)".format(*rgba)
-        # Create style sheet
-        style = "QLabel#{0} {{\n" \
-                "font-size: 10px;\n" \
-                "font-weight: bold;\n" \
-                "qproperty-alignment: AlignCenter;\n" \
-                "color: {1};\n" \
-                "background-color: {2}\n}}\n".format(name, fgColor, bgColor)
-        # Set stylesheet
-        label.setStyleSheet(style)
+        """
+        Sets the style of a collection pc label by its "active" property:
+        the styles of both the states are in the style sheet of MainWindow,
+        so only the property is switched and the label is re-polished
+        (polish() discards the cached style rules of the label).
+        """
+        label.setProperty("active", bool(state))
+        label.style().polish(label)
 
     def showCollectionPCs(self):
         """Show the pc labels in referential collection displays"""
-        for label in self.colLabelsInner + self.colLabelsOuter:
-            pc = int(label.text())
-            if pc in self.pcset:
-                state = 1
-            else:
-                state = 0
-            self.setStyleSheetColLabels(label, state)
+        self.setCollectionPCs(self.pcset.mask)
+
+    def setCollectionPCs(self, mask):
+        """
+        Restyles the collection pc labels of the pcs whose membership
+        changed since the previous call.
+
+        :param mask: an int for the bitmask of the pcs to show as active.
+        """
+        changed = mask ^ self.colLabelMask
+        self.colLabelMask = mask
+        while changed:
+            bit = changed & -changed
+            for label in self.colLabelsByPC[bit.bit_length() - 1]:
+                self.setStyleSheetColLabels(label, mask & bit)
+            changed ^= bit
 
     def resetPCBtns(self):
         """Uncheck all the pcBtns"""
@@ -812,17 +821,12 @@ class MainWindow(QtWidgets.QMainWindow):
             b.setChecked(False)
 
     def resetIVTable(self):
-        """Empty all the TableWidgetItems for index vector"""
-        col = 0
-        for item in self.ivTable:
-            item.setText("")
-            col += 1
+        """Empty the table for index vector"""
+        self.ivModel.clear()
 
     def resetMCompTable(self):
-        """Empty all the TableWidgetItems for modal complements"""
-        for i in range(3):
-            for j in range(3):
-                self.mcompTable[i][j].setText("")
+        """Empty the table for modal complements"""
+        self.mcompModel.clear()
 
     def resetTn(self):
         """Resets the widgets and instance variable for Tn operation"""
@@ -837,37 +841,22 @@ class MainWindow(QtWidgets.QMainWindow):
         self.tni = []
 
     def resetTargetSCMenu(self):
-        """Add items to the combo box for inclusion target set classes"""
-        menu = self.ui.comboBoxTargetSCs
-        menu.clear()
-        for card in range(3, 10):
-            for ord_ in range(1, len(c.SN_VECS[card])):
-                sn = c.SN_VECS[card][ord_]
-                menu.addItem(sn)
-            menu.addItem("-"*15)
-            n = menu.count()
-            menu.model().item(n-1).setEnabled(False)
-        menu.removeItem(214)
+        """Reset the combo box for inclusion target set classes to the set names"""
+        self.targetSCMenuModel.reset()
+        self.ui.comboBoxTargetSCs.setCurrentIndex(0)
 
     def resetTargetSCMemberTable(self):
-        """Empty all the TableWidgetItems for target SC members"""
-        for row in range(20):
-            for col in range(5):
-                self.targetSCMemberTable[row][col].setText("")
+        """Remove all the target SC members from the table"""
+        self.targetSCMemberModel.clear()
 
     def resetMSCTables(self):
-        """Empty all the TableWidgetItems for MSC members"""
-        for card in ["3", "4", "6"]:
-            for row in range(7):
-                for col in range(4):
-                    self.mscTables[card][row][col].setText("")
-                if card != "3":
-                    self.mscTables[card][row][4].setText("")
+        """Empty the tables for MSC members"""
+        for model in self.mscModels.values():
+            model.clear()
 
     def resetCollectionPCs(self):
         """Resets the collection pc labels"""
-        for label in self.colLabelsInner + self.colLabelsOuter:
-            self.setStyleSheetColLabels(label, 0)
+        self.setCollectionPCs(0)
 
     # Operation methods -------------------------------------------------------
 
@@ -876,6 +865,7 @@ class MainWindow(QtWidgets.QMainWindow):
         Undoes the previous operation: change the current pcset to that
         at the index 0 in the undo stack.
         """
+        self.updateScheduler.flush()
         if len(self.undoStack) != 0:
             self.redoStack.insert(0, self.pcset)
             self.updatePCSet(self.undoStack.pop(0), archive=False)
@@ -885,6 +875,7 @@ class MainWindow(QtWidgets.QMainWindow):
         Redoes the previously undone operation: change to the current pcset
         to that at the last index in the redo stack.
         """
+        self.updateScheduler.flush()
         if len(self.redoStack) != 0:
             self.undoStack.insert(0, self.pcset)
             self.updatePCSet(self.redoStack.pop(0), archive=False)
@@ -902,8 +893,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.tn = []
             self.ui.lineEditTn.clear()
         else:
-            copy = self.pcset.clone()
-            self.tn = copy.opT(n).normalForm()
+            self.tn = self.pcset.opT(n).normalForm()
             s = ",".join(str(pc) for pc in self.tn)
             self.ui.lineEditTn.setText(s)
 
@@ -918,8 +908,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if (n == -1) or (self.card == 0):
             self.ui.lineEditTnI.clear()
         else:
-            copy = self.pcset.clone()
-            self.tni = copy.opTnI(n).normalForm()
+            self.tni = self.pcset.opTnI(n).normalForm()
             s = ",".join(str(pc) for pc in self.tni)
             self.ui.lineEditTnI.setText(s)
 
@@ -936,35 +925,13 @@ class MainWindow(QtWidgets.QMainWindow):
         sn = self.ui.comboBoxTargetSCs.currentText()
         if (sn[0] != "-") and (sn[0] != str(self.card)) and (
                 1 <= self.card <= 11):
-            self.resetTargetSCMemberTable()
             sn = str(sn).split()[0]
-            pf = fromPFStr(catalog["SC"][sn]["PF"])
-            members = []
-            if len(pf) < self.card:
-                members = self.pcset.inclusion(pf)
-            elif len(pf) > self.card:
-                members = self.pcset.complementation(pf)
+            pf = self.catalog.primeForm(self.catalog.index(sn))
             # members is a variable for the target SC members: it is a list
-            # of tuples, each tuple contains two sets ({memberPCs}, {diffPCs}).
-            if members:
-                row = 0
-                for member, diff in members:
-                    m, d = Pcset(member), Pcset(diff)
-                    memberNF = ",".join(str(pc) for pc in m.normalForm())
-                    memberLvl = MainWindow.transformationLevel(m)
-                    memberMA = " ".join(self.modalAttributes(m))
-                    diffNF = ",".join(str(pc) for pc in d.normalForm())
-                    if len(d) < 3:
-                        diffInfo = ""
-                    else:
-                        diffInfo = self.setSummary(d)
-                    # tableRow = [incl/comp, Tn/TnI, MA, diff, diffInfo]
-                    self.targetSCMemberTable[row][0].setText(memberNF)
-                    self.targetSCMemberTable[row][1].setText(memberLvl)
-                    self.targetSCMemberTable[row][2].setText(memberMA)
-                    self.targetSCMemberTable[row][3].setText(diffNF)
-                    self.targetSCMemberTable[row][4].setText(diffInfo)
-                    row += 1
+            # of tuples, each tuple contains two bitmasks (memberPCs, diffPCs).
+            # The model formats the rows when they are shown.
+            members = self.inclusionIndex.members(self.pcset.mask, pf)
+            self.targetSCMemberModel.setMembers(members)
 
     def changeToTargetSCMember(self, n):
         """
@@ -973,10 +940,9 @@ class MainWindow(QtWidgets.QMainWindow):
 
         :param n: an int for the clicked vertical header index.
         """
-        nfStr = str(self.targetSCMemberTable[n][0].text())
-        if nfStr:
-            nf = [int(i) for i in nfStr.split(",")]
-            self.updatePCSet(nf)
+        member = self.targetSCMemberModel.member(n)
+        if member is not None:
+            self.updatePCSet(self.profiles[member]["nf"])
 
     def findMSCSCMembers(self, table, row, col):
         """
@@ -987,9 +953,8 @@ class MainWindow(QtWidgets.QMainWindow):
         :param row: an int for the row of the selected table cell.
         :param col: an int for the col of the selected table cell.
         """
-        item = table.item(row, 0)
-        sn = item.text()
-        if self.card != 0 and self.card != int(sn[0]):
+        sn = table.model().text(row, 0)
+        if sn and self.card != 0 and self.card != int(sn[0]):
             index = self.ui.comboBoxTargetSCs.findText(sn,
                                                        QtCore.Qt.MatchFlag.MatchContains)
             self.ui.comboBoxTargetSCs.setCurrentIndex(index)
@@ -1011,12 +976,17 @@ class ConnectionDialog(QtWidgets.QDialog):
         self.MIDIInPortIndex = 0
         self.UDPPortIndex = 0
         # Populate MIDI input ports in the menu
-        for device in midiInPorts:
-            self.ui.comboBoxMIDIInPort.addItem(device)
+        self.setMIDIInPorts(midiInPorts)
         # Signal-slot connections
         self.ui.buttonBox.accepted.connect(self.accept)
         self.ui.buttonBox.rejected.connect(self.reject)
 
+    def setMIDIInPorts(self, midiInPorts):
+        """Replaces the items of the MIDI input port menu with midiInPorts"""
+        self.ui.comboBoxMIDIInPort.clear()
+        for device in midiInPorts:
+            self.ui.comboBoxMIDIInPort.addItem(device)
+
     def setMIDIInPortMenu(self, n):
         """Sets the MIDI input port menu to the index n"""
         self.MIDIInPortIndex = n
@@ -1048,63 +1018,362 @@ class ConnectionDialog(QtWidgets.QDialog):
         self.hide()
 
 
+class StageTimingsDialog(QtWidgets.QDialog):
+    """
+    A dialog object showing the rolling percentiles of the compute and
+    render stages, with the export of the stages as Chrome trace JSON.
+    """
+
+    def __init__(self, timer, tracer, scheduler, midi, parent=None):
+        """
+        :param timer: a StageTimer object for the stages of MainWindow.
+        :param tracer: a LatencyTracer object for MIDI input.
+        :param scheduler: an UpdateScheduler object for the pc input.
+        :param midi: a WorkerMIDI object for the message rates of the ports.
+        """
+        QtWidgets.QDialog.__init__(self, parent)
+        self.ui = Ui_StageTimingsDialog()
+        self.ui.setupUi(self)
+        self.timer = timer
+        self.tracer = tracer
+        self.scheduler = scheduler
+        self.midi = midi
+        # Refreshes the table while the dialog is shown
+        self.refreshTimer = QtCore.QTimer(self)
+        self.refreshTimer.setInterval(STAGE_TIMINGS_REFRESH_INTERVAL)
+        # Signal-slot connections
+        self.refreshTimer.timeout.connect(self.refresh)
+        self.ui.checkBoxRecord.toggled.connect(self.setRecording)
+        self.ui.checkBoxLatency.toggled.connect(self.tracer.setEnabled)
+        self.ui.btnExportLatency.released.connect(self.exportLatency)
+        self.ui.btnReset.released.connect(self.reset)
+        self.ui.btnExport.released.connect(self.exportTrace)
+        self.ui.btnClose.released.connect(self.hide)
+
+    def showEvent(self, event):
+        self.ui.checkBoxRecord.setChecked(self.timer.enabled)
+        self.ui.checkBoxLatency.setChecked(self.tracer.enabled)
+        self.refresh()
+        self.refreshTimer.start()
+        QtWidgets.QDialog.showEvent(self, event)
+
+    def hideEvent(self, event):
+        self.refreshTimer.stop()
+        QtWidgets.QDialog.hideEvent(self, event)
+
+    def setRecording(self, state):
+        """Starts/stops recording the stages"""
+        self.timer.enabled = state
+
+    def reset(self):
+        """Discards the recorded stages, the latency histogram and the update counts"""
+        self.timer.reset()
+        self.tracer.reset()
+        self.scheduler.resetCounts()
+        self.refresh()
+
+    def refresh(self):
+        """Shows the statistics of the recorded stages in the table"""
+        table = self.ui.tableStages
+        rows = self.timer.stats()
+        table.setRowCount(len(rows))
+        for row, stats in enumerate(rows):
+            texts = [stats[0], str(stats[1])] + ["{:.3f}".format(ms) for ms in stats[2:]]
+            for col, text in enumerate(texts):
+                item = table.item(row, col)
+                if item is None:
+                    item = QtWidgets.QTableWidgetItem()
+                    if col > 0:
+                        item.setTextAlignment(QtCore.Qt.AlignmentFlag.AlignRight |
+                                              QtCore.Qt.AlignmentFlag.AlignVCenter)
+                    table.setItem(row, col, item)
+                item.setText(text)
+        scheduler = self.scheduler
+        if scheduler.inputs:
+            self.ui.labelUpdates.setText("{} pc inputs in {} updates ({} coalesced)".format(
+                scheduler.inputs, scheduler.updates, scheduler.coalesced()))
+        else:
+            self.ui.labelUpdates.setText("No pc input")
+        rates = self.midi.messageRates()
+        if rates:
+            self.ui.labelMIDIInput.setText("MIDI input: " + ", ".join(
+                "{} {:.1f} msg/s".format(name, rate) for name, rate in rates.items()))
+        else:
+            self.ui.labelMIDIInput.setText("No MIDI input port")
+
+    def exportTrace(self):
+        """Exports the recorded stages to a Chrome trace JSON file"""
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Export Chrome Trace", "trace.json",
+                                                        "JSON (*.json)")
+        if path:
+            n = self.timer.exportChromeTrace(path)
+            print("Exported {} trace events to {}".format(n, path))
+
+    def exportLatency(self):
+        """Exports the MIDI-to-display latency histogram to a JSON file"""
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(self, "Export Latency Histogram",
+                                                        "midi_latency.json", "JSON (*.json)")
+        if path:
+            self.tracer.writeReport(path)
+            print("Exported the latency of {} messages to {}".format(self.tracer.count, path))
+
+
+class UpdateScheduler(QtCore.QObject):
+    """
+    Coalesces bursts of pc input into a single update: the first pending
+    input starts a single-shot timer, and the update runs when the timer
+    fires. With an interval of 0 ms, the update runs once the input already
+    queued in the event loop (e.g., all the notes of a MIDI chord) has been
+    received; a longer interval (e.g., 16 ms for a 60 Hz frame) also
+    coalesces input spread over the interval.
+    """
+
+    def __init__(self, interval, callback, parent=None):
+        """
+        :param interval: an int for the coalescing window (ms).
+        :param callback: a callable that applies the pending input.
+        """
+        QtCore.QObject.__init__(self, parent)
+        self.callback = callback
+        self.pending = 0  # Number of the pending inputs
+        self.inputs = 0   # Number of the scheduled inputs
+        self.updates = 0  # Number of the updates
+        self.timer = QtCore.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.flush)
+
+    def schedule(self):
+        """Adds an input to the next update"""
+        self.pending += 1
+        self.inputs += 1
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def flush(self):
+        """Applies the pending input now, if any"""
+        self.timer.stop()
+        if self.pending:
+            self.pending = 0
+            self.updates += 1
+            self.callback()
+
+    def coalesced(self):
+        """Returns an int for the number of the inputs that did not need an update of their own"""
+        return self.inputs - self.updates - self.pending
+
+    def resetCounts(self):
+        """Resets the input and update counts"""
+        self.inputs = self.pending
+        self.updates = 0
+
+
 class WorkerMIDI(QtCore.QThread):
     """
     Class to handle real-time MIDI inputs (i.e., notes and damper).
-    Input channel is fixed to ch. 1.
+
+    The messages of all the channels of one or more input ports are merged
+    into a single set of sounding pcs (see MIDIMerger), with the notes and
+    the sustain pedal of each channel of each port tracked on their own.
+    The channels of a port can be limited with setChannels().
+
+    In the callback mode, the MIDI messages are processed as they are
+    delivered, in the callback thread of rtmidi, and the thread only opens
+    MIDI input with deferred startup. In the poll mode, the thread polls
+    the messages of all the ports every MIDI_MESSAGE_POLL_INTERVAL ms.
+    Either way, stop() stops the input.
+
+    Each pc state change is emitted by message, and the whole set of the
+    sounding pcs by maskChanged, once per delivered message or poll if it
+    changed.
 
     Sustain is a non-public feature which I personally use with cc 11 with
     reversed values (i.e., pedal completely off = 127, on = 0).
     """
 
-    # Custom Qt signal
+    # Custom Qt signals
     message = QtCore.pyqtSignal(int, bool)
+    maskChanged = QtCore.pyqtSignal(int)  # Bitmask of the sounding pcs, once per batch of messages
+    opened = QtCore.pyqtSignal()  # MIDI input opened by run()
 
-    def __init__(self, parent=None):
+    def __init__(self, inputPorts=(0,), syntheticRate=0, mode="callback", channels=None, parent=None):
+        """
+        :param inputPorts: an iterable of ints for the MIDI input ports.
+        :param syntheticRate: a float for the messages per second of a
+            synthetic source that replaces MIDI input (see SyntheticMIDIIn),
+            or 0 for MIDI input.
+        :param mode: a str for the input mode, "callback" or "poll" (see
+            MIDI_INPUT_MODES).
+        :param channels: a dict of lists of ints (1-16) for the accepted
+            channels by port, or None. The ports not in it accept all the
+            channels.
+        """
         QtCore.QThread.__init__(self, parent)
-        self.pitchStates = [False] * 127
-        self.midiin = rtmidi.MidiIn()  # Create a MidiIn object
-        self.ports = self.midiin.get_ports()  # Get MIDI input ports
-
-    def setInputPort(self, n):
-        """"Sets MIDI input device"""
-        self.midiin.close_port()
+        if mode not in MIDI_INPUT_MODES:
+            print(f"Unknown MIDI input mode {mode!r}: using callback")
+            mode = "callback"
+        self.merger = MIDIMerger(self.emitMessage)  # Note and sustain states by port and channel
+        for port, portChannels in (channels or {}).items():
+            self.merger.setChannels(port, portChannels)
+        self.inputPorts = list(inputPorts)
+        self.syntheticRate = syntheticRate
+        self.mode = mode
+        self.midiins = None  # key=port, val=MidiIn object of the open port, created by openInput()
+        self.ports = []      # MIDI input ports
+        self.openTime = 0.0  # Time spent in openInput() (s)
+        self.tracer = None   # LatencyTracer object
+        self.messageTimes = (0, 0)  # Arrival and poll times (ns) of the message being processed
+        self.lock = threading.Lock()  # Serializes the merger between the callback threads of the ports
+        self.stopEvent = threading.Event()  # Set by stop() to end the polling loop
+
+    def createMidiIn(self):
+        """Returns a MidiIn object, or a SyntheticMIDIIn object with a synthetic source"""
+        if self.syntheticRate > 0:
+            return SyntheticMIDIIn(self.syntheticRate)
+        import rtmidi
+        return rtmidi.MidiIn()
+
+    def openInput(self):
+        """
+        Lists the MIDI input ports and opens the input ports. rtmidi is
+        imported here, so that it is not loaded before the window is shown
+        with deferred startup.
+        """
+        start = time.perf_counter()
+        if self.midiins is not None:
+            self.closeInputs()
+        self.midiins = {}
+        self.ports = self.createMidiIn().get_ports()  # Get MIDI input ports
+        self.setInputPorts(self.inputPorts)
+        self.openTime = time.perf_counter() - start
+
+    def closeInput(self, port):
+        """Cancels the callback and closes an input port, and releases its notes"""
+        midiin = self.midiins.pop(port)
+        if self.mode == "callback":
+            midiin.cancel_callback()
+        midiin.close_port()
+        with self.lock:
+            self.merger.removePort(port)
+
+    def closeInputs(self):
+        """Closes all the input ports"""
+        for port in list(self.midiins):
+            self.closeInput(port)
+
+    def setInputPorts(self, ports):
+        """"Sets MIDI input devices: closes the ports not in ports, and opens the new ones"""
+        self.inputPorts = list(ports)
+        if self.midiins is None:
+            return  # The ports are opened by openInput()
+        for port in list(self.midiins):
+            if port not in self.inputPorts:
+                self.closeInput(port)
         if not self.ports:
             print("There is no MIDI input device connected.")
             return
-        self.midiin.open_port(n)
-        print(f"Set MIDI input port to {self.ports[n]}")
+        for port in self.inputPorts:
+            if port in self.midiins:
+                continue
+            if not 0 <= port < len(self.ports):
+                print(f"There is no MIDI input port {port}.")
+                continue
+            midiin = self.createMidiIn()
+            midiin.open_port(port)
+            if self.mode == "callback":
+                midiin.set_callback(self.messageDelivered, port)
+            self.midiins[port] = midiin
+            print(f"Set MIDI input port to {self.ports[port]}")
+
+    def setChannels(self, port, channels):
+        """
+        Limits the MIDI input of a port to some channels.
+
+        :param port: an int for the port.
+        :param channels: an iterable of ints (1-16) for the channels, or
+            None for all the channels.
+        """
+        with self.lock:
+            self.merger.setChannels(port, channels)
 
     def getInputPorts(self):
         """Returns available MIDI input ports"""
         return self.ports
 
-    def checkPCMembers(self, pitch):
-        """
-        Check the presence of the pc members of the pitch.
+    def soundingMask(self):
+        """Returns an int for the bitmask of the pcs sounding in MIDI input"""
+        with self.lock:
+            return self.merger.mask
 
-        :param pitch: an int for pitch.
-        """
-        pc = pitch % 12
-        pitches = {12 * octave + pc for octave in range(10)}
-        pitches -= {pitch}  # All the pc members of the pitch but itself
-        state = False
-        for p in pitches:
-            state += self.pitchStates[p]
-        return state
+    def messageRates(self):
+        """Returns a dict of the messages per second by open port name since the previous call"""
+        with self.lock:
+            rates = self.merger.messageRates()
+        return {self.ports[port]: rates.get(port, 0.0) for port in sorted(self.midiins or {})}
 
-    def setStates(self, pitch, state):
+    def emitMessage(self, pc, state):
+        """Emits a pc state change, and reports it to the latency tracer"""
+        if self.tracer is not None and self.tracer.enabled:
+            self.tracer.emitted(pc, state, *self.messageTimes)
+        self.message.emit(pc, state)
+
+    def messageDelivered(self, event, port):
         """
-        Sets the pitch state in this class, and pc state in MainWindow() class.
-        The method does not execute the change of pc state, if any other pc members
-        of the pitch is present. This will avoid unnecessary consumption of CPU power.
+        Callback of the MidiIn objects in the callback mode, called in
+        their own threads for every MIDI message as it is delivered.
 
-        :param pitch: an int for the pitch.
-        :param state: a bool for the states.
+        :param event: a tuple ([status, data1, data2], delta time (s)).
+        :param port: an int for the port of the message (data of the callback).
         """
-        self.pitchStates[pitch] = state
-        if not self.checkPCMembers(pitch):
-            self.message.emit(pitch % 12, state)
+        with self.lock:
+            if self.tracer is not None and self.tracer.enabled:
+                # The message is delivered as it arrives: there is no poll
+                delivery = time.perf_counter_ns()
+                midiin = self.midiins.get(port)
+                self.messageTimes = (getattr(midiin, "lastArrival", None) or delivery, delivery)
+            mask = self.merger.mask
+            self.merger.processMessage(port, event[0])
+            if self.merger.mask != mask:
+                self.maskChanged.emit(self.merger.mask)
+
+    def pollMessages(self):
+        """Processes the MIDI messages of all the ports buffered since the last poll"""
+        events = []    # (port, [status, data1, data2])
+        arrivals = []  # Arrival times (ns) of the events, when latency is traced
+        tracing = self.tracer is not None and self.tracer.enabled
+        # Consolidate all the event data from the ring buffers
+        for port, midiin in list(self.midiins.items()):
+            while True:
+                poll = midiin.get_message()  # poll = ([message], deltaTime)
+                if poll is None:
+                    break
+                events.append((port, poll[0]))
+                if tracing:
+                    # rtmidi does not give the arrival time: use the poll time
+                    arrivals.append(getattr(midiin, "lastArrival", None) or time.perf_counter_ns())
+        if not events:
+            return
+        pollTime = time.perf_counter_ns()
+        # Iterate through events (see NoteTracker for the note and sustain rules)
+        with self.lock:
+            merger = self.merger
+            if not tracing:
+                changed = merger.processMessages(events)
+            else:
+                mask = merger.mask
+                for i, (port, msg) in enumerate(events):
+                    self.messageTimes = (arrivals[i], pollTime)
+                    merger.processMessage(port, msg)
+                changed = merger.mask != mask
+            if changed:
+                self.maskChanged.emit(merger.mask)
+
+    def stop(self):
+        """Stops MIDI input: ends the polling loop and closes the input ports"""
+        self.stopEvent.set()
+        self.wait()
+        if self.midiins is not None:
+            self.closeInputs()
 
     def run(self):
         """
@@ -1112,59 +1381,52 @@ class WorkerMIDI(QtCore.QThread):
         Update of the instance variable, pcset, in the main thread MainWindow()
         object is made through the custom Qt signal defined here.
         """
-        noteOffs = set([])    # Pitches for suspended note-off messages
-        sustainState = False  # Damper pedal (sustain) status
-        # MIDI event loop
-        while True:
-            events = []
-            # Consolidate all the event data from the ring buffer
-            while True:
-                poll = self.midiin.get_message()  # poll = ([message], deltaTime)
-                if poll is None:
-                    break
-                events.append(poll[0])
-            # Iterate through events
-            if events:
-                for msg in events:  # msg = [status, data1, data2]
-                    # Sustain input
-                    if msg[0] == STATUS_BYTE_CONTROL_CHANGE and msg[1] == CC_SUSTAIN:
-                        prev, current = sustainState, bool(msg[2] < SUSTAIN_THRESH)
-                        # Release the buffered note-offs if sustain state changes from True to False
-                        if prev and not current:
-                            for pitch in noteOffs:
-                                self.setStates(pitch, False)
-                            noteOffs.clear()
-                        sustainState = current  # Update sustain state
-                    # Note input
-                    if msg[0] == STATUS_BYTE_NOTE_ON:
-                        pitch, state = msg[1], bool(msg[2])
-                        # Note on
-                        if state:
-                            self.setStates(pitch, True)
-                        # Note off
-                        else:
-                            # Catch and buffer note-off messages if sustainState is True
-                            if sustainState:
-                                noteOffs |= {pitch}
-                            else:
-                                self.setStates(pitch, False)
-            # Process buffered MIDI messages at every MIDI_MESSAGE_POLL_INTERVAL ms
-            self.msleep(MIDI_MESSAGE_POLL_INTERVAL)
+        if self.midiins is None:
+            # Deferred startup: open MIDI input in this thread
+            self.openInput()
+            self.opened.emit()
+        if self.mode == "callback":
+            return  # The messages are processed by messageDelivered()
+        # MIDI event loop: process buffered MIDI messages at every MIDI_MESSAGE_POLL_INTERVAL ms
+        while not self.stopEvent.is_set():
+            self.pollMessages()
+            self.stopEvent.wait(MIDI_MESSAGE_POLL_INTERVAL / 1000)
 
 
 class WorkerOSC(QtCore.QThread):
     """Class to handle OSC message for pc input."""
 
-    # Custom Qt signal
+    # Custom Qt signals
     message = QtCore.pyqtSignal(set)
+    opened = QtCore.pyqtSignal()  # OSC server opened by run()
 
     def __init__(self, udpPort, parent=None):
         QtCore.QThread.__init__(self, parent)
-        print("Starting OSC server (receive at port {})...".format(udpPort))
+        self.udpPort = udpPort
+        self.server = None   # OSCThreadServer object, created by openServer()
+        self.socket = None
+        self.openTime = 0.0  # Time spent in openServer() (s)
+
+    def openServer(self):
+        """
+        Starts the OSC server. oscpy is imported here, so that it is not
+        loaded before the window is shown with deferred startup.
+        """
+        start = time.perf_counter()
+        from oscpy.server import OSCThreadServer
+        print("Starting OSC server (receive at port {})...".format(self.udpPort))
         self.server = OSCThreadServer()
         self.socket = self.server.listen(address=SERVER_ADDRESS,
-                                         port=udpPort, default=True)
+                                         port=self.udpPort, default=True)
         self.server.bind(OSC_ADDRESS, self.noteHandler)
+        self.openTime = time.perf_counter() - start
+
+    def run(self):
+        """Opens the OSC server with deferred startup, and runs the event loop"""
+        if self.server is None:
+            self.openServer()
+            self.opened.emit()
+        self.exec()
 
     def noteHandler(self, *data):
         """
@@ -1177,11 +1439,16 @@ class WorkerOSC(QtCore.QThread):
 
     def close(self):
         """Closes the server socket"""
+        if self.server is None:
+            return
         print("Closing OSC server...")
         self.server.stop(self.socket)
 
     def changePort(self, newPort):
         """Change the server port to a newPort."""
+        if self.server is None:
+            self.udpPort = newPort  # The port is opened by openServer()
+            return
         # Close port
         self.server.stop(self.socket)
         # Terminate the entire server
@@ -1191,20 +1458,39 @@ class WorkerOSC(QtCore.QThread):
         self.server.join_server()
         # Wait for the server to close
         time.sleep(0.1)
-        # Reinitialize the server
-        self.server = OSCThreadServer()
-        # Listen on the new port
-        self.socket = self.server.listen(address=SERVER_ADDRESS,
-                                         port=newPort, default=True)
-        # Re-bind the server to handle incoming OSC messages
-        self.server.bind(OSC_ADDRESS, self.noteHandler)
+        # Reinitialize the server on the new port
+        self.udpPort = newPort
+        self.openServer()
+
+
+class WorkerCatalog(QtCore.QThread):
+    """Class to load the set-class catalog and the profile table in the background."""
+
+    # Custom Qt signal: catalog, profile table, time spent (s)
+    loaded = QtCore.pyqtSignal(object, object, float)
+
+    def run(self):
+        start = time.perf_counter()
+        catalog = defaultCatalog()
+        profiles = defaultProfileTable()
+        self.loaded.emit(catalog, profiles, time.perf_counter() - start)
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        # Headless batch profiling (see pcsetcalc_batch.py)
+        from pcsetcalc_batch import main
+        sys.exit(main(sys.argv[2:], prog="pcsetcalc_app.py batch"))
+    if len(sys.argv) > 1 and sys.argv[1] == "analyze":
+        # Offline MIDI file corpus analysis (see pcsetcalc_analyze.py)
+        from pcsetcalc_analyze import main
+        sys.exit(main(sys.argv[2:], prog="pcsetcalc_app.py analyze"))
     app = QtWidgets.QApplication(sys.argv)
     form = MainWindow()
-    form.startWorkerMIDI()
-    form.startWorkerOSC()
+    if not form.deferredStartup:
+        form.startWorkerMIDI()
+        form.startWorkerOSC()
     form.show()
     app.aboutToQuit.connect(form.closeServerSocket)
+    app.aboutToQuit.connect(form.threadMIDI.stop)
     sys.exit(app.exec())
@@ -0,0 +1,248 @@
+# pcsetcalc_batch.py
+
+"""
+Headless batch profiling of pcset lists.
+
+Reads a file with one pcset per line, either in normal-form notation
+(pcs separated by commas or spaces, e.g., "11,0,4") or in prime-form
+string notation (see pcpy.query.fromPFStr(), e.g., "014T"), and writes
+the profile of every set as JSONL or CSV with the same fields as
+MainWindow.updateProfile(). Blank lines and lines starting with "#" are
+skipped.
+
+A line without commas or spaces is a prime-form string, so pcs 10 and 11
+are T and E in it (e.g., "01" is the dyad {0, 1}). The lines "10" and
+"11", which would be a single pc in normal-form notation, are rejected as
+ambiguous: write "T" or "10," instead.
+
+The input is streamed in chunks that are spread over a process pool, and
+only a bounded number of chunks are in flight at a time, so memory use
+stays flat regardless of the length of the input.
+
+Usage:
+    python pcsetcalc_batch.py sets.txt -o profiles.jsonl
+    python pcsetcalc_app.py batch sets.txt -o profiles.jsonl
+    python pcsetcalc_batch.py sets.txt --format csv --workers 8 > profiles.csv
+    cat sets.txt | python pcsetcalc_batch.py - > profiles.jsonl
+"""
+
+import sys
+import io
+import os
+import csv
+import json
+import time
+import argparse
+import multiprocessing
+from collections import deque
+from pcsetcalc_catalog import toPFStr
+from pcsetcalc_engine import toMask, defaultProfileTable
+
+FIELDS = ["card", "nf", "pf", "sn", "lvl", "matts", "icv", "iv",
+          "lcomp", "acomp", "zcorr", "mcomps", "summary"]
+CHUNK_SIZE = 10000        # Lines per task sent to a worker process
+PROGRESS_INTERVAL = 5.0   # Seconds between progress reports
+PF_CHARS = "0123456789TE"
+
+_formatted = {"jsonl": {}, "csv": {}}  # key=format, val={bitmask: formatted fields}
+
+
+def parseSet(text):
+    """
+    :param text: a str for a pcset in normal-form or prime-form string notation.
+    :return: an int for the bitmask of the set.
+    :raise ValueError: if the text is not a pcset.
+
+    >>> parseSet("01") == toMask([0, 1])
+    True
+    >>> parseSet("11")
+    Traceback (most recent call last):
+    ...
+    ValueError: ambiguous pcset '11': use T/E for pcs 10/11, or a comma
+    """
+    text = text.strip()
+    if "," in text or " " in text:
+        pcs = [int(pc) for pc in text.replace(",", " ").split()]
+    else:
+        if any(ch not in PF_CHARS for ch in text):
+            raise ValueError("invalid pc in {!r}".format(text))
+        if text in ("10", "11"):
+            raise ValueError("ambiguous pcset {!r}: use T/E for pcs 10/11, or a comma".format(text))
+        pcs = [PF_CHARS.index(ch) for ch in text]
+    if any(not (0 <= pc <= 11) for pc in pcs):
+        raise ValueError("pcs must be between 0 and 11 in {!r}".format(text))
+    return toMask(pcs)
+
+
+def jsonFields(profile):
+    """Returns a JSON object str for the profile fields of a set."""
+    record = {field: profile[field] for field in FIELDS}
+    record["mcomps"] = {name: sorted(pcs) for name, pcs in profile["mcomps"].items()}
+    return json.dumps(record, separators=(",", ":"))
+
+
+def csvFields(profile):
+    """Returns a list of strs for the profile fields of a set, formatted as in the display."""
+    return [
+        profile["card"],
+        ",".join(str(pc) for pc in profile["nf"]),
+        toPFStr(profile["pf"]),
+        profile["sn"],
+        profile["lvl"],
+        " ".join(profile["matts"]),
+        "".join(str(ic) for ic in profile["icv"]),
+        " ".join(str(i) for i in profile["iv"]).strip(),
+        ",".join(str(pc) for pc in profile["lcomp"]),
+        toPFStr(profile["acomp"]),
+        profile["zcorr"],
+        " ".join("{}:{}".format(name, ",".join(str(pc) for pc in sorted(pcs)))
+                 for name, pcs in profile["mcomps"].items()),
+        profile["summary"],
+    ]
+
+
+def profileChunk(task):
+    """
+    Worker process task: profiles a chunk of input lines.
+
+    :param task: a tuple (fmt, firstLineNumber, lines).
+    :return: a tuple (output, count, errors) where output is a str with the
+        formatted records, count is the number of profiled sets and errors
+        is a list of error messages.
+    """
+    fmt, lineNum, lines = task
+    profiles = defaultProfileTable().profiles
+    # There are only 4096 pcsets, so each set is formatted once per process
+    formatted = _formatted[fmt]
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n") if fmt == "csv" else None
+    count = 0
+    errors = []
+    for i, line in enumerate(lines, lineNum):
+        text = line.strip()
+        if not text or text.startswith("#"):
+            continue
+        try:
+            mask = parseSet(text)
+        except ValueError as e:
+            errors.append("line {}: {}".format(i, e))
+            continue
+        fields = formatted.get(mask)
+        if writer is None:
+            if fields is None:
+                fields = formatted[mask] = jsonFields(profiles[mask])
+            out.write('{"input":')
+            out.write(json.dumps(text))
+            out.write(",")
+            out.write(fields[1:])
+            out.write("\n")
+        else:
+            if fields is None:
+                fields = formatted[mask] = csvFields(profiles[mask])
+            writer.writerow([text] + fields)
+        count += 1
+    return out.getvalue(), count, errors
+
+
+def readChunks(infile, fmt, chunkSize):
+    """Yields tasks for profileChunk() with chunkSize lines each."""
+    lineNum = 1
+    chunk = []
+    for line in infile:
+        chunk.append(line)
+        if len(chunk) >= chunkSize:
+            yield fmt, lineNum, chunk
+            lineNum += len(chunk)
+            chunk = []
+    if chunk:
+        yield fmt, lineNum, chunk
+
+
+def run(infile, outfile, fmt="jsonl", workers=None, chunkSize=CHUNK_SIZE, report=sys.stderr):
+    """
+    Profiles every pcset of infile and writes the records to outfile.
+
+    :param infile: a text file object with one pcset per line.
+    :param outfile: a text file object for the output.
+    :param fmt: a str for the output format, "jsonl" or "csv".
+    :param workers: an int for the number of worker processes: the number
+        of CPUs if None, and no process pool if 1.
+    :param chunkSize: an int for the number of lines per task.
+    :param report: a text file object for progress and throughput reports,
+        or None for no reports.
+    :return: a tuple (count, errors) for the numbers of profiled sets and
+        invalid lines.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    # Load the profile table before forking so that the workers share it
+    defaultProfileTable()
+    if fmt == "csv":
+        csv.writer(outfile, lineterminator="\n").writerow(["input"] + FIELDS)
+    count, errors = 0, 0
+    start = lastReport = time.perf_counter()
+
+    def write(result):
+        nonlocal count, errors, lastReport
+        output, n, messages = result
+        outfile.write(output)
+        count += n
+        errors += len(messages)
+        for message in messages:
+            if report is not None:
+                print(message, file=report)
+        now = time.perf_counter()
+        if report is not None and now - lastReport >= PROGRESS_INTERVAL:
+            print("{} sets ({:.0f} sets/s)".format(count, count / (now - start)), file=report)
+            lastReport = now
+
+    tasks = readChunks(infile, fmt, chunkSize)
+    if workers == 1:
+        for task in tasks:
+            write(profileChunk(task))
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            # Bound the chunks in flight so that the input is not read ahead
+            pending = deque()
+            for task in tasks:
+                pending.append(pool.apply_async(profileChunk, (task,)))
+                if len(pending) >= 2 * workers:
+                    write(pending.popleft().get())
+            while pending:
+                write(pending.popleft().get())
+    elapsed = time.perf_counter() - start
+    if report is not None:
+        print("Profiled {} sets in {:.2f} s ({:.0f} sets/s), {} invalid lines".format(
+            count, elapsed, count / elapsed if elapsed > 0 else 0, errors), file=report)
+    return count, errors
+
+
+def main(argv=None, prog=None):
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(prog=prog,
+                                     description="Profile a file of pcsets, one set per line.")
+    parser.add_argument("input", help="input file, or - for stdin")
+    parser.add_argument("-o", "--output", default="-", help="output file, or - for stdout (default)")
+    parser.add_argument("-f", "--format", choices=["jsonl", "csv"], default="jsonl",
+                        help="output format (default: jsonl)")
+    parser.add_argument("-w", "--workers", type=int, default=None,
+                        help="number of worker processes (default: number of CPUs)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE,
+                        help="lines per worker task (default: {})".format(CHUNK_SIZE))
+    parser.add_argument("-q", "--quiet", action="store_true", help="do not report throughput")
+    args = parser.parse_args(argv)
+    infile = sys.stdin if args.input == "-" else open(args.input, "r")
+    outfile = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    try:
+        run(infile, outfile, fmt=args.format, workers=args.workers,
+            chunkSize=args.chunk_size, report=None if args.quiet else sys.stderr)
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
+        if outfile is not sys.stdout:
+            outfile.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,354 @@
+# pcsetcalc_catalog.py
+
+"""
+Compiled binary set-class catalog.
+
+pcpy.query decodes its whole JSON catalog into nested dicts keyed by strs
+on import, so every process pays for parsing it and holds its own copy.
+This module compiles the same data once into a versioned binary file and
+memory-maps it: opening it only reads the header, lookups read the bytes
+they need, and processes that open the same file share its pages through
+the OS page cache.
+
+Set classes are indexed by ints (0 to 207) in the order of
+pcpy.constants.SN_VECS (i.e., by cardinality and then by ordinal number).
+The file is little-endian and laid out as:
+
+    header          magic, version, counts and section offsets
+    set classes     one fixed-size record per SC: prime form bitmask,
+                    cardinality, ordinal, Z-correspondent, modal attributes,
+                    symmetry, ICV and set name
+    set index       the SC of each of the 4096 pcsets by bitmask (-1 for
+                    cardinalities other than 3 to 9)
+    inclusion       nSC x nSC matrix of the inclusionTable counts
+    MSC index       for each nexus set, the range of its members in the MSC
+                    entries for each of cardinalities 3, 4 and 6
+    MSC entries     member SC and inclusion count
+
+The file is compiled from pcpy on the first run, and recompiled when its
+version does not match CATALOG_VERSION.
+"""
+
+import os
+import mmap
+import struct
+import pcpy.constants as c
+
+CATALOG_VERSION = 1   # Bump when the file layout changes
+CATALOG_MAGIC = b"PCSCAT\x00\x00"
+CATALOG_FILE = "catalog.bin"
+MA_SYMBOLS = ["O", "O'", "W", "W'", "H", "H'", "D"]  # Modal attribute flags, bit 0 first
+MSC_CARDS = (3, 4, 6)  # Cardinalities of the MSC members
+SET_COUNT = 4096       # Number of pcsets (2 ** 12)
+
+_HEADER = struct.Struct("<8sHHHH5I")  # magic, version, nSC, nNexus, nEntries, 5 offsets
+_SC_RECORD = struct.Struct("<HBBhBBB6B8sx")  # pf, card, ord, zcorr, ma, symT, symI, icv, sn
+_SET_INDEX = struct.Struct("<h")
+_MSC_INDEX = struct.Struct("<H6H")  # nexus, (start, count) for each of MSC_CARDS
+_MSC_ENTRY = struct.Struct("<HBx")  # member, inclusion
+
+_defaultCatalog = None  # Shared BinaryCatalog
+
+
+def toPFStr(s):
+    """
+    Same as pcpy.query.toPFStr(), without importing pcpy.query (which loads
+    the JSON catalog): e.g., [0, 1, 3, 4, 6, 8, 10] to '013468T'.
+
+    :param s: an iterable of a prime form.
+    :return: a str of characters representing pcs is a prime form.
+    """
+    return "".join("T" if pc == 10 else "E" if pc == 11 else str(pc) for pc in s)
+
+
+def fromPFStr(s):
+    """
+    Same as pcpy.query.fromPFStr(), without importing pcpy.query: e.g.,
+    '013468T' to [0, 1, 3, 4, 6, 8, 10].
+
+    :param s: a str representing a prime form.
+    :return: a list representing the same prime form as the input.
+    """
+    return [10 if ch == "T" else 11 if ch == "E" else int(ch) for ch in s]
+
+
+class BinaryCatalog:
+    """
+    Read-only view of a compiled catalog file.
+
+    >>> cat = defaultCatalog()
+    >>> i = cat.index("4-Z15")
+    >>> cat.name(cat.zCorrespondent(i)), cat.modalAttributes(i)
+    ('4-Z29', ['O'])
+    """
+
+    def __init__(self, buffer):
+        """
+        :param buffer: a bytes-like object (e.g., mmap) with the catalog file contents.
+        :raise ValueError: if the buffer is not a catalog of this version.
+        """
+        self.buffer = buffer
+        if len(buffer) < _HEADER.size:
+            raise ValueError("Not a catalog file")
+        (magic, version, self.nSC, self.nNexus, nEntries, self.scOffset, self.setOffset,
+         self.inclOffset, self.mscIndexOffset, self.mscOffset) = _HEADER.unpack_from(buffer)
+        if magic != CATALOG_MAGIC or version != CATALOG_VERSION:
+            raise ValueError("Unsupported catalog version: {}".format(version))
+        if len(buffer) != self.mscOffset + nEntries * _MSC_ENTRY.size:
+            raise ValueError("Truncated catalog file")
+        self.names = []
+        self.cardRanges = {}  # key=card, val=(first index, last index + 1)
+        for i in range(self.nSC):
+            record = self._record(i)
+            self.names.append(record[-1])
+            first = self.cardRanges.get(record[1], (i, i))[0]
+            self.cardRanges[record[1]] = (first, i + 1)
+        self.indices = {sn: i for i, sn in enumerate(self.names)}
+
+    @classmethod
+    def open(cls, path):
+        """
+        Memory-maps a catalog file.
+
+        :param path: a str for the path of the catalog file.
+        :return: a BinaryCatalog object.
+        :raise ValueError: if the file is not a catalog of this version.
+        """
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            return cls(buffer)
+        except ValueError:
+            buffer.close()
+            raise
+
+    def close(self):
+        """Unmaps the file."""
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+
+    def __len__(self):
+        return self.nSC
+
+    def _record(self, i):
+        """Returns the fields of the SC record i, with the set name decoded."""
+        fields = _SC_RECORD.unpack_from(self.buffer, self.scOffset + i * _SC_RECORD.size)
+        return fields[:-1] + (fields[-1].rstrip(b"\x00").decode("ascii"),)
+
+    # Set class queries
+
+    def index(self, sn):
+        """
+        :param sn: a str for a set name (e.g., "6-Z10").
+        :return: an int for the index of the SC.
+        :raise KeyError: if there is no such SC.
+        """
+        return self.indices[sn]
+
+    def name(self, i):
+        """Returns a str for the set name of SC i."""
+        return self.names[i]
+
+    def primeMask(self, i):
+        """Returns an int for the bitmask of the prime form of SC i."""
+        return self._record(i)[0]
+
+    def primeForm(self, i):
+        """Returns a list of pcs for the prime form of SC i."""
+        mask = self.primeMask(i)
+        return [pc for pc in range(12) if mask >> pc & 1]
+
+    def cardinality(self, i):
+        """Returns an int for the cardinality of SC i."""
+        return self._record(i)[1]
+
+    def ordinal(self, i):
+        """Returns an int for the ordinal number of SC i among the SCs of its cardinality."""
+        return self._record(i)[2]
+
+    def zCorrespondent(self, i):
+        """Returns an int for the index of the Z-correspondent of SC i, or -1 if none."""
+        return self._record(i)[3]
+
+    def modalAttributes(self, i):
+        """Returns a list of strs for the modal attribute symbols of SC i (e.g., ["O'", "D"])."""
+        flags = self._record(i)[4]
+        return [symbol for bit, symbol in enumerate(MA_SYMBOLS) if flags >> bit & 1]
+
+    def symmetry(self, i):
+        """Returns a list of two ints for the degrees of Tn and TnI symmetry of SC i."""
+        return list(self._record(i)[5:7])
+
+    def icv(self, i):
+        """Returns a list of ints for the ICV of SC i."""
+        return list(self._record(i)[7:13])
+
+    def setClassOf(self, mask):
+        """
+        :param mask: an int for the bitmask of any pcset.
+        :return: an int for the index of the SC of the set, or -1 if its
+            cardinality is not between 3 and 9.
+        """
+        return _SET_INDEX.unpack_from(self.buffer, self.setOffset + mask * _SET_INDEX.size)[0]
+
+    # Inclusion and MSC queries
+
+    def inclusionCount(self, i, j):
+        """
+        :return: an int for the inclusionTable count of SC j for SC i:
+            the number of j included in i if j is smaller, or the number of
+            distinct j that include i if j is larger (0 if the same size).
+        """
+        return self.buffer[self.inclOffset + i * self.nSC + j]
+
+    def inclusionVector(self, i, card):
+        """
+        :param i: an int for the index of the SC.
+        :param card: an int for the cardinality of the target SCs.
+        :return: a list of ints for the inclusion vector of SC i at card,
+            in the order of the ordinal numbers (same as
+            catalog["inclusionTable"][sn][str(card)]).
+        """
+        first, last = self.cardRanges.get(card, (0, 0))
+        start = self.inclOffset + i * self.nSC
+        return list(self.buffer[start + first:start + last])
+
+    def nexusSets(self):
+        """Returns a list of ints for the indices of the MSC nexus sets."""
+        return [_MSC_INDEX.unpack_from(self.buffer, self.mscIndexOffset + k * _MSC_INDEX.size)[0]
+                for k in range(self.nNexus)]
+
+    def mscMembers(self, nexus, card):
+        """
+        :param nexus: an int for the index of a nexus set.
+        :param card: an int for the cardinality of the members (3, 4 or 6).
+        :return: a list of tuples (member, inclusion) for the indices of the
+            member SCs and their inclusion counts, in catalog order (empty
+            if nexus is not a nexus set).
+        """
+        slot = MSC_CARDS.index(card)
+        for k in range(self.nNexus):
+            fields = _MSC_INDEX.unpack_from(self.buffer, self.mscIndexOffset + k * _MSC_INDEX.size)
+            if fields[0] == nexus:
+                start, count = fields[1 + 2 * slot], fields[2 + 2 * slot]
+                return [_MSC_ENTRY.unpack_from(self.buffer, self.mscOffset + n * _MSC_ENTRY.size)
+                        for n in range(start, start + count)]
+        return []
+
+
+def compileCatalog():
+    """
+    Compiles the pcpy catalog into the binary catalog format.
+
+    :return: a bytes object with the catalog file contents.
+    """
+    from pcpy.pcset import Pcset
+    from pcpy.query import catalog
+    names = [sn for card in range(3, 10) for sn in c.SN_VECS[card][1:]]
+    indices = {sn: i for i, sn in enumerate(names)}
+    nSC = len(names)
+    # Set classes
+    records = bytearray()
+    for sn in names:
+        sc = catalog["SC"][sn]
+        pf = fromPFStr(sc["PF"])
+        card, ord_ = (int(part) for part in sn.replace("Z", "").split("-"))
+        zcorr = indices[sc["Z-corr"]] if sc["Z-corr"] is not None else -1
+        ma = sum(1 << MA_SYMBOLS.index(symbol) for symbol in sc["MA"])
+        records += _SC_RECORD.pack(sum(1 << pc for pc in pf), card, ord_, zcorr, ma,
+                                   *sc["symmetry"], *sc["ICV"], sn.encode("ascii"))
+    # SC of every pcset
+    pfIndices = {sum(1 << pc for pc in fromPFStr(catalog["SC"][sn]["PF"])): i
+                 for i, sn in enumerate(names)}
+    setIndex = bytearray()
+    for mask in range(SET_COUNT):
+        pcs = [pc for pc in range(12) if mask >> pc & 1]
+        if 3 <= len(pcs) <= 9:
+            i = pfIndices[sum(1 << pc for pc in Pcset(pcs).primeForm())]
+        else:
+            i = -1
+        setIndex += _SET_INDEX.pack(i)
+    # Inclusion table
+    inclusion = bytearray(nSC * nSC)
+    for i, sn in enumerate(names):
+        for card, vector in catalog["inclusionTable"][sn].items():
+            for ord_, count in enumerate(vector, 1):
+                inclusion[i * nSC + indices[c.SN_VECS[int(card)][ord_]]] = count
+    # Modal set complexes
+    mscIndex = bytearray()
+    mscEntries = bytearray()
+    nEntries = 0
+    for nexus, _ in c.NEXUS_SETS:
+        ranges = []
+        for card in MSC_CARDS:
+            members = catalog["MSC"][nexus][str(card)]
+            ranges += [nEntries, len(members)]
+            for member in members:
+                mscEntries += _MSC_ENTRY.pack(indices[member["SN"]], member["inclusion"])
+            nEntries += len(members)
+        mscIndex += _MSC_INDEX.pack(indices[nexus], *ranges)
+    # Sections follow the header in order
+    scOffset = _HEADER.size
+    setOffset = scOffset + len(records)
+    inclOffset = setOffset + len(setIndex)
+    mscIndexOffset = inclOffset + len(inclusion)
+    mscOffset = mscIndexOffset + len(mscIndex)
+    header = _HEADER.pack(CATALOG_MAGIC, CATALOG_VERSION, nSC, len(c.NEXUS_SETS), nEntries,
+                          scOffset, setOffset, inclOffset, mscIndexOffset, mscOffset)
+    return bytes(header + records + setIndex + inclusion + mscIndex + mscEntries)
+
+
+def saveCatalog(data, path):
+    """
+    Writes the catalog file contents under a temporary name and renames the
+    file, so processes that compile it at the same time never read a
+    partial file. The temporary file is removed if the write fails.
+
+    :param data: a bytes object returned by compileCatalog().
+    :param path: a str for the path of the catalog file.
+    """
+    tmpPath = "{}.{}.tmp".format(path, os.getpid())
+    try:
+        with open(tmpPath, "wb") as f:
+            f.write(data)
+        os.replace(tmpPath, path)
+    except BaseException:
+        # Do not leave a partial file behind (e.g., the disk is full)
+        try:
+            os.unlink(tmpPath)
+        except OSError:
+            pass
+        raise
+
+
+def loadCatalog(path):
+    """
+    Opens the catalog file, or compiles it first if the file is missing or
+    out of date.
+
+    :param path: a str for the path of the catalog file.
+    :return: a BinaryCatalog object.
+    """
+    if os.path.exists(path):
+        try:
+            return BinaryCatalog.open(path)
+        except (OSError, ValueError):
+            pass  # Recompile a broken or outdated file
+    data = compileCatalog()
+    try:
+        saveCatalog(data, path)
+        return BinaryCatalog.open(path)
+    except OSError:
+        return BinaryCatalog(data)  # The catalog still works from memory if the file is not writable
+
+
+def defaultCatalog():
+    """
+    Returns the catalog compiled next to this module, opening it on the
+    first call.
+    """
+    global _defaultCatalog
+    if _defaultCatalog is None:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), CATALOG_FILE)
+        _defaultCatalog = loadCatalog(path)
+    return _defaultCatalog
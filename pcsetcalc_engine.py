@@ -0,0 +1,755 @@
+# pcsetcalc_engine.py
+
+"""
+Set profile engine for PcsetCalc.
+
+This module holds the set profile queries and calculations of the
+application. It does not depend on Qt, so batch jobs and servers can use
+it without importing PyQt6 or building a window.
+
+There are only 4096 possible pcsets, so the profile of every set (the same
+fields MainWindow.updateProfile() shows) is computed once and stored in a
+table indexed by the 12-bit bitmask of the set, where bit n is set when
+pc n is a member. A profile update is then a single lookup.
+
+The table is built with pcpy and cached as a JSON file, so the cost of
+building it is paid only on the first run.
+
+Each profile is a dict with the keys:
+    card, nf, pf, sn, lvl, matts, icv, iv, lcomp, acomp, zcorr, mcomps, summary
+"""
+
+import os
+import json
+from itertools import combinations
+from pcpy.pcset import Pcset
+import pcpy.constants as c
+from pcsetcalc_catalog import defaultCatalog
+
+PROFILE_TABLE_VERSION = 1   # Bump when the layout of a profile changes
+PROFILE_TABLE_SIZE = 4096   # Number of pcsets (2 ** 12)
+PROFILE_TABLE_FILE = "profile_table.json"
+
+_defaultTable = None  # Shared ProfileTable for profileMany()
+
+
+# Bitmask conversion ----------------------------------------------------------
+
+def toMask(pcs):
+    """
+    :param pcs: an iterable with pcs.
+    :return: an int for the 12-bit bitmask of the pcs.
+    """
+    mask = 0
+    for pc in pcs:
+        mask |= 1 << (pc % 12)
+    return mask
+
+
+def fromMask(mask):
+    """
+    :param mask: an int for the 12-bit bitmask of a pcset.
+    :return: a list of the pcs in ascending order.
+    """
+    return [pc for pc in range(12) if mask >> pc & 1]
+
+
+# Compact pcset type ----------------------------------------------------------
+
+FULL_MASK = 0xFFF  # Bitmask of the aggregate
+
+# Bitmask of I(set) for every bitmask: pc n maps onto pc 12-n
+# (built from the set without its lowest pc, which is cheaper than converting every set)
+_INVERSIONS = [0] * PROFILE_TABLE_SIZE
+for _mask in range(1, PROFILE_TABLE_SIZE):
+    _low = _mask & -_mask
+    _INVERSIONS[_mask] = _INVERSIONS[_mask ^ _low] | 1 << (-(_low.bit_length() - 1) % 12)
+del _mask, _low
+
+
+class PcMask:
+    """
+    An immutable pcset backed by a single 12-bit int, for hot paths where
+    Pcset objects would be created and cloned on every update.
+
+    Membership and operations are bit operations, and every operation
+    returns a new object instead of mutating the current one, so PcMask
+    objects can be shared (e.g., in the undo stack) without copying.
+    Normal and prime forms are looked up in the default profile table.
+
+    Convert at the boundary with PcMask(pcsetObj) and toPcset().
+
+    >>> s = PcMask({0, 4, 7})
+    >>> s.opT(2).union({1}).normalForm()
+    [1, 2, 6, 9]
+    """
+
+    __slots__ = ("_mask",)
+
+    def __init__(self, pcs=()):
+        """Constructor takes an iterable with pcs (e.g., set, list, Pcset or PcMask)."""
+        if isinstance(pcs, PcMask):
+            mask = pcs._mask
+        else:
+            mask = toMask(pcs)
+        object.__setattr__(self, "_mask", mask)
+
+    @classmethod
+    def fromMask(cls, mask):
+        """Returns a PcMask object for the bitmask."""
+        obj = cls.__new__(cls)
+        object.__setattr__(obj, "_mask", mask & FULL_MASK)
+        return obj
+
+    def __setattr__(self, name, value):
+        raise AttributeError("PcMask objects are immutable")
+
+    @property
+    def mask(self):
+        """An int for the 12-bit bitmask of the set."""
+        return self._mask
+
+    def __iter__(self):
+        """Yields the pcs in ascending order."""
+        mask = self._mask
+        pc = 0
+        while mask:
+            if mask & 1:
+                yield pc
+            mask >>= 1
+            pc += 1
+
+    def __len__(self):
+        return bin(self._mask).count("1")
+
+    def __contains__(self, pc):
+        return 0 <= pc < 12 and bool(self._mask >> pc & 1)
+
+    def __eq__(self, other):
+        if isinstance(other, PcMask):
+            return self._mask == other._mask
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self._mask)
+
+    def __repr__(self):
+        return "PcMask({})".format(set(self))
+
+    def toPcset(self):
+        """Returns a Pcset object with the same pcs."""
+        return Pcset(self)
+
+    # PC membership methods
+
+    def union(self, pcs):
+        """Returns the set with the pcs added."""
+        return PcMask.fromMask(self._mask | _maskOf(pcs))
+
+    def difference(self, pcs):
+        """Returns the set with the pcs removed."""
+        return PcMask.fromMask(self._mask & ~_maskOf(pcs))
+
+    def intersection(self, pcs):
+        """Returns the set with only the pcs that are also in pcs."""
+        return PcMask.fromMask(self._mask & _maskOf(pcs))
+
+    def symmetricDifference(self, pcs):
+        """Returns the set with the pcs in either the set or pcs but not both."""
+        return PcMask.fromMask(self._mask ^ _maskOf(pcs))
+
+    def complement(self):
+        """Returns the literal complement of the set."""
+        return PcMask.fromMask(self._mask ^ FULL_MASK)
+
+    # Set transformation methods
+
+    def opT(self, n):
+        """Returns the Tn transformation of the set."""
+        return PcMask.fromMask(rotate(self._mask, n))
+
+    def opI(self):
+        """Returns the inversion of the set around pc 0."""
+        return PcMask.fromMask(_INVERSIONS[self._mask])
+
+    def opTnI(self, n):
+        """Returns the TnI transformation of the set: inversion followed by Tn."""
+        return self.opI().opT(n)
+
+    # Set profile methods
+
+    def normalForm(self):
+        """Returns a list of pcs representing the normal form."""
+        return defaultProfileTable()[self._mask]["nf"]
+
+    def primeForm(self):
+        """Returns a list of pcs representing the prime form."""
+        return defaultProfileTable()[self._mask]["pf"]
+
+
+def rotate(mask, n):
+    """
+    :param mask: an int for the 12-bit bitmask of a pcset.
+    :param n: an int for the transposition number.
+    :return: an int for the bitmask of the Tn transformation of the set.
+    """
+    n %= 12
+    return ((mask << n) | (mask >> (12 - n))) & FULL_MASK
+
+
+def _maskOf(pcs):
+    """Returns the bitmask of a PcMask object or an iterable with pcs."""
+    if isinstance(pcs, PcMask):
+        return pcs.mask
+    return toMask(pcs)
+
+
+# Set profile query and calculation functions ---------------------------------
+
+def setName(pcsetObj):
+    """
+    :param pcsetObj: a Pcset object for the input set.
+    :return: a str for the set name of pf.
+    """
+    if not (3 <= len(pcsetObj) <= 9):
+        return ""
+    else:
+        cat = defaultCatalog()
+        return cat.name(cat.setClassOf(toMask(pcsetObj)))
+
+
+def transformationLevel(pcsetObj):
+    """
+    :param pcsetObj: a Pcset object for the input set.
+    :return: a str for the most basic transformation level of the input set:
+        if it is a symmetrical set, the Tn level with the smallest transposition
+        number represents the transformation level.
+    """
+    if not (3 <= len(pcsetObj) <= 9):
+        return ""
+    dct = pcsetObj.transformationLevels()
+    lvls = []
+    for i in dct["Tn"]:
+        lvls.append("T" + str(i))
+    for j in dct["TnI"]:
+        lvls.append("T" + str(j) + "I")
+    return lvls[0]
+
+
+def modalAttributes(pcsetObj):
+    """
+    :param pcsetObj: a Pcset object for the input set.
+    :return: a list of the modal attributes of the input set:
+        each attribute is represented by a str.
+    """
+    card = len(pcsetObj)
+    if not (3 <= card <= 9):
+        return []
+    else:
+        matts = []
+        ref = pcsetObj.referentialCollections()
+        for col in c.REF_COLS:
+            if ref[col] == 2:
+                matts.append(col)
+            elif card == 6 and ref[col] == 1:
+                matts.append(col + "'")
+        if ref["D"]:
+            matts.append("D")
+        return matts
+
+
+def intervalClassVector(pcsetObj):
+    """
+    :param pcsetObj: a Pcset object for the input set.
+    :return: a list for the ICV of the input set.
+    """
+    if not (2 <= len(pcsetObj) <= 9):
+        return []
+    else:
+        return pcsetObj.icv()
+
+
+def indexVector(pcsetObj):
+    """
+    :param pcsetObj: a Pcset object for the input set.
+    :return: a list for the index vector of the input set.
+    """
+    if not (2 <= len(pcsetObj) <= 9):
+        return [""] * 12
+    else:
+        return pcsetObj.indexVector()
+
+
+def literalComplement(pcsetObj):
+    """
+    :param pcsetObj: a Pcset object for the input set.
+    :return: a list for the literal complement of the input set:
+        the returned set is in normal form.
+    """
+    if len(pcsetObj) == 0:
+        return []
+    else:
+        return Pcset(pcsetObj.complement()).normalForm()
+
+
+def abstractComplement(pcsetObj):
+    """
+    :param pcsetObj: a Pcset object for the input set.
+    :return: a list for the abstract complement of the input set:
+    the returned set is in prime form.
+    """
+    if len(pcsetObj) == 0:
+        return []
+    else:
+        return Pcset(pcsetObj.complement()).primeForm()
+
+
+def zCorrespondent(pcsetObj):
+    """
+    :param pcsetObj: a Pcset object for the input set.
+    :return: a str of the set name of Z-correspondent of the input set:
+        an empty str is returned when it's not Z-related.
+    """
+    # Z-related sets are only card between 4 and 8
+    if not (4 <= len(pcsetObj) <= 8):
+        return ""
+    else:
+        cat = defaultCatalog()
+        zcorr = cat.zCorrespondent(cat.setClassOf(toMask(pcsetObj)))
+        if zcorr >= 0:
+            return cat.name(zcorr)
+        else:
+            return ""
+
+
+def modalComplements(pcsetObj):
+    """
+    :param pcsetObj: a Pcset object for the input set.
+    :return: a dict (key=colName(str), val=mcomp(set)) for modal complements
+        of the input set. Sets that return their modal complements are those
+        with no foreign pcs or in case of a hexachord, prime M.A.
+        (i.e,. hexachords with one foreign pc).
+    """
+    card = len(pcsetObj)
+    dct = {}
+    if not (3 <= card <= 9):
+        return dct
+    mcomps = pcsetObj.modalComplements()
+    for name in c.REF_COLS:
+        col = c.COL_DICT[name]
+        mcomp = mcomps[name]
+        union = pcsetObj.getSet() | mcomp
+        # (set with no foreign pc but not col) or (hexachord with one foreign pc)
+        if ((union == col) and (len(mcomp) != 0)) \
+                or ((card == 6) and (len(union) == len(col) + 1)):
+            dct[name] = mcomp
+    return dct
+
+
+def setSummary(pcsetObj):
+    """
+    :param pcsetObj: a Pcset object for the input set.
+    :return: a str of the summary of the input set as: "SN (Tn/TnI, M.A.)".
+    """
+    card = len(pcsetObj)
+    if card == 0:
+        return ""
+    elif card == 1:
+        nf = pcsetObj.normalForm()
+        return str(nf[0])
+    elif card == 2 or (10 <= card <= 12):
+        nf = ",".join(str(pc) for pc in pcsetObj.normalForm())
+        return nf
+    else:
+        sn = setName(pcsetObj)
+        lvl = transformationLevel(pcsetObj)
+        matts = " ".join(modalAttributes(pcsetObj))
+        if matts == "":
+            summary = "{0} ({1})".format(sn, lvl)
+        else:
+            summary = "{0} ({1}, {2})".format(sn, lvl, matts)
+        return summary
+
+
+def computeProfile(pcs):
+    """
+    Computes the profile of a pcset from scratch.
+
+    :param pcs: an iterable with pcs.
+    :return: a dict for the profile of the set.
+    """
+    pcsetObj = Pcset(pcs)
+    return {
+        "card": len(pcsetObj),
+        "nf": pcsetObj.normalForm(),
+        "pf": pcsetObj.primeForm(),
+        "sn": setName(pcsetObj),
+        "lvl": transformationLevel(pcsetObj),
+        "matts": modalAttributes(pcsetObj),
+        "icv": intervalClassVector(pcsetObj),
+        "iv": indexVector(pcsetObj),
+        "lcomp": literalComplement(pcsetObj),
+        "acomp": abstractComplement(pcsetObj),
+        "zcorr": zCorrespondent(pcsetObj),
+        "mcomps": modalComplements(pcsetObj),
+        "summary": setSummary(pcsetObj),
+    }
+
+
+# Incremental profile update --------------------------------------------------
+
+# Bitmasks of the referential collections in the order of c.REF_COLS
+_COL_MASKS = [toMask(c.COL_DICT[name]) for name in c.REF_COLS]
+
+
+class ProfileState:
+    """
+    The profile of a pcset that is kept up to date incrementally while single
+    pcs are added or removed (e.g., a live MIDI performance).
+
+    Adding or removing a pc changes the cardinality, the ICV, the index
+    vector, the complement and the number of pcs foreign to each referential
+    collection by a predictable delta, so toggle() only applies those deltas.
+    The modal attributes and modal complements are derived from the foreign
+    pc counts. The fields that depend on the set as a whole (normal and
+    prime forms, set name, level, abstract complement and Z-correspondent)
+    are looked up when profile() is called.
+
+    >>> state = ProfileState({0, 4})
+    >>> state.toggle(7, True)
+    >>> state.profile()["summary"]
+    '3-11 (T7I, O0 H3 D)'
+    """
+
+    __slots__ = ("mask", "card", "icv", "iv", "foreign")
+
+    def __init__(self, pcs=()):
+        """Constructor takes an iterable with pcs."""
+        self.mask = 0
+        self.card = 0
+        self.icv = [0] * 6    # ICV regardless of the cardinality
+        self.iv = [0] * 12    # Index vector regardless of the cardinality
+        self.foreign = [0] * len(_COL_MASKS)  # Number of pcs foreign to each collection
+        for pc in set(pcs):
+            self.toggle(pc % 12, True)
+
+    def toggle(self, pc, state):
+        """
+        Adds/removes a single pc to/from the set and applies the deltas.
+        Nothing changes if the membership of the pc is already the state.
+
+        :param pc: int for pc
+        :param state: bool for set membership
+        """
+        bit = 1 << pc
+        if bool(self.mask & bit) == state:
+            return
+        delta = 1 if state else -1
+        if state:
+            self.mask |= bit
+        else:
+            self.mask &= ~bit
+        self.card += delta
+        # Intervals and index sums between pc and the other members
+        iv = self.iv
+        iv[(pc + pc) % 12] += delta
+        for other in fromMask(self.mask & ~bit):
+            i = (other - pc) % 12
+            self.icv[min(i, 12 - i) - 1] += delta
+            iv[(pc + other) % 12] += 2 * delta
+        for i, colMask in enumerate(_COL_MASKS):
+            if not colMask & bit:
+                self.foreign[i] += delta
+
+    def profile(self, table=None):
+        """
+        :param table: a ProfileTable object to look the whole-set fields up in:
+            they are computed with pcpy if None.
+        :return: a dict for the profile of the set.
+        """
+        mask, card = self.mask, self.card
+        # Fields that depend on the whole set
+        if table is not None:
+            row = table[mask]
+            nf, pf, sn, lvl = row["nf"], row["pf"], row["sn"], row["lvl"]
+            acomp, zcorr = row["acomp"], row["zcorr"]
+            lcomp = table[mask ^ FULL_MASK]["nf"] if card != 0 else []
+        else:
+            pcsetObj = Pcset(fromMask(mask))
+            nf, pf = pcsetObj.normalForm(), pcsetObj.primeForm()
+            sn, lvl = setName(pcsetObj), transformationLevel(pcsetObj)
+            acomp, zcorr = abstractComplement(pcsetObj), zCorrespondent(pcsetObj)
+            lcomp = literalComplement(pcsetObj)
+        # Fields kept by the deltas
+        inRange = 2 <= card <= 9
+        matts = []
+        mcomps = {}
+        if 3 <= card <= 9:
+            for name, colMask, n in zip(c.REF_COLS, _COL_MASKS, self.foreign):
+                if n == 0:
+                    matts.append(name)
+                    if mask != colMask:
+                        mcomps[name] = set(fromMask(colMask & ~mask))
+                elif card == 6 and n == 1:
+                    matts.append(name + "'")
+                    mcomps[name] = set(fromMask(colMask & ~mask))
+            # Being an abstract subset of DT is a property of the set class
+            cat = defaultCatalog()
+            if "D" in cat.modalAttributes(cat.setClassOf(mask)):
+                matts.append("D")
+        return {
+            "card": card,
+            "nf": nf,
+            "pf": pf,
+            "sn": sn,
+            "lvl": lvl,
+            "matts": matts,
+            "icv": list(self.icv) if inRange else [],
+            "iv": list(self.iv) if inRange else [""] * 12,
+            "lcomp": lcomp,
+            "acomp": acomp,
+            "zcorr": zcorr,
+            "mcomps": mcomps,
+            "summary": _summary(card, nf, sn, lvl, matts),
+        }
+
+
+def _summary(card, nf, sn, lvl, matts):
+    """Same as setSummary() but made from the fields of a profile."""
+    if card == 0:
+        return ""
+    elif card == 1:
+        return str(nf[0])
+    elif card == 2 or (10 <= card <= 12):
+        return ",".join(str(pc) for pc in nf)
+    elif not matts:
+        return "{0} ({1})".format(sn, lvl)
+    else:
+        return "{0} ({1}, {2})".format(sn, lvl, " ".join(matts))
+
+
+# Profile table ---------------------------------------------------------------
+
+class ProfileTable:
+    """
+    A table of the profiles of all 4096 pcsets, indexed by bitmask.
+
+    The profiles are shared between lookups, so they must be treated as
+    read-only by the caller.
+    """
+
+    def __init__(self, profiles):
+        """
+        :param profiles: a list of 4096 profile dicts, where the index of
+            each profile is the bitmask of its set.
+        """
+        if len(profiles) != PROFILE_TABLE_SIZE:
+            raise ValueError("A profile table needs {} entries, got {}".format(
+                PROFILE_TABLE_SIZE, len(profiles)))
+        self.profiles = profiles
+
+    def __getitem__(self, mask):
+        """Returns the profile of the set with the bitmask."""
+        return self.profiles[mask]
+
+    def __len__(self):
+        return len(self.profiles)
+
+    def lookup(self, pcs):
+        """
+        :param pcs: an iterable with pcs.
+        :return: a dict for the profile of the set.
+        """
+        return self.profiles[toMask(pcs)]
+
+    @classmethod
+    def build(cls):
+        """Computes the profiles of all the pcsets."""
+        return cls([computeProfile(fromMask(mask))
+                    for mask in range(PROFILE_TABLE_SIZE)])
+
+    @classmethod
+    def load(cls, path):
+        """
+        Loads the table from a JSON file written by save().
+
+        :param path: a str for the path of the file.
+        :return: a ProfileTable object.
+        :raise ValueError: if the file is not a profile table of this version.
+        """
+        with open(path, "r") as f:
+            data = json.load(f)
+        if data.get("version") != PROFILE_TABLE_VERSION:
+            raise ValueError("Unsupported profile table version: {}".format(
+                data.get("version")))
+        profiles = data["profiles"]
+        for profile in profiles:
+            # JSON has no set type: restore the modal complements as sets
+            profile["mcomps"] = {name: set(pcs) for name, pcs in profile["mcomps"].items()}
+        return cls(profiles)
+
+    def save(self, path):
+        """
+        Writes the table to a JSON file under a temporary name and renames
+        the file, so a process loading it at the same time never reads a
+        partial file (as saveCatalog() does for the catalog).
+
+        :param path: a str for the path of the file.
+        """
+        profiles = []
+        for profile in self.profiles:
+            profile = dict(profile)
+            profile["mcomps"] = {name: sorted(pcs) for name, pcs in profile["mcomps"].items()}
+            profiles.append(profile)
+        data = {"version": PROFILE_TABLE_VERSION, "profiles": profiles}
+        tmpPath = "{}.{}.tmp".format(path, os.getpid())
+        try:
+            with open(tmpPath, "w") as outfile:
+                json.dump(data, fp=outfile, separators=(",", ":"))
+            os.replace(tmpPath, path)
+        except BaseException:
+            # Do not leave a partial file behind (e.g., the disk is full)
+            try:
+                os.unlink(tmpPath)
+            except OSError:
+                pass
+            raise
+
+
+def loadProfileTable(path):
+    """
+    Loads the profile table from the cache file, or builds it and writes
+    the cache file if the file is missing or out of date.
+
+    :param path: a str for the path of the cache file.
+    :return: a ProfileTable object.
+    """
+    if os.path.exists(path):
+        try:
+            return ProfileTable.load(path)
+        except (OSError, ValueError, KeyError):
+            pass  # Rebuild a broken or outdated cache
+    table = ProfileTable.build()
+    try:
+        table.save(path)
+    except OSError:
+        pass  # The table still works from memory if the cache is not writable
+    return table
+
+
+def defaultProfileTable():
+    """
+    Returns the profile table cached next to this module, loading it on
+    the first call.
+    """
+    global _defaultTable
+    if _defaultTable is None:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), PROFILE_TABLE_FILE)
+        _defaultTable = loadProfileTable(path)
+    return _defaultTable
+
+
+def profileMany(sets, table=None):
+    """
+    Returns the profiles of many pcsets in one call.
+
+    >>> [p["summary"] for p in profileMany([{0, 4, 7}, 0b10001001])]
+    ['3-11 (T7I, O0 H3 D)', '3-11 (T0, O0 H3 D)']
+
+    :param sets: an iterable of pcsets, each of which is either an iterable
+        with pcs or an int for the bitmask of the set.
+    :param table: a ProfileTable object to look the profiles up in:
+        the default table is used if None.
+    :return: a list of profile dicts in the order of the input sets.
+    """
+    if table is None:
+        table = defaultProfileTable()
+    profiles = table.profiles
+    return [profiles[s] if isinstance(s, int) else profiles[toMask(s)]
+            for s in sets]
+
+
+# Target set-class member index -----------------------------------------------
+
+class InclusionIndex:
+    """
+    An index of the target SC members of source sets, for the inclusion and
+    complementation queries of Pcset.
+
+    The members are computed once for each (source SC, target SC) pair with
+    the source set at its prime form (T0), and stored as pairs of bitmasks.
+    The members of any other source set of the same SC are the cached members
+    under the Tn/TnI operation that maps the prime form onto the source set,
+    which is a bit rotation.
+    """
+
+    def __init__(self, table):
+        """
+        :param table: a ProfileTable object for prime form lookups.
+        """
+        self.table = table
+        self.primeMasks = [toMask(profile["pf"]) for profile in table.profiles]
+        self.cache = {}  # key=(source PF mask, target PF mask), val=[(member, diff)]
+
+    def members(self, mask, target):
+        """
+        Finds the target SC members of a set, like Pcset.inclusion() and
+        Pcset.complementation(). The members are ordered by their pcs for
+        inclusion, and by the complementing pcs for complementation.
+
+        :param mask: an int for the bitmask of the source set.
+        :param target: an iterable with pcs representing the target set class.
+        :return: a list of tuples (member, diff) of bitmasks:
+            target smaller than the source: member is a literal subset of the
+                source set, and diff is the source pcs not in the member.
+            target larger than the source: member is a literal superset of the
+                source set, and diff is the complementing pcs.
+            An empty list is returned if the cardinalities are the same.
+        """
+        sourcePF = self.primeMasks[mask]
+        targetPF = self.primeMasks[toMask(target)]
+        key = (sourcePF, targetPF)
+        cached = self.cache.get(key)
+        if cached is None:
+            cached = self.cache[key] = self._findMembers(sourcePF, targetPF)
+        n, inverted = self._operation(sourcePF, mask)
+        inversions = _INVERSIONS
+        members = []
+        for member, diff in cached:
+            if inverted:
+                member, diff = inversions[member], inversions[diff]
+            members.append((rotate(member, n), rotate(diff, n)))
+        if bin(targetPF).count("1") < bin(sourcePF).count("1"):
+            members.sort(key=lambda pair: fromMask(pair[0]))
+        else:
+            members.sort(key=lambda pair: fromMask(pair[1]))
+        return members
+
+    def _findMembers(self, sourcePF, targetPF):
+        """Returns the (member, diff) pairs for the source set at T0."""
+        primeMasks = self.primeMasks
+        gap = bin(targetPF).count("1") - bin(sourcePF).count("1")
+        members = []
+        if gap < 0:
+            for pcs in combinations(fromMask(sourcePF), -gap):
+                diff = toMask(pcs)
+                if primeMasks[sourcePF & ~diff] == targetPF:
+                    members.append((sourcePF & ~diff, diff))
+        elif gap > 0:
+            for pcs in combinations(fromMask(sourcePF ^ FULL_MASK), gap):
+                diff = toMask(pcs)
+                if primeMasks[sourcePF | diff] == targetPF:
+                    members.append((sourcePF | diff, diff))
+        return members
+
+    @staticmethod
+    def _operation(sourcePF, mask):
+        """Returns (n, inverted) for the Tn or TnI mapping the prime form onto mask."""
+        for n in range(12):
+            if rotate(sourcePF, n) == mask:
+                return n, False
+        inverted = _INVERSIONS[sourcePF]
+        for n in range(12):
+            if rotate(inverted, n) == mask:
+                return n, True
+        raise ValueError("{} is not a member of the SC of {}".format(mask, sourcePF))
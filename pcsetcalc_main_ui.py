@@ -131,6 +131,10 @@ class Ui_MainWindow(object):
 "    color: rgb(170, 170, 170); /* 400+ */\n"
 "    background-color: rgba(8%, 25%, 43%, 0%);\n"
 "    }\n"
+"QFrame#frameOCT_outer > QLabel[active=\"true\"]  {\n"
+"    color: rgb(243, 243, 243);\n"
+"    background-color: rgba(8%, 25%, 43%, 25%);\n"
+"    }\n"
 "QFrame#frameOCT {\n"
 "    border: 1px solid rgb(170, 170, 170);\n"
 "    background-color: rgb(243, 243, 243); /* 100+ */\n"
@@ -142,6 +146,10 @@ class Ui_MainWindow(object):
 "    color: rgb(0, 0, 0);\n"
 "    background-color: rgba(8%, 25%, 43%, 0%);\n"
 "    }\n"
+"QFrame#frameOCT QLabel[active=\"true\"]  {\n"
+"    color: rgb(243, 243, 243);\n"
+"    background-color: rgba(8%, 25%, 43%, 60%);\n"
+"    }\n"
 "\n"
 "/* WT collection pc labels */\n"
 "QFrame#frameWT {\n"
@@ -154,6 +162,10 @@ class Ui_MainWindow(object):
 "    color: rgb(0, 0, 0);\n"
 "    background-color: rgba(100%, 92%, 23%, 0%);\n"
 "    }\n"
+"QFrame#frameWT > QLabel[active=\"true\"] {\n"
+"    color: rgb(0, 0, 0);\n"
+"    background-color: rgba(100%, 92%, 23%, 65%);\n"
+"    }\n"
 "/* HEX collection pc labels */\n"
 "QFrame#frameHEX_outer {\n"
 "    background-color: rgb(243, 243, 243); /* 100+ */\n"
@@ -165,6 +177,10 @@ class Ui_MainWindow(object):
 "    color: rgb(170, 170, 170);\n"
 "    background-color: rgba(81%, 37%, 37%, 0%);\n"
 "    }\n"
+"QFrame#frameHEX_outer > QLabel[active=\"true\"]  {\n"
+"    color: rgb(243, 243, 243);\n"
+"    background-color: rgba(81%, 37%, 37%, 25%);\n"
+"    }\n"
 "QFrame#frameHEX {\n"
 "    border: 1px solid rgb(170, 170, 170);\n"
 "    background-color: rgb(243, 243, 243); /* 100+ */\n"
@@ -175,6 +191,10 @@ class Ui_MainWindow(object):
 "    qproperty-alignment: AlignCenter;\n"
 "    color: rgb(0, 0, 0);\n"
 "    background-color: rgba(81%, 37%, 37%, 0%);\n"
+"    }\n"
+"QFrame#frameHEX QLabel[active=\"true\"]  {\n"
+"    color: rgb(243, 243, 243);\n"
+"    background-color: rgba(81%, 37%, 37%, 70%);\n"
 "    }")
         self.centralwidget = QtWidgets.QWidget(parent=MainWindow)
         self.centralwidget.setObjectName("centralwidget")
@@ -238,40 +258,13 @@ class Ui_MainWindow(object):
         self.labelIndexVector = QtWidgets.QLabel(parent=self.centralwidget)
         self.labelIndexVector.setGeometry(QtCore.QRect(55, 290, 32, 14))
         self.labelIndexVector.setObjectName("labelIndexVector")
-        self.tableIndexVector = QtWidgets.QTableWidget(parent=self.centralwidget)
+        self.tableIndexVector = QtWidgets.QTableView(parent=self.centralwidget)
         self.tableIndexVector.setGeometry(QtCore.QRect(96, 288, 324, 49))
         self.tableIndexVector.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
         self.tableIndexVector.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.tableIndexVector.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.tableIndexVector.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.NoSelection)
         self.tableIndexVector.setObjectName("tableIndexVector")
-        self.tableIndexVector.setColumnCount(12)
-        self.tableIndexVector.setRowCount(1)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableIndexVector.setVerticalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableIndexVector.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableIndexVector.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableIndexVector.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableIndexVector.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableIndexVector.setHorizontalHeaderItem(4, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableIndexVector.setHorizontalHeaderItem(5, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableIndexVector.setHorizontalHeaderItem(6, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableIndexVector.setHorizontalHeaderItem(7, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableIndexVector.setHorizontalHeaderItem(8, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableIndexVector.setHorizontalHeaderItem(9, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableIndexVector.setHorizontalHeaderItem(10, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableIndexVector.setHorizontalHeaderItem(11, item)
         self.tableIndexVector.horizontalHeader().setDefaultSectionSize(27)
         self.tableIndexVector.horizontalHeader().setMinimumSectionSize(27)
         self.tableIndexVector.verticalHeader().setVisible(False)
@@ -317,28 +310,15 @@ class Ui_MainWindow(object):
         self.lineEditACompSN.setMaximumSize(QtCore.QSize(55, 22))
         self.lineEditACompSN.setReadOnly(True)
         self.lineEditACompSN.setObjectName("lineEditACompSN")
-        self.tableMComps = QtWidgets.QTableWidget(parent=self.centralwidget)
+        self.tableMComps = QtWidgets.QTableView(parent=self.centralwidget)
         self.tableMComps.setGeometry(QtCore.QRect(337, 180, 210, 97))
         self.tableMComps.setMinimumSize(QtCore.QSize(210, 97))
         self.tableMComps.setMaximumSize(QtCore.QSize(210, 97))
         self.tableMComps.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
         self.tableMComps.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.tableMComps.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.tableMComps.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.NoSelection)
         self.tableMComps.setObjectName("tableMComps")
-        self.tableMComps.setColumnCount(3)
-        self.tableMComps.setRowCount(3)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMComps.setVerticalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMComps.setVerticalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMComps.setVerticalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMComps.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMComps.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMComps.setHorizontalHeaderItem(2, item)
         self.tableMComps.horizontalHeader().setDefaultSectionSize(70)
         self.tableMComps.verticalHeader().setVisible(False)
         self.tableMComps.verticalHeader().setDefaultSectionSize(25)
@@ -414,63 +394,11 @@ class Ui_MainWindow(object):
         self.btnTargetSCRetrig.setGeometry(QtCore.QRect(405, 406, 22, 22))
         self.btnTargetSCRetrig.setText("")
         self.btnTargetSCRetrig.setObjectName("btnTargetSCRetrig")
-        self.tableTargetSCMembers = QtWidgets.QTableWidget(parent=self.centralwidget)
+        self.tableTargetSCMembers = QtWidgets.QTableView(parent=self.centralwidget)
         self.tableTargetSCMembers.setGeometry(QtCore.QRect(45, 440, 610, 324))
         self.tableTargetSCMembers.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
         self.tableTargetSCMembers.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.tableTargetSCMembers.setObjectName("tableTargetSCMembers")
-        self.tableTargetSCMembers.setColumnCount(5)
-        self.tableTargetSCMembers.setRowCount(20)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableTargetSCMembers.setVerticalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableTargetSCMembers.setVerticalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableTargetSCMembers.setVerticalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableTargetSCMembers.setVerticalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableTargetSCMembers.setVerticalHeaderItem(4, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableTargetSCMembers.setVerticalHeaderItem(5, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableTargetSCMembers.setVerticalHeaderItem(6, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableTargetSCMembers.setVerticalHeaderItem(7, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableTargetSCMembers.setVerticalHeaderItem(8, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableTargetSCMembers.setVerticalHeaderItem(9, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableTargetSCMembers.setVerticalHeaderItem(10, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableTargetSCMembers.setVerticalHeaderItem(11, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableTargetSCMembers.setVerticalHeaderItem(12, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableTargetSCMembers.setVerticalHeaderItem(13, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableTargetSCMembers.setVerticalHeaderItem(14, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableTargetSCMembers.setVerticalHeaderItem(15, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableTargetSCMembers.setVerticalHeaderItem(16, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableTargetSCMembers.setVerticalHeaderItem(17, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableTargetSCMembers.setVerticalHeaderItem(18, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableTargetSCMembers.setVerticalHeaderItem(19, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableTargetSCMembers.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableTargetSCMembers.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableTargetSCMembers.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableTargetSCMembers.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableTargetSCMembers.setHorizontalHeaderItem(4, item)
         self.tableTargetSCMembers.horizontalHeader().setStretchLastSection(True)
         self.btnUndo = QtWidgets.QPushButton(parent=self.centralwidget)
         self.btnUndo.setGeometry(QtCore.QRect(540, 38, 35, 25))
@@ -478,36 +406,13 @@ class Ui_MainWindow(object):
         self.btnRedo = QtWidgets.QPushButton(parent=self.centralwidget)
         self.btnRedo.setGeometry(QtCore.QRect(579, 38, 35, 25))
         self.btnRedo.setObjectName("btnRedo")
-        self.tableMSCTrichords = QtWidgets.QTableWidget(parent=self.centralwidget)
+        self.tableMSCTrichords = QtWidgets.QTableView(parent=self.centralwidget)
         self.tableMSCTrichords.setGeometry(QtCore.QRect(687, 84, 200, 232))
         self.tableMSCTrichords.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
         self.tableMSCTrichords.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.tableMSCTrichords.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.tableMSCTrichords.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.NoSelection)
         self.tableMSCTrichords.setObjectName("tableMSCTrichords")
-        self.tableMSCTrichords.setColumnCount(4)
-        self.tableMSCTrichords.setRowCount(7)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCTrichords.setVerticalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCTrichords.setVerticalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCTrichords.setVerticalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCTrichords.setVerticalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCTrichords.setVerticalHeaderItem(4, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCTrichords.setVerticalHeaderItem(5, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCTrichords.setVerticalHeaderItem(6, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCTrichords.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCTrichords.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCTrichords.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCTrichords.setHorizontalHeaderItem(3, item)
         self.tableMSCTrichords.horizontalHeader().setDefaultSectionSize(40)
         self.tableMSCTrichords.horizontalHeader().setStretchLastSection(True)
         self.tableMSCTrichords.verticalHeader().setVisible(False)
@@ -527,73 +432,23 @@ class Ui_MainWindow(object):
         self.labelMSC = QtWidgets.QLabel(parent=self.centralwidget)
         self.labelMSC.setGeometry(QtCore.QRect(692, 56, 27, 15))
         self.labelMSC.setObjectName("labelMSC")
-        self.tableMSCTetrachords = QtWidgets.QTableWidget(parent=self.centralwidget)
+        self.tableMSCTetrachords = QtWidgets.QTableView(parent=self.centralwidget)
         self.tableMSCTetrachords.setGeometry(QtCore.QRect(895, 84, 250, 232))
         self.tableMSCTetrachords.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
         self.tableMSCTetrachords.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.tableMSCTetrachords.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.tableMSCTetrachords.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.NoSelection)
         self.tableMSCTetrachords.setObjectName("tableMSCTetrachords")
-        self.tableMSCTetrachords.setColumnCount(5)
-        self.tableMSCTetrachords.setRowCount(7)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCTetrachords.setVerticalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCTetrachords.setVerticalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCTetrachords.setVerticalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCTetrachords.setVerticalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCTetrachords.setVerticalHeaderItem(4, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCTetrachords.setVerticalHeaderItem(5, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCTetrachords.setVerticalHeaderItem(6, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCTetrachords.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCTetrachords.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCTetrachords.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCTetrachords.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCTetrachords.setHorizontalHeaderItem(4, item)
         self.tableMSCTetrachords.horizontalHeader().setDefaultSectionSize(40)
         self.tableMSCTetrachords.horizontalHeader().setStretchLastSection(True)
         self.tableMSCTetrachords.verticalHeader().setVisible(False)
-        self.tableMSCHexachords = QtWidgets.QTableWidget(parent=self.centralwidget)
+        self.tableMSCHexachords = QtWidgets.QTableView(parent=self.centralwidget)
         self.tableMSCHexachords.setGeometry(QtCore.QRect(1152, 84, 250, 232))
         self.tableMSCHexachords.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
         self.tableMSCHexachords.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.tableMSCHexachords.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.tableMSCHexachords.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.NoSelection)
         self.tableMSCHexachords.setObjectName("tableMSCHexachords")
-        self.tableMSCHexachords.setColumnCount(5)
-        self.tableMSCHexachords.setRowCount(7)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCHexachords.setVerticalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCHexachords.setVerticalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCHexachords.setVerticalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCHexachords.setVerticalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCHexachords.setVerticalHeaderItem(4, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCHexachords.setVerticalHeaderItem(5, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCHexachords.setVerticalHeaderItem(6, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCHexachords.setHorizontalHeaderItem(0, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCHexachords.setHorizontalHeaderItem(1, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCHexachords.setHorizontalHeaderItem(2, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCHexachords.setHorizontalHeaderItem(3, item)
-        item = QtWidgets.QTableWidgetItem()
-        self.tableMSCHexachords.setHorizontalHeaderItem(4, item)
         self.tableMSCHexachords.horizontalHeader().setDefaultSectionSize(40)
         self.tableMSCHexachords.horizontalHeader().setStretchLastSection(True)
         self.tableMSCHexachords.verticalHeader().setVisible(False)
@@ -1015,6 +870,8 @@ class Ui_MainWindow(object):
         self.menuInput.setObjectName("menuInput")
         self.menuConnection = QtWidgets.QMenu(parent=self.menubar)
         self.menuConnection.setObjectName("menuConnection")
+        self.menuDebug = QtWidgets.QMenu(parent=self.menubar)
+        self.menuDebug.setObjectName("menuDebug")
         MainWindow.setMenuBar(self.menubar)
         self.statusbar = QtWidgets.QStatusBar(parent=MainWindow)
         self.statusbar.setObjectName("statusbar")
@@ -1051,6 +908,8 @@ class Ui_MainWindow(object):
         self.actionReset.setObjectName("actionReset")
         self.actionMIDI_OSC = QtGui.QAction(parent=MainWindow)
         self.actionMIDI_OSC.setObjectName("actionMIDI_OSC")
+        self.actionStageTimings = QtGui.QAction(parent=MainWindow)
+        self.actionStageTimings.setObjectName("actionStageTimings")
         self.menuInput.addAction(self.actionPC0)
         self.menuInput.addAction(self.actionPC1)
         self.menuInput.addAction(self.actionPC2)
@@ -1069,8 +928,10 @@ class Ui_MainWindow(object):
         self.menuEdit.addAction(self.menuInput.menuAction())
         self.menuEdit.addAction(self.actionReset)
         self.menuConnection.addAction(self.actionMIDI_OSC)
+        self.menuDebug.addAction(self.actionStageTimings)
         self.menubar.addAction(self.menuEdit.menuAction())
         self.menubar.addAction(self.menuConnection.menuAction())
+        self.menubar.addAction(self.menuDebug.menuAction())
 
         self.retranslateUi(MainWindow)
         QtCore.QMetaObject.connectSlotsByName(MainWindow)
@@ -1086,47 +947,9 @@ class Ui_MainWindow(object):
         self.labelLevel.setText(_translate("MainWindow", "Tn/TnI"))
         self.labelMA.setText(_translate("MainWindow", "M.A."))
         self.labelIndexVector.setText(_translate("MainWindow", "Index"))
-        item = self.tableIndexVector.verticalHeaderItem(0)
-        item.setText(_translate("MainWindow", "index"))
-        item = self.tableIndexVector.horizontalHeaderItem(0)
-        item.setText(_translate("MainWindow", "0"))
-        item = self.tableIndexVector.horizontalHeaderItem(1)
-        item.setText(_translate("MainWindow", "1"))
-        item = self.tableIndexVector.horizontalHeaderItem(2)
-        item.setText(_translate("MainWindow", "2"))
-        item = self.tableIndexVector.horizontalHeaderItem(3)
-        item.setText(_translate("MainWindow", "3"))
-        item = self.tableIndexVector.horizontalHeaderItem(4)
-        item.setText(_translate("MainWindow", "4"))
-        item = self.tableIndexVector.horizontalHeaderItem(5)
-        item.setText(_translate("MainWindow", "5"))
-        item = self.tableIndexVector.horizontalHeaderItem(6)
-        item.setText(_translate("MainWindow", "6"))
-        item = self.tableIndexVector.horizontalHeaderItem(7)
-        item.setText(_translate("MainWindow", "7"))
-        item = self.tableIndexVector.horizontalHeaderItem(8)
-        item.setText(_translate("MainWindow", "8"))
-        item = self.tableIndexVector.horizontalHeaderItem(9)
-        item.setText(_translate("MainWindow", "9"))
-        item = self.tableIndexVector.horizontalHeaderItem(10)
-        item.setText(_translate("MainWindow", "10"))
-        item = self.tableIndexVector.horizontalHeaderItem(11)
-        item.setText(_translate("MainWindow", "11"))
         self.labelLComp.setText(_translate("MainWindow", "Lit. Comp."))
         self.labelAComp.setText(_translate("MainWindow", "Abs. Comp."))
         self.labelZCorr.setText(_translate("MainWindow", "Z-corr."))
-        item = self.tableMComps.verticalHeaderItem(0)
-        item.setText(_translate("MainWindow", "1"))
-        item = self.tableMComps.verticalHeaderItem(1)
-        item.setText(_translate("MainWindow", "2"))
-        item = self.tableMComps.verticalHeaderItem(2)
-        item.setText(_translate("MainWindow", "3"))
-        item = self.tableMComps.horizontalHeaderItem(0)
-        item.setText(_translate("MainWindow", "Col."))
-        item = self.tableMComps.horizontalHeaderItem(1)
-        item.setText(_translate("MainWindow", "Modal Comp."))
-        item = self.tableMComps.horizontalHeaderItem(2)
-        item.setText(_translate("MainWindow", "S.N."))
         self.comboBoxTn.setItemText(0, _translate("MainWindow", "Tn"))
         self.comboBoxTn.setItemText(1, _translate("MainWindow", "T1"))
         self.comboBoxTn.setItemText(2, _translate("MainWindow", "T2"))
@@ -1154,80 +977,8 @@ class Ui_MainWindow(object):
         self.comboBoxTnI.setItemText(12, _translate("MainWindow", "T11I"))
         self.labelTarget.setText(_translate("MainWindow", "Target"))
         self.labelInclSym.setText(_translate("MainWindow", "⊃⊂"))
-        item = self.tableTargetSCMembers.verticalHeaderItem(0)
-        item.setText(_translate("MainWindow", "1"))
-        item = self.tableTargetSCMembers.verticalHeaderItem(1)
-        item.setText(_translate("MainWindow", "2"))
-        item = self.tableTargetSCMembers.verticalHeaderItem(2)
-        item.setText(_translate("MainWindow", "3"))
-        item = self.tableTargetSCMembers.verticalHeaderItem(3)
-        item.setText(_translate("MainWindow", "4"))
-        item = self.tableTargetSCMembers.verticalHeaderItem(4)
-        item.setText(_translate("MainWindow", "5"))
-        item = self.tableTargetSCMembers.verticalHeaderItem(5)
-        item.setText(_translate("MainWindow", "6"))
-        item = self.tableTargetSCMembers.verticalHeaderItem(6)
-        item.setText(_translate("MainWindow", "7"))
-        item = self.tableTargetSCMembers.verticalHeaderItem(7)
-        item.setText(_translate("MainWindow", "8"))
-        item = self.tableTargetSCMembers.verticalHeaderItem(8)
-        item.setText(_translate("MainWindow", "9"))
-        item = self.tableTargetSCMembers.verticalHeaderItem(9)
-        item.setText(_translate("MainWindow", "10"))
-        item = self.tableTargetSCMembers.verticalHeaderItem(10)
-        item.setText(_translate("MainWindow", "11"))
-        item = self.tableTargetSCMembers.verticalHeaderItem(11)
-        item.setText(_translate("MainWindow", "12"))
-        item = self.tableTargetSCMembers.verticalHeaderItem(12)
-        item.setText(_translate("MainWindow", "13"))
-        item = self.tableTargetSCMembers.verticalHeaderItem(13)
-        item.setText(_translate("MainWindow", "14"))
-        item = self.tableTargetSCMembers.verticalHeaderItem(14)
-        item.setText(_translate("MainWindow", "15"))
-        item = self.tableTargetSCMembers.verticalHeaderItem(15)
-        item.setText(_translate("MainWindow", "16"))
-        item = self.tableTargetSCMembers.verticalHeaderItem(16)
-        item.setText(_translate("MainWindow", "17"))
-        item = self.tableTargetSCMembers.verticalHeaderItem(17)
-        item.setText(_translate("MainWindow", "18"))
-        item = self.tableTargetSCMembers.verticalHeaderItem(18)
-        item.setText(_translate("MainWindow", "19"))
-        item = self.tableTargetSCMembers.verticalHeaderItem(19)
-        item.setText(_translate("MainWindow", "20"))
-        item = self.tableTargetSCMembers.horizontalHeaderItem(0)
-        item.setText(_translate("MainWindow", "Incl. / Comp."))
-        item = self.tableTargetSCMembers.horizontalHeaderItem(1)
-        item.setText(_translate("MainWindow", "Tn/TnI"))
-        item = self.tableTargetSCMembers.horizontalHeaderItem(2)
-        item.setText(_translate("MainWindow", "M.A."))
-        item = self.tableTargetSCMembers.horizontalHeaderItem(3)
-        item.setText(_translate("MainWindow", "Diff."))
-        item = self.tableTargetSCMembers.horizontalHeaderItem(4)
-        item.setText(_translate("MainWindow", "Diff. Info."))
         self.btnUndo.setText(_translate("MainWindow", "↩︎"))
         self.btnRedo.setText(_translate("MainWindow", "↪︎"))
-        item = self.tableMSCTrichords.verticalHeaderItem(0)
-        item.setText(_translate("MainWindow", "1"))
-        item = self.tableMSCTrichords.verticalHeaderItem(1)
-        item.setText(_translate("MainWindow", "2"))
-        item = self.tableMSCTrichords.verticalHeaderItem(2)
-        item.setText(_translate("MainWindow", "3"))
-        item = self.tableMSCTrichords.verticalHeaderItem(3)
-        item.setText(_translate("MainWindow", "4"))
-        item = self.tableMSCTrichords.verticalHeaderItem(4)
-        item.setText(_translate("MainWindow", "5"))
-        item = self.tableMSCTrichords.verticalHeaderItem(5)
-        item.setText(_translate("MainWindow", "6"))
-        item = self.tableMSCTrichords.verticalHeaderItem(6)
-        item.setText(_translate("MainWindow", "7"))
-        item = self.tableMSCTrichords.horizontalHeaderItem(0)
-        item.setText(_translate("MainWindow", "S.N."))
-        item = self.tableMSCTrichords.horizontalHeaderItem(1)
-        item.setText(_translate("MainWindow", "M.A."))
-        item = self.tableMSCTrichords.horizontalHeaderItem(2)
-        item.setText(_translate("MainWindow", "Sym."))
-        item = self.tableMSCTrichords.horizontalHeaderItem(3)
-        item.setText(_translate("MainWindow", "#"))
         self.comboBoxNexus.setItemText(0, _translate("MainWindow", "5-10"))
         self.comboBoxNexus.setItemText(1, _translate("MainWindow", "5-16"))
         self.comboBoxNexus.setItemText(2, _translate("MainWindow", "5-19"))
@@ -1238,54 +989,6 @@ class Ui_MainWindow(object):
         self.comboBoxNexus.setItemText(7, _translate("MainWindow", "5-32"))
         self.comboBoxNexus.setItemText(8, _translate("MainWindow", "5-33"))
         self.labelMSC.setText(_translate("MainWindow", "MSC"))
-        item = self.tableMSCTetrachords.verticalHeaderItem(0)
-        item.setText(_translate("MainWindow", "1"))
-        item = self.tableMSCTetrachords.verticalHeaderItem(1)
-        item.setText(_translate("MainWindow", "2"))
-        item = self.tableMSCTetrachords.verticalHeaderItem(2)
-        item.setText(_translate("MainWindow", "3"))
-        item = self.tableMSCTetrachords.verticalHeaderItem(3)
-        item.setText(_translate("MainWindow", "4"))
-        item = self.tableMSCTetrachords.verticalHeaderItem(4)
-        item.setText(_translate("MainWindow", "5"))
-        item = self.tableMSCTetrachords.verticalHeaderItem(5)
-        item.setText(_translate("MainWindow", "6"))
-        item = self.tableMSCTetrachords.verticalHeaderItem(6)
-        item.setText(_translate("MainWindow", "7"))
-        item = self.tableMSCTetrachords.horizontalHeaderItem(0)
-        item.setText(_translate("MainWindow", "S.N."))
-        item = self.tableMSCTetrachords.horizontalHeaderItem(1)
-        item.setText(_translate("MainWindow", "M.A."))
-        item = self.tableMSCTetrachords.horizontalHeaderItem(2)
-        item.setText(_translate("MainWindow", "Sym."))
-        item = self.tableMSCTetrachords.horizontalHeaderItem(3)
-        item.setText(_translate("MainWindow", "#"))
-        item = self.tableMSCTetrachords.horizontalHeaderItem(4)
-        item.setText(_translate("MainWindow", "Z-corr."))
-        item = self.tableMSCHexachords.verticalHeaderItem(0)
-        item.setText(_translate("MainWindow", "1"))
-        item = self.tableMSCHexachords.verticalHeaderItem(1)
-        item.setText(_translate("MainWindow", "2"))
-        item = self.tableMSCHexachords.verticalHeaderItem(2)
-        item.setText(_translate("MainWindow", "3"))
-        item = self.tableMSCHexachords.verticalHeaderItem(3)
-        item.setText(_translate("MainWindow", "4"))
-        item = self.tableMSCHexachords.verticalHeaderItem(4)
-        item.setText(_translate("MainWindow", "5"))
-        item = self.tableMSCHexachords.verticalHeaderItem(5)
-        item.setText(_translate("MainWindow", "6"))
-        item = self.tableMSCHexachords.verticalHeaderItem(6)
-        item.setText(_translate("MainWindow", "7"))
-        item = self.tableMSCHexachords.horizontalHeaderItem(0)
-        item.setText(_translate("MainWindow", "S.N."))
-        item = self.tableMSCHexachords.horizontalHeaderItem(1)
-        item.setText(_translate("MainWindow", "M.A."))
-        item = self.tableMSCHexachords.horizontalHeaderItem(2)
-        item.setText(_translate("MainWindow", "Sym."))
-        item = self.tableMSCHexachords.horizontalHeaderItem(3)
-        item.setText(_translate("MainWindow", "#"))
-        item = self.tableMSCHexachords.horizontalHeaderItem(4)
-        item.setText(_translate("MainWindow", "Z-corr."))
         self.labelOCT.setText(_translate("MainWindow", "OCT"))
         self.labelOCT_0_0.setText(_translate("MainWindow", "11"))
         self.labelOCT_0_1.setText(_translate("MainWindow", "0"))
@@ -1376,6 +1079,7 @@ class Ui_MainWindow(object):
         self.menuEdit.setTitle(_translate("MainWindow", "Edit"))
         self.menuInput.setTitle(_translate("MainWindow", "Input"))
         self.menuConnection.setTitle(_translate("MainWindow", "Connection"))
+        self.menuDebug.setTitle(_translate("MainWindow", "Debug"))
         self.actionUndo.setText(_translate("MainWindow", "Undo"))
         self.actionUndo.setShortcut(_translate("MainWindow", "Ctrl+Z"))
         self.actionRedo.setText(_translate("MainWindow", "Redo"))
@@ -1407,3 +1111,4 @@ class Ui_MainWindow(object):
         self.actionReset.setText(_translate("MainWindow", "Reset"))
         self.actionReset.setShortcut(_translate("MainWindow", "Ctrl+R"))
         self.actionMIDI_OSC.setText(_translate("MainWindow", "MIDI/OSC"))
+        self.actionStageTimings.setText(_translate("MainWindow", "Stage Timings"))
@@ -0,0 +1,431 @@
+# pcsetcalc_midi.py
+
+"""
+Qt-free MIDI input handling: the note and sustain rules that turn MIDI
+messages into pc states, and a reader for Standard MIDI Files.
+
+NoteTracker holds the rules used by WorkerMIDI for live input, so that
+recorded performances can be segmented offline in exactly the same way.
+MIDIMerger merges the input of several ports and channels, with a
+NoteTracker for each. SyntheticMIDIIn stands in for the MIDI input port
+when there is no MIDI hardware, e.g., to measure the input latency.
+"""
+
+import time
+import random
+import struct
+import threading
+from collections import deque
+
+STATUS_BYTE_NOTE_OFF = 128  # MIDI channel 1
+STATUS_BYTE_NOTE_ON = 144  # MIDI channel 1
+STATUS_BYTE_CONTROL_CHANGE = 176  # MIDI channel 1
+CC_SUSTAIN = 11  # MIDI CC to use for sustain pedal (11 = expression controller)
+SUSTAIN_THRESH = 110  # Threshold for sustain pedal (ON if less than thresh)
+SYNTHETIC_POLYPHONY = 4  # Number of the pitches sounding at once from the synthetic source
+SYNTHETIC_PITCH_RANGE = (36, 96)  # Lowest and highest pitch of the synthetic source
+
+
+class NoteTracker:
+    """
+    Tracks the note-on/off and sustain states of MIDI input and reports
+    the pc state changes to a callback.
+
+    The channel of the messages is ignored, i.e., the messages are those
+    of a single source (see MIDIMerger). Sustain is a non-public feature
+    used with cc 11 with reversed values (i.e., pedal completely off = 127,
+    on = 0): the note-offs received while the pedal is on are buffered and
+    released when it goes off.
+
+    The number of sounding pitches of each pc is counted, so a pc changes
+    its state only when its first pitch starts or its last pitch stops
+    sounding. The sounding pcs are kept in mask, a 12-bit int.
+    """
+
+    def __init__(self, callback=None):
+        """
+        :param callback: a callable (pc, state) called when a pc changes
+            its state, or None.
+        """
+        self.callback = callback
+        self.pitchStates = [False] * 128
+        self.pcCounts = [0] * 12  # Number of sounding pitches of each pc
+        self.mask = 0             # Bitmask of the sounding pcs
+        self.noteOffs = set()     # Pitches for suspended note-off messages
+        self.sustainState = False  # Damper pedal (sustain) status
+
+    def setStates(self, pitch, state):
+        """
+        Sets the pitch state, and reports the pc state to the callback.
+        The pc state change is not reported, if any other pc members of the
+        pitch is present, and a repeated note-on or note-off of the pitch
+        changes nothing. This will avoid unnecessary consumption of CPU power.
+
+        :param pitch: an int for the pitch.
+        :param state: a bool for the states.
+        """
+        if self.pitchStates[pitch] == state:
+            return
+        self.pitchStates[pitch] = state
+        pc = pitch % 12
+        count = self.pcCounts[pc] + (1 if state else -1)
+        self.pcCounts[pc] = count
+        if count == int(state):  # The first pitch on, or the last pitch off
+            self.mask ^= 1 << pc
+            if self.callback is not None:
+                self.callback(pc, state)
+
+    def processMessages(self, messages):
+        """
+        Applies a batch of MIDI messages to the note and sustain states.
+
+        :param messages: an iterable of lists [status, data1, data2].
+        :return: a bool for whether the sounding pcs (mask) changed over
+            the batch.
+        """
+        mask = self.mask
+        for msg in messages:
+            self.processMessage(msg)
+        return self.mask != mask
+
+    def processMessage(self, msg):
+        """
+        Applies a MIDI message to the note and sustain states.
+
+        :param msg: a list [status, data1, data2].
+        """
+        kind = msg[0] & 0xF0  # Status without the channel
+        # Sustain input
+        if kind == STATUS_BYTE_CONTROL_CHANGE and msg[1] == CC_SUSTAIN:
+            prev, current = self.sustainState, bool(msg[2] < SUSTAIN_THRESH)
+            # Release the buffered note-offs if sustain state changes from True to False
+            if prev and not current:
+                for pitch in self.noteOffs:
+                    self.setStates(pitch, False)
+                self.noteOffs.clear()
+            self.sustainState = current  # Update sustain state
+        # Note input (a note-on with velocity 0 is a note-off)
+        if kind == STATUS_BYTE_NOTE_ON or kind == STATUS_BYTE_NOTE_OFF:
+            pitch, state = msg[1], kind == STATUS_BYTE_NOTE_ON and bool(msg[2])
+            # Note on
+            if state:
+                self.setStates(pitch, True)
+            # Note off
+            else:
+                # Catch and buffer note-off messages if sustainState is True
+                if self.sustainState:
+                    self.noteOffs |= {pitch}
+                else:
+                    self.setStates(pitch, False)
+
+
+class MIDIMerger:
+    """
+    Merges the MIDI input of several ports and channels into a single set
+    of sounding pcs.
+
+    Each channel of each port is a source with its own NoteTracker, so
+    the notes and the sustain pedal of a source do not affect the others.
+    The sources sounding each pc are counted like the pitches of a source:
+    the pcs sounding in any source are kept in mask, a 12-bit int, and a pc
+    change is reported to the callback only when the first source starts
+    or the last source stops sounding the pc.
+
+    The messages of a port can be limited to some channels, and they are
+    counted per port for the message rates. MIDIMerger is not thread-safe:
+    the messages of all the ports are to be processed in one thread at a
+    time.
+    """
+
+    def __init__(self, callback=None):
+        """
+        :param callback: a callable (pc, state) called when a pc changes
+            its state, or None.
+        """
+        self.callback = callback
+        self.trackers = {}       # key=(port, channel 1-16), val=NoteTracker
+        self.channels = {}       # key=port, val=set of the accepted channels (1-16); all if absent
+        self.messageCounts = {}  # key=port, val=number of messages received
+        self.pcCounts = [0] * 12  # Number of sources sounding each pc
+        self.mask = 0             # Bitmask of the pcs sounding in any source
+        self.rateCounts = {}      # Message counts at the last call of messageRates()
+        self.rateTime = time.perf_counter()
+
+    def setChannels(self, port, channels):
+        """
+        Limits the messages of a port to some channels, and releases the
+        notes of the channels no longer accepted.
+
+        :param port: an int for the port.
+        :param channels: an iterable of ints (1-16) for the channels, or
+            None for all the channels.
+        """
+        if channels is None:
+            self.channels.pop(port, None)
+            return
+        self.channels[port] = set(channels)
+        for key in [key for key in self.trackers if key[0] == port and key[1] not in self.channels[port]]:
+            self.removeSource(key)
+
+    def removePort(self, port):
+        """Releases the notes of a port (e.g., when it is closed), and drops its message count."""
+        for key in [key for key in self.trackers if key[0] == port]:
+            self.removeSource(key)
+        self.messageCounts.pop(port, None)
+        self.rateCounts.pop(port, None)
+
+    def removeSource(self, key):
+        """Releases the pcs sounding in a source, and drops its tracker."""
+        tracker = self.trackers.pop(key)
+        for pc in range(12):
+            if tracker.mask >> pc & 1:
+                self.setPC(pc, False)
+
+    def setPC(self, pc, state):
+        """
+        Callback of the trackers: counts the sources sounding the pc, and
+        reports the pc state to the callback.
+
+        :param pc: an int for the pc.
+        :param state: a bool for the pc state in the source.
+        """
+        count = self.pcCounts[pc] + (1 if state else -1)
+        self.pcCounts[pc] = count
+        if count == int(state):  # The first source on, or the last source off
+            self.mask ^= 1 << pc
+            if self.callback is not None:
+                self.callback(pc, state)
+
+    def processMessages(self, messages):
+        """
+        Applies a batch of MIDI messages.
+
+        :param messages: an iterable of tuples (port, [status, data1, data2]).
+        :return: a bool for whether the sounding pcs (mask) changed over
+            the batch.
+        """
+        mask = self.mask
+        for port, msg in messages:
+            self.processMessage(port, msg)
+        return self.mask != mask
+
+    def processMessage(self, port, msg):
+        """
+        Applies a MIDI message to the source of its port and channel.
+
+        :param port: an int for the port.
+        :param msg: a list [status, data1, data2].
+        """
+        self.messageCounts[port] = self.messageCounts.get(port, 0) + 1
+        if msg[0] >= 0xF0:
+            return  # System messages have no channel
+        channel = (msg[0] & 0x0F) + 1
+        channels = self.channels.get(port)
+        if channels is not None and channel not in channels:
+            return
+        tracker = self.trackers.get((port, channel))
+        if tracker is None:
+            tracker = self.trackers[(port, channel)] = NoteTracker(self.setPC)
+        tracker.processMessage(msg)
+
+    def messageRates(self):
+        """
+        :return: a dict of the number of messages per second received by
+            each port since the previous call.
+        """
+        now = time.perf_counter()
+        elapsed = max(now - self.rateTime, 1e-9)
+        counts = dict(self.messageCounts)
+        rates = {port: (count - self.rateCounts.get(port, 0)) / elapsed for port, count in counts.items()}
+        self.rateCounts, self.rateTime = counts, now
+        return rates
+
+
+class SyntheticMIDIIn:
+    """
+    A stand-in for rtmidi.MidiIn with a single port that generates channel
+    1 note messages at a fixed rate: note-ons of random pitches, and the
+    note-off of the oldest pitch once SYNTHETIC_POLYPHONY pitches sound.
+
+    The messages are generated in a thread while the port is open and
+    buffered until they are polled, or passed to the callback in that
+    thread if one is set, as by rtmidi. The arrival time of the last polled
+    or delivered message is kept in lastArrival (ns, time.perf_counter_ns()).
+    """
+
+    PORT_NAME = "Synthetic MIDI source"
+
+    def __init__(self, rate=20.0, seed=None):
+        """
+        :param rate: a float for the number of messages per second.
+        :param seed: a seed for the pitches, or None.
+        """
+        self.rate = rate
+        self.random = random.Random(seed)
+        self.buffer = deque()   # (message, arrival time (ns))
+        self.sounding = []      # Sounding pitches, oldest first
+        self.lastArrival = None
+        self.callback = None    # (callable, data) set by set_callback()
+        self.thread = None
+        self.running = False
+
+    def get_ports(self):
+        return [self.PORT_NAME]
+
+    def open_port(self, port=0):
+        """Starts generating messages."""
+        if self.running:
+            return
+        self.running = True
+        self.thread = threading.Thread(target=self.generate, name="SyntheticMIDIIn", daemon=True)
+        self.thread.start()
+
+    def close_port(self):
+        """Stops generating messages."""
+        self.running = False
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join()
+        self.thread = None
+
+    def get_message(self):
+        """
+        :return: a tuple ([status, data1, data2], delta time (s)) for the
+            oldest buffered message, or None if the buffer is empty.
+        """
+        try:
+            msg, arrival = self.buffer.popleft()
+        except IndexError:
+            return None
+        delta = 0.0 if self.lastArrival is None else (arrival - self.lastArrival) / 1e9
+        self.lastArrival = arrival
+        return msg, delta
+
+    def set_callback(self, func, data=None):
+        """
+        Sets a callable func((message, delta time), data) called in the
+        generating thread for every message, instead of buffering it.
+        """
+        self.callback = (func, data)
+
+    def cancel_callback(self):
+        """Removes the callback: the messages are buffered again."""
+        self.callback = None
+
+    def nextMessage(self):
+        """Returns a list [status, data1, data2] for the next message."""
+        if len(self.sounding) >= SYNTHETIC_POLYPHONY:
+            return [STATUS_BYTE_NOTE_ON, self.sounding.pop(0), 0]
+        pitch = self.random.randint(*SYNTHETIC_PITCH_RANGE)
+        while pitch in self.sounding:
+            pitch = self.random.randint(*SYNTHETIC_PITCH_RANGE)
+        self.sounding.append(pitch)
+        return [STATUS_BYTE_NOTE_ON, pitch, 100]
+
+    def generate(self):
+        """Thread target: buffers or delivers a message every 1 / rate seconds."""
+        interval = 1 / self.rate
+        due = time.perf_counter()
+        while self.running:
+            msg, arrival = self.nextMessage(), time.perf_counter_ns()
+            callback = self.callback
+            if callback is None:
+                self.buffer.append((msg, arrival))
+            else:
+                delta = 0.0 if self.lastArrival is None else (arrival - self.lastArrival) / 1e9
+                self.lastArrival = arrival
+                callback[0]((msg, delta), callback[1])
+            due += interval
+            time.sleep(max(0.0, due - time.perf_counter()))
+
+
+class SMFError(ValueError):
+    """Raised for a malformed Standard MIDI File."""
+
+
+def readSMF(path):
+    """
+    Reads the channel messages of a Standard MIDI File (format 0 or 1).
+    The tracks are merged in time order; meta and sysex events are skipped.
+
+    :param path: a str for the file path.
+    :return: a list of tuples (tick, [status, data1, data2]) sorted by tick.
+    :raise SMFError: if the file is not a valid Standard MIDI File.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    if data[:4] != b"MThd" or len(data) < 14:
+        raise SMFError("not a Standard MIDI File")
+    headerLen, fmt, nTracks = struct.unpack(">IHH", data[4:12])
+    if headerLen < 6 or 8 + headerLen > len(data):
+        raise SMFError("truncated header")
+    if fmt > 1:
+        raise SMFError("unsupported SMF format {}".format(fmt))
+    pos = 8 + headerLen
+    events = []
+    track = 0
+    while track < nTracks and pos + 8 <= len(data):
+        chunkType = data[pos:pos + 4]
+        (chunkLen,) = struct.unpack(">I", data[pos + 4:pos + 8])
+        start = pos + 8
+        pos = start + chunkLen
+        if chunkType != b"MTrk":
+            continue  # Unknown chunk types are skipped as the SMF spec requires
+        if pos > len(data):
+            raise SMFError("truncated track {}".format(track))
+        try:
+            events.extend(_readTrack(data, start, pos, track))
+        except IndexError:
+            raise SMFError("truncated track {}".format(track)) from None
+        track += 1
+    if track < nTracks:
+        raise SMFError("missing track {}".format(track))
+    # Stable sort keeps the order of the events in a track at the same tick
+    events.sort(key=lambda event: (event[0], event[1]))
+    return [(tick, msg) for tick, _, msg in events]
+
+
+def _readTrack(data, pos, end, track):
+    """Returns a list of tuples (tick, track, msg) for the channel messages of a track."""
+    events = []
+    tick = 0
+    status = 0
+    while pos < end:
+        delta, pos = _readVarLen(data, pos)
+        tick += delta
+        byte = data[pos]
+        if byte == 0xFF:  # Meta event
+            metaType = data[pos + 1]
+            length, pos = _readVarLen(data, pos + 2)
+            if metaType == 0x2F:  # End of track
+                break
+            pos += length
+            continue
+        if byte in (0xF0, 0xF7):  # Sysex event
+            length, pos = _readVarLen(data, pos + 1)
+            pos += length
+            continue
+        if byte & 0x80:
+            status = byte
+            pos += 1
+        elif not status:
+            raise SMFError("running status without status byte in track {}".format(track))
+        if status & 0xE0 == 0xC0:  # Program change and channel pressure have 1 data byte
+            msg = [status, data[pos], 0]
+            pos += 1
+        else:
+            msg = [status, data[pos], data[pos + 1]]
+            pos += 2
+        events.append((tick, track, msg))
+    return events
+
+
+def _readVarLen(data, pos):
+    """Returns a tuple (value, next position) for a variable-length quantity."""
+    value = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value = (value << 7) | (byte & 0x7F)
+        if not byte & 0x80:
+            return value, pos
+
@@ -0,0 +1,471 @@
+# pcsetcalc_models.py
+
+"""
+Qt item models for the table views of MainWindow.
+
+The models hold bitmasks and look the display strings up in the profile
+table only when a view asks for them, so no QTableWidgetItem is created
+per cell and the number of rows is not capped.
+
+The rows of TargetSCMenuModel are created once; on a set change only the
+inclusion counts and the enabled states of the rows are updated.
+
+The fixed-size tables (index vector, modal complements and MSC members)
+are TextTableModels: each row holds a key (e.g., a set-class index and an
+inclusion count), and its cells are formatted from the catalog or the
+profile table on the first request of a view. A change of the current set
+updates only the rows whose keys change.
+"""
+
+from PyQt6 import QtCore
+
+# The views ask for every role of every cell they repaint, so the roles are
+# looked up once here, and the alignment is returned as an int (converting
+# an enum back to Qt takes twice as long)
+DISPLAY_ROLE = QtCore.Qt.ItemDataRole.DisplayRole
+ALIGNMENT_ROLE = QtCore.Qt.ItemDataRole.TextAlignmentRole
+ALIGN_CENTER = QtCore.Qt.AlignmentFlag.AlignCenter.value
+
+
+class TargetSCMemberModel(QtCore.QAbstractTableModel):
+    """
+    Table model for the target SC members of the current set.
+    Each row is a member structured as:
+        [incl/comp, Tn/TnI, MA, diff, diffInfo]
+
+    The row details are formatted on the first request of a view (i.e.,
+    when the row scrolls into view) and cached until the members change.
+    """
+
+    HEADERS = ["Incl. / Comp.", "Tn/TnI", "M.A.", "Diff.", "Diff. Info."]
+
+    def __init__(self, profiles, parent=None):
+        """
+        :param profiles: a ProfileTable object for the row details.
+        """
+        QtCore.QAbstractTableModel.__init__(self, parent)
+        self.profiles = profiles
+        self.members = []         # (member, diff) bitmasks in the original order
+        self.rows = []            # (member, diff) bitmasks in the displayed order
+        self.details = {}         # key=(member, diff), val=a list of 5 strs
+        self.sortColumn = -1      # -1 = original order
+        self.sortOrder = QtCore.Qt.SortOrder.AscendingOrder
+
+    def setMembers(self, members):
+        """
+        Replaces the rows with new members.
+
+        :param members: a list of tuples (member, diff) of bitmasks.
+        """
+        self.beginResetModel()
+        self.members = list(members)
+        self.details = {}
+        self.rows = self.sortedRows(self.sortColumn, self.sortOrder)
+        self.endResetModel()
+
+    def clear(self):
+        """Removes all the rows."""
+        self.setMembers([])
+
+    def member(self, row):
+        """
+        :param row: an int for the row in the displayed order.
+        :return: an int for the bitmask of the member in the row, or None
+            if there is no such row.
+        """
+        if 0 <= row < len(self.rows):
+            return self.rows[row][0]
+        return None
+
+    def rowDetails(self, pair):
+        """Returns the formatted cells of a member, formatting them on the first call."""
+        cells = self.details.get(pair)
+        if cells is None:
+            m, d = self.profiles[pair[0]], self.profiles[pair[1]]
+            memberNF = ",".join(str(pc) for pc in m["nf"])
+            memberMA = " ".join(m["matts"])
+            diffNF = ",".join(str(pc) for pc in d["nf"])
+            if d["card"] < 3:
+                diffInfo = ""
+            else:
+                diffInfo = d["summary"]
+            cells = self.details[pair] = [memberNF, m["lvl"], memberMA, diffNF, diffInfo]
+        return cells
+
+    def sortedRows(self, column, order):
+        """Returns the members sorted by the column (original order if column is -1)."""
+        if column < 0:
+            return list(self.members)
+        profiles = self.profiles
+        if column == 0:
+            def key(pair): return profiles[pair[0]]["nf"]
+        elif column == 1:
+            def key(pair): return _levelKey(profiles[pair[0]]["lvl"])
+        elif column == 2:
+            def key(pair): return profiles[pair[0]]["matts"]
+        elif column == 3:
+            def key(pair): return profiles[pair[1]]["nf"]
+        else:
+            def key(pair):
+                d = profiles[pair[1]]
+                return "" if d["card"] < 3 else d["summary"]
+        return sorted(self.members, key=key,
+                      reverse=(order == QtCore.Qt.SortOrder.DescendingOrder))
+
+    # QAbstractTableModel methods
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return self.rowDetails(self.rows[index.row()])[index.column()]
+        if role == QtCore.Qt.ItemDataRole.TextAlignmentRole:
+            return QtCore.Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def flags(self, index):
+        return QtCore.Qt.ItemFlag.ItemIsEnabled
+
+    def headerData(self, section, orientation, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if role != QtCore.Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == QtCore.Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return str(section + 1)
+
+    def sort(self, column, order=QtCore.Qt.SortOrder.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        self.sortColumn, self.sortOrder = column, order
+        self.rows = self.sortedRows(column, order)
+        self.layoutChanged.emit()
+
+
+class TargetSCMenuModel(QtCore.QAbstractListModel):
+    """
+    List model for the target SC menu: the set classes of cardinalities 3
+    to 9, with a separator row between the cardinalities. Each set-class
+    row shows its set name, followed by its inclusion count in the current
+    set if the current set has a cardinality of 3 to 9, as "SN    (count)".
+    The rows of the cardinality of the current set are disabled.
+    """
+
+    SEPARATOR = "-" * 15
+    CARDS = range(3, 10)
+
+    def __init__(self, setNames, parent=None):
+        """
+        :param setNames: a dict of card to a list of strs for the set names
+            of the cardinality in ordinal order, for the cards 3 to 9.
+        """
+        QtCore.QAbstractListModel.__init__(self, parent)
+        self.names = []    # Set name of each row (None for the separators)
+        self.cards = []    # Cardinality of each row (0 for the separators)
+        self.ordinals = []  # Index of each row in the inclusion vector of its cardinality
+        for card in self.CARDS:
+            if self.names:
+                self.names.append(None)
+                self.cards.append(0)
+                self.ordinals.append(0)
+            for i, sn in enumerate(setNames[card]):
+                self.names.append(sn)
+                self.cards.append(card)
+                self.ordinals.append(i)
+        self.counts = [None] * len(self.names)  # Inclusion count of each row (None if not shown)
+        self.enabled = [sn is not None for sn in self.names]
+        self.texts = [self.SEPARATOR if sn is None else sn for sn in self.names]
+
+    def setCounts(self, card, vectors):
+        """
+        Updates the inclusion counts and the enabled states of the rows for
+        a new current set. Only the rows whose values change are updated.
+
+        :param card: an int for the cardinality of the current set.
+        :param vectors: a dict of card to a list of ints for the inclusion
+            vector of the current set class at the card, for all the cards
+            3 to 9 but card; or None if the counts are not shown.
+        """
+        first = last = -1  # A run of changed rows
+        for row, sn in enumerate(self.names):
+            if sn is None:
+                continue
+            rowCard = self.cards[row]
+            if vectors is None or rowCard == card:
+                count = None
+            else:
+                count = vectors[rowCard][self.ordinals[row]]
+            enabled = rowCard != card
+            if count == self.counts[row] and enabled == self.enabled[row]:
+                if first >= 0:
+                    self.dataChanged.emit(self.index(first), self.index(last))
+                    first = -1
+                continue
+            self.counts[row] = count
+            self.enabled[row] = enabled
+            self.texts[row] = sn if count is None else "{0:5} ({1})".format(sn, count)
+            if first < 0:
+                first = row
+            last = row
+        if first >= 0:
+            self.dataChanged.emit(self.index(first), self.index(last))
+
+    def reset(self):
+        """Shows the set names without counts, and enables all the set-class rows."""
+        self.setCounts(0, None)
+
+    # QAbstractListModel methods
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.names)
+
+    def data(self, index, role=QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return self.texts[index.row()]
+        return None
+
+    def flags(self, index):
+        if self.enabled[index.row()]:
+            return QtCore.Qt.ItemFlag.ItemIsEnabled | QtCore.Qt.ItemFlag.ItemIsSelectable
+        return QtCore.Qt.ItemFlag.NoItemFlags
+
+
+class TextTableModel(QtCore.QAbstractTableModel):
+    """
+    Table model with a fixed number of rows and columns, for read-only
+    centered text. Each row is identified by a key (None for an empty
+    row); the texts of a row are formatted by rowTexts() on the first
+    request of a view, and cached until the key of the row changes.
+
+    flags() is not overridden, as it is called for every repainted cell:
+    the views of these models do not select cells (NoSelection).
+    """
+
+    def __init__(self, rows, headers, parent=None):
+        """
+        :param rows: an int for the number of rows.
+        :param headers: a list of strs for the column headers.
+        """
+        QtCore.QAbstractTableModel.__init__(self, parent)
+        self.headers = headers
+        self.keys = [None] * rows  # Key of each row
+        self.texts = {}            # key=row, val=a list of strs for the cells
+
+    def setRowKeys(self, keys):
+        """
+        Sets the keys of the rows from the top; the rows after them are
+        emptied. Only the rows whose keys change are updated.
+
+        :param keys: a sequence of row keys, no longer than the rows.
+        """
+        self.setRows([(key, None) for key in keys])
+
+    def setRows(self, rows):
+        """
+        Sets the rows from the top, with their texts if already formatted;
+        the rows after them are emptied. Only the rows whose keys change
+        are updated.
+
+        :param rows: a sequence of tuples (key, texts) for the rows, no
+            longer than the rows, where texts is a list of strs for the
+            cells or None to format them on demand.
+        """
+        rows = list(rows) + [(None, None)] * (len(self.keys) - len(rows))
+        first = last = -1  # A run of changed rows
+        for row, (key, texts) in enumerate(rows):
+            if key == self.keys[row]:
+                if first >= 0:
+                    self.emitRowsChanged(first, last)
+                    first = -1
+                continue
+            self.keys[row] = key
+            if texts is None:
+                self.texts.pop(row, None)
+            else:
+                self.texts[row] = texts
+            if first < 0:
+                first = row
+            last = row
+        if first >= 0:
+            self.emitRowsChanged(first, last)
+
+    def emitRowsChanged(self, first, last):
+        """Emits dataChanged for the rows first to last."""
+        self.dataChanged.emit(self.index(first, 0), self.index(last, len(self.headers) - 1))
+
+    def clear(self):
+        """Empties all the rows."""
+        self.setRowKeys([])
+
+    def rowTexts(self, key):
+        """
+        :param key: the key of a non-empty row.
+        :return: a list of strs for the cells of the row.
+        """
+        raise NotImplementedError
+
+    def text(self, row, col):
+        """Returns a str for the text of a cell, formatting its row on the first call."""
+        key = self.keys[row]
+        if key is None:
+            return ""
+        texts = self.texts.get(row)
+        if texts is None:
+            texts = self.texts[row] = self.rowTexts(key)
+        return texts[col]
+
+    # QAbstractTableModel methods
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.keys)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.headers)
+
+    def data(self, index, role=DISPLAY_ROLE):
+        if role == DISPLAY_ROLE:
+            return self.text(index.row(), index.column()) if index.isValid() else None
+        if role == ALIGNMENT_ROLE:
+            return ALIGN_CENTER
+        return None
+
+    def headerData(self, section, orientation, role=DISPLAY_ROLE):
+        if role != DISPLAY_ROLE:
+            return None
+        if orientation == QtCore.Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return str(section + 1)
+
+
+class IndexVectorModel(TextTableModel):
+    """
+    Table model for the index vector of the current set: a single row with
+    a column per index 0 to 11. The row key is a tuple of the 12 values.
+    """
+
+    HEADERS = [str(i) for i in range(12)]
+
+    def __init__(self, parent=None):
+        TextTableModel.__init__(self, 1, self.HEADERS, parent)
+
+    def setVector(self, iv):
+        """
+        Sets the index vector. Only the columns whose values change are
+        updated, as a pc change leaves many of the indices unchanged.
+
+        :param iv: a list of 12 ints for the index vector, or of empty strs.
+        """
+        prev, key = self.keys[0], tuple(iv)
+        if key == prev:
+            return
+        self.keys[0] = key
+        self.texts.pop(0, None)
+        if prev is None:
+            self.emitRowsChanged(0, 0)
+            return
+        first = -1  # A run of changed columns
+        for col in range(len(key) + 1):
+            if col < len(key) and key[col] != prev[col]:
+                if first < 0:
+                    first = col
+            elif first >= 0:
+                self.dataChanged.emit(self.index(0, first), self.index(0, col - 1))
+                first = -1
+
+    def rowTexts(self, key):
+        return [str(n) for n in key]
+
+
+class ModalComplementModel(TextTableModel):
+    """
+    Table model for the modal complements of the current set in the
+    referential collections. Each row is structured as:
+        [refCol, mcomp, SN]
+    and its key is a tuple (refCol, bitmask of the modal complement).
+    """
+
+    HEADERS = ["Col.", "Modal Comp.", "S.N."]
+
+    def __init__(self, profiles, parent=None):
+        """
+        :param profiles: a ProfileTable object for the row texts.
+        """
+        TextTableModel.__init__(self, 3, self.HEADERS, parent)
+        self.profiles = profiles
+
+    def rowTexts(self, key):
+        name, mask = key
+        profile = self.profiles[mask]
+        nf = ",".join(str(pc) for pc in profile["nf"])
+        return [name, nf, profile["sn"] if profile["card"] >= 3 else ""]
+
+
+class MSCMemberModel(TextTableModel):
+    """
+    Table model for the members of a cardinality in the modal set complex
+    (MSC) of a nexus set. Each row is structured as:
+        [SN, MA, sym, count, (Z-corr)]
+    and its key is a tuple (SC index, inclusion count) from
+    BinaryCatalog.mscMembers(). There is no Z-corr. column for the
+    trichordal members.
+
+    The catalog is static, so the rows of a nexus set are formatted on
+    its first selection and kept: selecting it again swaps in the kept
+    rows without formatting.
+    """
+
+    HEADERS = ["S.N.", "M.A.", "Sym.", "#", "Z-corr."]
+    ROWS = 7
+
+    def __init__(self, catalog, card, parent=None):
+        """
+        :param catalog: a BinaryCatalog object for the row texts.
+        :param card: an int for the cardinality of the members (3, 4 or 6).
+        """
+        TextTableModel.__init__(self, self.ROWS, self.HEADERS if card != 3 else self.HEADERS[:4], parent)
+        self.card = card
+        self.catalog = catalog
+        self.nexusRows = {}  # key=nexus SC index, val=a list of tuples (key, texts) for the rows
+
+    def setCatalog(self, catalog):
+        """Sets the catalog, and discards the formatted rows."""
+        self.catalog = catalog
+        self.nexusRows = {}
+
+    def setNexus(self, nexus):
+        """
+        Shows the members of a nexus set.
+
+        :param nexus: an int for the index of the nexus SC.
+        """
+        rows = self.nexusRows.get(nexus)
+        if rows is None:
+            rows = self.nexusRows[nexus] = [(key, self.rowTexts(key))
+                                            for key in self.catalog.mscMembers(nexus, self.card)]
+        self.setRows(rows)
+
+    def rowTexts(self, key):
+        member, inclusion = key
+        cat = self.catalog
+        texts = [cat.name(member), " ".join(cat.modalAttributes(member)),
+                 ", ".join(str(i) for i in cat.symmetry(member)), str(inclusion)]
+        if len(self.headers) > 4:
+            zcorr = cat.zCorrespondent(member)
+            texts.append("" if zcorr < 0 else cat.name(zcorr))
+        return texts
+
+
+def _levelKey(lvl):
+    """Sort key for a transformation level str: Tn levels before TnI levels."""
+    if lvl == "":
+        return (2, 0)
+    elif lvl.endswith("I"):
+        return (1, int(lvl[1:-1]))
+    else:
+        return (0, int(lvl[1:]))
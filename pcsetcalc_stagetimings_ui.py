@@ -0,0 +1,172 @@
+# Form implementation generated from reading ui file 'PcsetCalc_StageTimings.ui'
+#
+# Created by: PyQt6 UI code generator 6.5.2
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic6 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from PyQt6 import QtCore, QtGui, QtWidgets
+import pcsetcalc_resources_rc
+
+class Ui_StageTimingsDialog(object):
+    def setupUi(self, StageTimingsDialog):
+        StageTimingsDialog.setObjectName("StageTimingsDialog")
+        StageTimingsDialog.resize(560, 520)
+        StageTimingsDialog.setStyleSheet("/* Global setting */\n"
+"QWidget {\n"
+"    font: 11pt \"Verdana\";\n"
+"    color: rgb(189, 189, 189); /* 400 */\n"
+"    background-color: rgb(33, 33, 33); /* 900 */\n"
+"    }\n"
+"\n"
+"/*  Dialog Button Box */\n"
+" QDialogButtonBox {\n"
+"    button-layout: 1; \n"
+"    min-width: 200px;\n"
+"    }\n"
+"QDialogButtonBox QPushButton {\n"
+"    border: none;\n"
+"    min-width: 40px;\n"
+"    min-height: 20px;\n"
+"    padding-left: 12px;\n"
+"    padding-top: 2px;\n"
+"    padding-right: 12px;\n"
+"    padding-bottom: 5px;\n"
+"    margin: 2px;\n"
+"    background-color: rgb(66, 66, 66); /* 800 */\n"
+"    }\n"
+"QDialogButtonBox QPushButton:pressed, QPushButton:checked {\n"
+"    color: rgb(224, 224, 224); /* 300 */\n"
+"    background-color: rgb(97, 97, 97); /* 700 */\n"
+"    }\n"
+"\n"
+"/* Combo Box { button-layout: 2 }*/\n"
+"/* Push Button */\n"
+"QPushButton {\n"
+"    border: none;\n"
+"    min-height: 20px;\n"
+"    padding-left: 12px;\n"
+"    padding-top: 2px;\n"
+"    padding-right: 12px;\n"
+"    padding-bottom: 5px;\n"
+"    background-color: rgb(66, 66, 66); /* 800 */\n"
+"    }\n"
+"QPushButton:pressed {\n"
+"    color: rgb(224, 224, 224); /* 300 */\n"
+"    background-color: rgb(97, 97, 97); /* 700 */\n"
+"    }\n"
+"\n"
+"/* Table */\n"
+"QTableWidget {\n"
+"    border: none;\n"
+"    font: 10pt \"Verdana\";\n"
+"    gridline-color: rgb(66, 66, 66); /* 800 */\n"
+"    }\n"
+"QHeaderView::section {\n"
+"    border: none;\n"
+"    color: rgb(158, 158, 158); /* 500 */\n"
+"    background-color: rgb(52, 52, 52); /* 800+ */\n"
+"    padding: 2px;\n"
+"    }\n"
+"\n"
+"QComboBox {\n"
+"    border: none;\n"
+"    color: rgb(189, 189, 189); /* 400 */\n"
+"    background-color: rgb(66, 66, 66); /* 800 */\n"
+"    }\n"
+"QComboBox::drop-down {\n"
+"    border: none;\n"
+"    background-color: rgb(97, 97, 97); /* 700 */\n"
+"    width: 15px;\n"
+"    }\n"
+"QComboBox::down-arrow {\n"
+"    image: url(:/Icons/Images/DownArrow_Silver_01.png); \n"
+"    width: 10px;\n"
+"    height: 10px;\n"
+"    }\n"
+"QComboBox QAbstractItemView {\n"
+"    border: none;\n"
+"    background-color: rgb(52, 52, 52); /* 800+ */\n"
+"    min-width: 100px;\n"
+"    padding: 5px;\n"
+"}")
+        self.verticalLayout = QtWidgets.QVBoxLayout(StageTimingsDialog)
+        self.verticalLayout.setObjectName("verticalLayout")
+        self.checkBoxRecord = QtWidgets.QCheckBox(parent=StageTimingsDialog)
+        self.checkBoxRecord.setObjectName("checkBoxRecord")
+        self.verticalLayout.addWidget(self.checkBoxRecord)
+        self.checkBoxLatency = QtWidgets.QCheckBox(parent=StageTimingsDialog)
+        self.checkBoxLatency.setObjectName("checkBoxLatency")
+        self.verticalLayout.addWidget(self.checkBoxLatency)
+        self.tableStages = QtWidgets.QTableWidget(parent=StageTimingsDialog)
+        self.tableStages.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.tableStages.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.NoSelection)
+        self.tableStages.setObjectName("tableStages")
+        self.tableStages.setColumnCount(6)
+        self.tableStages.setRowCount(0)
+        item = QtWidgets.QTableWidgetItem()
+        self.tableStages.setHorizontalHeaderItem(0, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.tableStages.setHorizontalHeaderItem(1, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.tableStages.setHorizontalHeaderItem(2, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.tableStages.setHorizontalHeaderItem(3, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.tableStages.setHorizontalHeaderItem(4, item)
+        item = QtWidgets.QTableWidgetItem()
+        self.tableStages.setHorizontalHeaderItem(5, item)
+        self.tableStages.horizontalHeader().setStretchLastSection(True)
+        self.tableStages.verticalHeader().setVisible(False)
+        self.verticalLayout.addWidget(self.tableStages)
+        self.labelUpdates = QtWidgets.QLabel(parent=StageTimingsDialog)
+        self.labelUpdates.setObjectName("labelUpdates")
+        self.verticalLayout.addWidget(self.labelUpdates)
+        self.labelMIDIInput = QtWidgets.QLabel(parent=StageTimingsDialog)
+        self.labelMIDIInput.setObjectName("labelMIDIInput")
+        self.verticalLayout.addWidget(self.labelMIDIInput)
+        self.horizontalLayout = QtWidgets.QHBoxLayout()
+        self.horizontalLayout.setObjectName("horizontalLayout")
+        self.btnReset = QtWidgets.QPushButton(parent=StageTimingsDialog)
+        self.btnReset.setObjectName("btnReset")
+        self.horizontalLayout.addWidget(self.btnReset)
+        self.btnExport = QtWidgets.QPushButton(parent=StageTimingsDialog)
+        self.btnExport.setObjectName("btnExport")
+        self.horizontalLayout.addWidget(self.btnExport)
+        self.btnExportLatency = QtWidgets.QPushButton(parent=StageTimingsDialog)
+        self.btnExportLatency.setObjectName("btnExportLatency")
+        self.horizontalLayout.addWidget(self.btnExportLatency)
+        spacerItem = QtWidgets.QSpacerItem(40, 20, QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Minimum)
+        self.horizontalLayout.addItem(spacerItem)
+        self.btnClose = QtWidgets.QPushButton(parent=StageTimingsDialog)
+        self.btnClose.setObjectName("btnClose")
+        self.horizontalLayout.addWidget(self.btnClose)
+        self.verticalLayout.addLayout(self.horizontalLayout)
+
+        self.retranslateUi(StageTimingsDialog)
+        QtCore.QMetaObject.connectSlotsByName(StageTimingsDialog)
+
+    def retranslateUi(self, StageTimingsDialog):
+        _translate = QtCore.QCoreApplication.translate
+        StageTimingsDialog.setWindowTitle(_translate("StageTimingsDialog", "Stage Timings"))
+        self.checkBoxRecord.setText(_translate("StageTimingsDialog", "Record stage timings"))
+        self.checkBoxLatency.setText(_translate("StageTimingsDialog", "Trace MIDI-to-display latency"))
+        item = self.tableStages.horizontalHeaderItem(0)
+        item.setText(_translate("StageTimingsDialog", "Stage"))
+        item = self.tableStages.horizontalHeaderItem(1)
+        item.setText(_translate("StageTimingsDialog", "Count"))
+        item = self.tableStages.horizontalHeaderItem(2)
+        item.setText(_translate("StageTimingsDialog", "p50 (ms)"))
+        item = self.tableStages.horizontalHeaderItem(3)
+        item.setText(_translate("StageTimingsDialog", "p90 (ms)"))
+        item = self.tableStages.horizontalHeaderItem(4)
+        item.setText(_translate("StageTimingsDialog", "p99 (ms)"))
+        item = self.tableStages.horizontalHeaderItem(5)
+        item.setText(_translate("StageTimingsDialog", "Max (ms)"))
+        self.labelUpdates.setText(_translate("StageTimingsDialog", "No pc input"))
+        self.labelMIDIInput.setText(_translate("StageTimingsDialog", "No MIDI input port"))
+        self.btnReset.setText(_translate("StageTimingsDialog", "Reset"))
+        self.btnExport.setText(_translate("StageTimingsDialog", "Export Chrome Trace..."))
+        self.btnExportLatency.setText(_translate("StageTimingsDialog", "Export Latency Histogram..."))
+        self.btnClose.setText(_translate("StageTimingsDialog", "Close"))
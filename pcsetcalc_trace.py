@@ -0,0 +1,282 @@
+# pcsetcalc_trace.py
+
+"""
+Low-overhead timing of the compute and render stages of MainWindow.
+
+A StageTimer records the duration of each stage (e.g., "profile.lookup"
+or "render.showTargetSCMenu") in a rolling window per stage, for the
+percentiles in the stage timings panel, and keeps the most recent stages
+as trace events, which can be exported as Chrome trace JSON and opened in
+chrome://tracing or https://ui.perfetto.dev.
+
+The timer does nothing unless it is enabled: the instrumented code checks
+StageTimer.enabled and calls the stages without timing them otherwise.
+
+A LatencyTracer follows MIDI note messages from the input buffer to the
+repaint of the window, and records the latency of each step as a stage of
+a StageTimer, with a histogram of the end-to-end latency.
+"""
+
+import os
+import json
+import bisect
+import threading
+import time
+from collections import deque
+
+WINDOW_SIZE = 1000       # Durations kept per stage for the percentiles
+MAX_TRACE_EVENTS = 200000  # Trace events kept for the export
+MAX_PENDING_MESSAGES = 1000  # Traced messages kept until MainWindow receives them
+PERCENTILES = (50, 90, 99)
+LATENCY_STAGES = ["latency.buffer", "latency.dispatch", "latency.update", "latency.paint", "latency.total"]
+LATENCY_BUCKETS = (1, 2, 3, 4, 5, 7.5, 10, 15, 20, 30, 50, 100)  # Upper bounds (ms) of the histogram buckets
+
+
+def percentile(values, q):
+    """
+    :param values: a sequence of numbers.
+    :param q: a number between 0 and 100.
+    :return: a float for the q-th percentile (linear interpolation), or
+        0.0 if values is empty.
+    """
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    pos = (len(ordered) - 1) * q / 100
+    lower = int(pos)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (pos - lower)
+
+
+class StageTimer:
+    """
+    Records the durations of named stages.
+
+    Stages are recorded with the start and end times from
+    time.perf_counter_ns(), either by the caller:
+
+        start = time.perf_counter_ns()
+        ...
+        timer.record("profile.lookup", "compute", start, time.perf_counter_ns())
+
+    or with timer.call("render.showICV", "render", self.showICV).
+    """
+
+    def __init__(self, enabled=False, windowSize=WINDOW_SIZE, maxEvents=MAX_TRACE_EVENTS):
+        """
+        :param enabled: a bool for whether the stages are recorded.
+        :param windowSize: an int for the durations kept per stage.
+        :param maxEvents: an int for the trace events kept for the export.
+        """
+        self.enabled = enabled
+        self.windowSize = windowSize
+        self.durations = {}  # key=stage, val=deque of the recent durations (ns)
+        self.counts = {}     # key=stage, val=number of the recorded durations
+        self.events = deque(maxlen=maxEvents)  # (stage, category, start (ns), duration (ns), thread id)
+        self.origin = time.perf_counter_ns()   # Time 0 of the trace
+
+    def record(self, stage, category, start, end, tid=None):
+        """
+        Records a stage.
+
+        :param stage: a str for the stage name.
+        :param category: a str for the stage category (e.g., "compute" or "render").
+        :param start: an int for the start time from time.perf_counter_ns().
+        :param end: an int for the end time from time.perf_counter_ns().
+        :param tid: an int for the id of the thread the stage ran in, or
+            None for the current thread.
+        """
+        durations = self.durations.get(stage)
+        if durations is None:
+            durations = self.durations[stage] = deque(maxlen=self.windowSize)
+            self.counts[stage] = 0
+        durations.append(end - start)
+        self.counts[stage] += 1
+        self.events.append((stage, category, start, end - start,
+                            threading.get_ident() if tid is None else tid))
+
+    def call(self, stage, category, func, *args):
+        """
+        Calls func(*args), and records its duration as a stage if the timer
+        is enabled.
+
+        :return: the return value of func.
+        """
+        if not self.enabled:
+            return func(*args)
+        start = time.perf_counter_ns()
+        try:
+            return func(*args)
+        finally:
+            self.record(stage, category, start, time.perf_counter_ns())
+
+    def reset(self):
+        """Discards all the recorded stages."""
+        self.durations = {}
+        self.counts = {}
+        self.events.clear()
+        self.origin = time.perf_counter_ns()
+
+    def stats(self):
+        """
+        :return: a list of tuples (stage, count, p50, p90, p99, max) for the
+            recorded stages in the order of their first record, with the
+            percentiles and the max of the rolling window in ms.
+        """
+        rows = []
+        for stage, durations in list(self.durations.items()):
+            values = [d / 1e6 for d in durations]
+            rows.append((stage, self.counts[stage])
+                        + tuple(percentile(values, q) for q in PERCENTILES)
+                        + (max(values) if values else 0.0,))
+        return rows
+
+    def chromeTrace(self):
+        """
+        :return: a dict in the Chrome trace event format, with a complete
+            event ("ph": "X") per recorded stage.
+        """
+        pid = os.getpid()
+        traceEvents = [{"name": stage, "cat": category, "ph": "X",
+                        "ts": (start - self.origin) / 1000, "dur": duration / 1000,
+                        "pid": pid, "tid": tid}
+                       for stage, category, start, duration, tid in list(self.events)]
+        return {"traceEvents": traceEvents, "displayTimeUnit": "ms"}
+
+    def exportChromeTrace(self, path):
+        """
+        Writes the trace events to a Chrome trace JSON file.
+
+        :param path: a str for the file path.
+        :return: an int for the number of the exported events.
+        """
+        trace = self.chromeTrace()
+        with open(path, "w") as f:
+            json.dump(trace, f, separators=(",", ":"))
+        return len(trace["traceEvents"])
+
+
+class LatencyTracer:
+    """
+    Traces the MIDI-to-display latency of note messages.
+
+    The timestamps are taken along the input path:
+
+        arrival     the message arrives in the input buffer (known for the
+                    synthetic source only; the poll time otherwise)
+        poll        WorkerMIDI polls the message from the buffer (in the
+                    callback mode, the message is delivered to WorkerMIDI)
+        received    MainWindow.midiInput() receives the pc change signal
+        updated     the profile and the display widgets are updated
+        painted     the window has been repainted
+
+    and recorded as the stages latency.buffer (arrival to poll),
+    latency.dispatch (poll to received, across the threads),
+    latency.update (received to updated), latency.paint (updated to
+    painted) and latency.total (arrival to painted). Only the messages that
+    change a pc state reach MainWindow, so only these are traced.
+    """
+
+    def __init__(self, timer, enabled=False):
+        """
+        :param timer: a StageTimer object to record the stages in.
+        :param enabled: a bool for whether the messages are traced.
+        """
+        self.timer = timer
+        self.enabled = enabled
+        # (pc, state, arrival, poll, worker thread id) from the MIDI worker thread
+        self.pending = deque(maxlen=MAX_PENDING_MESSAGES)
+        self.pendingLock = threading.Lock()  # Guards pending, appended to and evicted by the worker thread
+        self.updated = []       # (arrival, poll, received, updated, worker thread id) waiting for the repaint
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)  # The last bucket is for the latencies over 100 ms
+        self.count = 0
+
+    def setEnabled(self, state):
+        """Starts/stops tracing, and discards the messages in flight."""
+        self.enabled = state
+        with self.pendingLock:
+            self.pending.clear()
+        self.updated = []
+
+    def reset(self):
+        """Discards the histogram and the messages in flight."""
+        self.setEnabled(self.enabled)
+        self.histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.count = 0
+
+    def emitted(self, pc, state, arrival, poll):
+        """
+        Called by the MIDI worker thread before it emits a pc change.
+
+        :param pc: an int for the pc.
+        :param state: a bool for the pc state.
+        :param arrival: an int for the arrival time (ns) of the message.
+        :param poll: an int for the poll time (ns) of the message.
+        """
+        with self.pendingLock:
+            self.pending.append((pc, state, arrival, poll, threading.get_ident()))
+
+    def received(self, pc, state):
+        """
+        Called by the main thread when it receives a pc change.
+
+        :return: a tuple of the timestamps of the pc change for updated(),
+            or None if it was not traced.
+        """
+        pending = self.pending
+        # The pc changes are received in the order they are emitted, so the
+        # changes emitted before this one that are still pending were never
+        # received (e.g., emitted before the signal was connected)
+        with self.pendingLock:
+            for i in range(len(pending)):
+                if pending[i][:2] == (pc, state):
+                    for _ in range(i):
+                        pending.popleft()
+                    _, _, arrival, poll, tid = pending.popleft()
+                    return arrival, poll, time.perf_counter_ns(), tid
+        return None
+
+    def inputDone(self, times):
+        """
+        Called by the main thread when the display has been updated for a
+        pc change. The latency is recorded at the next repaint.
+
+        :param times: a tuple returned by received().
+        """
+        arrival, poll, received, tid = times
+        self.updated.append((arrival, poll, received, time.perf_counter_ns(), tid))
+
+    def painted(self):
+        """Called by the main thread when the window has been repainted."""
+        now = time.perf_counter_ns()
+        timer = self.timer
+        for arrival, poll, received, updated, tid in self.updated:
+            timer.record("latency.buffer", "latency", arrival, poll, tid)
+            timer.record("latency.dispatch", "latency", poll, received)
+            timer.record("latency.update", "latency", received, updated)
+            timer.record("latency.paint", "latency", updated, now)
+            timer.record("latency.total", "latency", arrival, now)
+            self.histogram[bisect.bisect_left(LATENCY_BUCKETS, (now - arrival) / 1e6)] += 1
+            self.count += 1
+        self.updated = []
+
+    def report(self):
+        """
+        :return: a dict with the keys "count" (the number of traced
+            messages), "histogram" (a list of dicts with the upper bound
+            "le" in ms, null for the last bucket, and the "count" of each
+            bucket) and "stages" (a dict of the rolling percentiles and max
+            in ms per latency stage).
+        """
+        bounds = list(LATENCY_BUCKETS) + [None]
+        stages = {row[0]: dict(zip(["count", "p50", "p90", "p99", "max"], row[1:]))
+                  for row in self.timer.stats() if row[0] in LATENCY_STAGES}
+        return {"count": self.count,
+                "histogram": [{"le": le, "count": n} for le, n in zip(bounds, self.histogram)],
+                "stages": stages}
+
+    def writeReport(self, path):
+        """Writes report() to a JSON file."""
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
+            f.write("\n")
@@ -0,0 +1,166 @@
+# pcsetcalc_vectorized.py
+
+"""
+NumPy-vectorized set profile calculations for large batches of pcsets.
+
+The functions of this module take a batch of N pcsets in either of two
+forms and return NumPy arrays with one row per set:
+
+    (N,) int array      bitmasks of the sets, where bit n is set when pc n
+                        is a member (see pcsetcalc_engine.toMask())
+    (N, 12) bool array  membership matrix, where [i, n] is True when pc n
+                        is a member of set i
+
+There are only 4096 pcsets, so the ICV and the index vector of every set
+are computed once with array operations, and a batch is evaluated by
+indexing these tables with the bitmasks. No Python-level loop runs per set.
+
+The vectors are returned for every set regardless of its cardinality.
+The per-set functions in pcsetcalc_engine give empty results for sets
+outside cardinalities 2 to 9; validVectors() tells which rows are in range.
+"""
+
+import numpy as np
+
+VECTOR_DTYPE = np.int16  # dtype of the returned vectors and cardinalities
+MASK_DTYPE = np.uint16   # dtype of the returned bitmasks
+FULL_MASK = 0xFFF        # Bitmask of the aggregate
+
+_PC_BITS = 1 << np.arange(12, dtype=MASK_DTYPE)
+_cardTable = None  # (4096,) cardinalities of all the pcsets
+_icvTable = None   # (4096, 6) ICVs of all the pcsets
+_ivTable = None    # (4096, 12) index vectors of all the pcsets
+
+
+def toMasks(sets):
+    """
+    :param sets: an (N,) int array of bitmasks or an (N, 12) bool array of
+        pc memberships.
+    :return: an (N,) array of the bitmasks of the sets.
+    :raise ValueError: if the input is not in either form.
+    """
+    arr = np.asarray(sets)
+    if arr.ndim == 2:
+        if arr.shape[1] != 12:
+            raise ValueError("A membership matrix needs 12 columns, got {}".format(arr.shape[1]))
+        return (arr.astype(bool) @ _PC_BITS.astype(np.int64)).astype(MASK_DTYPE)
+    elif arr.ndim == 1:
+        if arr.size and not np.issubdtype(arr.dtype, np.integer):
+            raise ValueError("Bitmasks must be ints, got {}".format(arr.dtype))
+        if arr.size and (arr.min() < 0 or arr.max() > FULL_MASK):
+            raise ValueError("Bitmasks must be between 0 and {}".format(FULL_MASK))
+        return arr.astype(MASK_DTYPE)
+    else:
+        raise ValueError("Expected an (N,) or (N, 12) array, got shape {}".format(arr.shape))
+
+
+def toMatrix(sets):
+    """
+    :param sets: an (N,) int array of bitmasks or an (N, 12) bool array of
+        pc memberships.
+    :return: an (N, 12) bool array of the pc memberships of the sets.
+    """
+    masks = toMasks(sets)
+    return (masks[:, None] & _PC_BITS) != 0
+
+
+def cardinalities(sets):
+    """
+    :param sets: an (N,) int array of bitmasks or an (N, 12) bool array of
+        pc memberships.
+    :return: an (N,) array of the cardinalities of the sets.
+    """
+    return _tables()[0][toMasks(sets)]
+
+
+def complements(sets):
+    """
+    :param sets: an (N,) int array of bitmasks or an (N, 12) bool array of
+        pc memberships.
+    :return: an (N,) array of the bitmasks of the literal complements.
+    """
+    return toMasks(sets) ^ MASK_DTYPE(FULL_MASK)
+
+
+def intervalClassVectors(sets):
+    """
+    :param sets: an (N,) int array of bitmasks or an (N, 12) bool array of
+        pc memberships.
+    :return: an (N, 6) array of the ICVs of the sets.
+    """
+    return _tables()[1][toMasks(sets)]
+
+
+def indexVectors(sets):
+    """
+    :param sets: an (N,) int array of bitmasks or an (N, 12) bool array of
+        pc memberships.
+    :return: an (N, 12) array of the index vectors of the sets.
+    """
+    return _tables()[2][toMasks(sets)]
+
+
+def validVectors(sets):
+    """
+    :param sets: an (N,) int array of bitmasks or an (N, 12) bool array of
+        pc memberships.
+    :return: an (N,) bool array, True for the sets whose ICV and index
+        vector are shown by the application (cardinalities 2 to 9).
+    """
+    card = cardinalities(sets)
+    return (2 <= card) & (card <= 9)
+
+
+def profileVectors(sets):
+    """
+    Computes all the vector fields of a batch at once.
+
+    :param sets: an (N,) int array of bitmasks or an (N, 12) bool array of
+        pc memberships.
+    :return: a dict of arrays with the keys:
+        mask    (N,) bitmasks of the sets
+        card    (N,) cardinalities
+        comp    (N,) bitmasks of the literal complements
+        icv     (N, 6) ICVs
+        iv      (N, 12) index vectors
+        valid   (N,) True for the cardinalities 2 to 9
+    """
+    masks = toMasks(sets)
+    cards, icvs, ivs = _tables()
+    card = cards[masks]
+    return {
+        "mask": masks,
+        "card": card,
+        "comp": masks ^ MASK_DTYPE(FULL_MASK),
+        "icv": icvs[masks],
+        "iv": ivs[masks],
+        "valid": (2 <= card) & (card <= 9),
+    }
+
+
+# Private functions -----------------------------------------------------------
+
+def _allSets():
+    """Returns the (4096, 12) membership matrix of all the pcsets."""
+    masks = np.arange(FULL_MASK + 1, dtype=MASK_DTYPE)
+    return (masks[:, None] & _PC_BITS) != 0
+
+
+def _tables():
+    """
+    Returns the cardinality, ICV and index vector tables, computing them
+    on the first call.
+    """
+    global _cardTable, _icvTable, _ivTable
+    if _icvTable is None:
+        pcs = _allSets().astype(VECTOR_DTYPE)
+        cards = pcs.sum(axis=1, dtype=VECTOR_DTYPE)
+        # ICV: count the pc pairs (p, p+i) for each ic i; ic 6 pairs are counted twice
+        icvs = np.stack([(pcs * np.roll(pcs, -i, axis=1)).sum(axis=1) for i in range(1, 7)],
+                        axis=1).astype(VECTOR_DTYPE)
+        icvs[:, 5] //= 2
+        # Index vector: iv[k] counts the ordered pc pairs (p, q) with p + q = k
+        sums = (np.arange(12)[:, None] - np.arange(12)[None, :]) % 12  # sums[k, p] = k - p
+        ivs = (pcs[:, None, :] * pcs[:, sums]).sum(axis=2).astype(VECTOR_DTYPE)
+        _cardTable, _icvTable, _ivTable = cards, icvs, ivs
+    return _cardTable, _icvTable, _ivTable